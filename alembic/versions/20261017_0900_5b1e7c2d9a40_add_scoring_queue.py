@@ -0,0 +1,46 @@
+"""Add scoring queue
+
+Revision ID: 5b1e7c2d9a40
+Revises: 4335279faa7c
+Create Date: 2026-10-17 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c2d9a40'
+down_revision: Union[str, None] = '4335279faa7c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('applications', sa.Column('score_status', sa.String(), server_default='scored', nullable=True))
+    op.create_table('scoring_tasks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('run_after', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_scoring_tasks_id'), 'scoring_tasks', ['id'], unique=False)
+    op.create_index(op.f('ix_scoring_tasks_application_id'), 'scoring_tasks', ['application_id'], unique=False)
+    op.create_index('ix_scoring_tasks_status_run_after', 'scoring_tasks', ['status', 'run_after'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scoring_tasks_status_run_after', table_name='scoring_tasks')
+    op.drop_index(op.f('ix_scoring_tasks_application_id'), table_name='scoring_tasks')
+    op.drop_index(op.f('ix_scoring_tasks_id'), table_name='scoring_tasks')
+    op.drop_table('scoring_tasks')
+    op.drop_column('applications', 'score_status')
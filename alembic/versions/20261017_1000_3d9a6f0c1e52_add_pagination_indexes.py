@@ -0,0 +1,36 @@
+"""Add keyset pagination indexes
+
+Revision ID: 3d9a6f0c1e52
+Revises: 8c3f1a6e2b71
+Create Date: 2026-10-17 10:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9a6f0c1e52'
+down_revision: Union[str, None] = '8c3f1a6e2b71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index('ix_job_postings_created_at_id', 'job_postings', ['created_at', 'id'], unique=False)
+    op.create_index('ix_job_postings_employer_id_created_at_id', 'job_postings', ['employer_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_job_postings_is_active_created_at_id', 'job_postings', ['is_active', 'created_at', 'id'], unique=False)
+    op.create_index('ix_applications_job_id_created_at_id', 'applications', ['job_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_applications_candidate_id_created_at_id', 'applications', ['candidate_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_candidate_id_created_at_id', table_name='applications')
+    op.drop_index('ix_applications_job_id_created_at_id', table_name='applications')
+    op.drop_index('ix_job_postings_is_active_created_at_id', table_name='job_postings')
+    op.drop_index('ix_job_postings_employer_id_created_at_id', table_name='job_postings')
+    op.drop_index('ix_job_postings_created_at_id', table_name='job_postings')
+    op.drop_index('ix_users_created_at_id', table_name='users')
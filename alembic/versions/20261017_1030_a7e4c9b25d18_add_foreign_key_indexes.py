@@ -0,0 +1,89 @@
+"""Add foreign key indexes and one application per candidate per job
+
+Revision ID: a7e4c9b25d18
+Revises: 3d9a6f0c1e52
+Create Date: 2026-10-17 10:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e4c9b25d18'
+down_revision: Union[str, None] = '3d9a6f0c1e52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # users.is_admin, blog_posts and contract_templates were added to the
+    # models without migrations; databases created with init_db already
+    # have them, so only create what is missing.
+    inspector = sa.inspect(op.get_bind())
+    tables = inspector.get_table_names()
+    template_indexes = (
+        [index['name'] for index in inspector.get_indexes('contract_templates')]
+        if 'contract_templates' in tables else []
+    )
+    if 'is_admin' not in [column['name'] for column in inspector.get_columns('users')]:
+        op.add_column('users', sa.Column('is_admin', sa.Boolean(), nullable=True))
+    if 'blog_posts' not in tables:
+        op.create_table('blog_posts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('author_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.Text(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('image_url', sa.Text(), nullable=True),
+        sa.Column('created_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('published_date', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['author_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_blog_posts_id'), 'blog_posts', ['id'], unique=False)
+    if 'contract_templates' not in tables:
+        op.create_table('contract_templates',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('contract_title', sa.Text(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('author_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['author_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_contract_templates_id'), 'contract_templates', ['id'], unique=False)
+    if 'ix_contract_templates_created_at_id' not in template_indexes:
+        op.create_index('ix_contract_templates_created_at_id', 'contract_templates', ['created_at', 'id'], unique=False)
+
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT COUNT(*) FROM (SELECT job_id, candidate_id FROM applications "
+        "GROUP BY job_id, candidate_id HAVING COUNT(*) > 1) AS duplicates"
+    )).scalar()
+    if duplicates:
+        raise RuntimeError(
+            f"{duplicates} (job_id, candidate_id) pairs have more than one application; "
+            "resolve them before adding uq_applications_job_id_candidate_id"
+        )
+    # Batch mode rebuilds the table on SQLite, which cannot ALTER constraints
+    with op.batch_alter_table('applications') as batch_op:
+        batch_op.create_unique_constraint('uq_applications_job_id_candidate_id', ['job_id', 'candidate_id'])
+
+    op.create_index(op.f('ix_candidates_user_id'), 'candidates', ['user_id'], unique=False)
+    op.create_index(op.f('ix_contracts_application_id'), 'contracts', ['application_id'], unique=False)
+    op.create_index(op.f('ix_blog_posts_author_id'), 'blog_posts', ['author_id'], unique=False)
+    op.create_index(op.f('ix_contract_templates_author_id'), 'contract_templates', ['author_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contract_templates_author_id'), table_name='contract_templates')
+    op.drop_index(op.f('ix_blog_posts_author_id'), table_name='blog_posts')
+    op.drop_index(op.f('ix_contracts_application_id'), table_name='contracts')
+    op.drop_index(op.f('ix_candidates_user_id'), table_name='candidates')
+    with op.batch_alter_table('applications') as batch_op:
+        batch_op.drop_constraint('uq_applications_job_id_candidate_id', type_='unique')
+    op.drop_index('ix_contract_templates_created_at_id', table_name='contract_templates')
+    # blog_posts, contract_templates and users.is_admin may predate this
+    # migration, so they are left in place.
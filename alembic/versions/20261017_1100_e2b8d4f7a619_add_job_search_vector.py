@@ -0,0 +1,75 @@
+"""Add full-text search vector to job postings
+
+Revision ID: e2b8d4f7a619
+Revises: a7e4c9b25d18
+Create Date: 2026-10-17 11:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b8d4f7a619'
+down_revision: Union[str, None] = 'a7e4c9b25d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Postgres keeps a generated tsvector column with a GIN index; SQLite an
+# external-content FTS5 table kept in sync by triggers (see JOB_SEARCH_DDL
+# in app/models/models.py, which builds the same objects for create_all).
+SQLITE_UPGRADE = [
+    """CREATE VIRTUAL TABLE job_postings_fts USING fts5(
+        title, requirements, description, content='job_postings', content_rowid='id'
+    )""",
+    """CREATE TRIGGER job_postings_fts_ai AFTER INSERT ON job_postings BEGIN
+        INSERT INTO job_postings_fts (rowid, title, requirements, description)
+        VALUES (new.id, new.title, new.requirements, new.description);
+    END""",
+    """CREATE TRIGGER job_postings_fts_ad AFTER DELETE ON job_postings BEGIN
+        INSERT INTO job_postings_fts (job_postings_fts, rowid, title, requirements, description)
+        VALUES ('delete', old.id, old.title, old.requirements, old.description);
+    END""",
+    """CREATE TRIGGER job_postings_fts_au AFTER UPDATE ON job_postings BEGIN
+        INSERT INTO job_postings_fts (job_postings_fts, rowid, title, requirements, description)
+        VALUES ('delete', old.id, old.title, old.requirements, old.description);
+        INSERT INTO job_postings_fts (rowid, title, requirements, description)
+        VALUES (new.id, new.title, new.requirements, new.description);
+    END""",
+    # Index the rows that already exist
+    "INSERT INTO job_postings_fts (job_postings_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS job_postings_fts_au",
+    "DROP TRIGGER IF EXISTS job_postings_fts_ad",
+    "DROP TRIGGER IF EXISTS job_postings_fts_ai",
+    "DROP TABLE IF EXISTS job_postings_fts",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("""ALTER TABLE job_postings ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(requirements::text, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        ) STORED""")
+        op.create_index('ix_job_postings_search_vector', 'job_postings', ['search_vector'], unique=False, postgresql_using='gin')
+    elif dialect == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_job_postings_search_vector', table_name='job_postings')
+        op.drop_column('job_postings', 'search_vector')
+    elif dialect == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
@@ -0,0 +1,48 @@
+"""Add rescore runs
+
+Revision ID: 6f2c8b1d4e97
+Revises: e2b8d4f7a619
+Create Date: 2026-10-17 11:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f2c8b1d4e97'
+down_revision: Union[str, None] = 'e2b8d4f7a619'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('rescore_runs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('scored', sa.Integer(), nullable=False),
+    sa.Column('last_application_id', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['job_postings.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_rescore_runs_id'), 'rescore_runs', ['id'], unique=False)
+    op.create_index('ix_rescore_runs_job_id_id', 'rescore_runs', ['job_id', 'id'], unique=False)
+    op.create_index('ix_rescore_runs_status', 'rescore_runs', ['status'], unique=False)
+    op.create_index('ix_applications_job_id_id', 'applications', ['job_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_job_id_id', table_name='applications')
+    op.drop_index('ix_rescore_runs_status', table_name='rescore_runs')
+    op.drop_index('ix_rescore_runs_job_id_id', table_name='rescore_runs')
+    op.drop_index(op.f('ix_rescore_runs_id'), table_name='rescore_runs')
+    op.drop_table('rescore_runs')
@@ -0,0 +1,31 @@
+"""Add application score index
+
+Revision ID: 3a9d5e7c1b24
+Revises: 6f2c8b1d4e97
+Create Date: 2026-10-17 12:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a9d5e7c1b24'
+down_revision: Union[str, None] = '6f2c8b1d4e97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_applications_job_id_ai_match_score_id',
+        'applications',
+        ['job_id', sa.text('ai_match_score DESC'), 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_job_id_ai_match_score_id', table_name='applications')
@@ -0,0 +1,28 @@
+"""Add updated_at to blog posts and contract templates
+
+Revision ID: 8c4f2a6e9d53
+Revises: 3a9d5e7c1b24
+Create Date: 2026-10-17 12:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4f2a6e9d53'
+down_revision: Union[str, None] = '3a9d5e7c1b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('blog_posts', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('contract_templates', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('contract_templates', 'updated_at')
+    op.drop_column('blog_posts', 'updated_at')
@@ -0,0 +1,26 @@
+"""Add score_version to applications
+
+Revision ID: 5d1e9b3f7a28
+Revises: 8c4f2a6e9d53
+Create Date: 2026-10-17 13:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1e9b3f7a28'
+down_revision: Union[str, None] = '8c4f2a6e9d53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('applications', sa.Column('score_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    op.drop_column('applications', 'score_version')
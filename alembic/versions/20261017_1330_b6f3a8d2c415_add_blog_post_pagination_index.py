@@ -0,0 +1,25 @@
+"""Add (created_date, id) index for blog post pagination
+
+Revision ID: b6f3a8d2c415
+Revises: 5d1e9b3f7a28
+Create Date: 2026-10-17 13:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f3a8d2c415'
+down_revision: Union[str, None] = '5d1e9b3f7a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_blog_posts_created_date_id', 'blog_posts', ['created_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blog_posts_created_date_id', table_name='blog_posts')
@@ -0,0 +1,31 @@
+"""Add row versions to job postings, blog posts and contract templates
+
+Revision ID: c8e1f4a7b392
+Revises: b6f3a8d2c415
+Create Date: 2026-10-17 14:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e1f4a7b392'
+down_revision: Union[str, None] = 'b6f3a8d2c415'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('job_postings', 'blog_posts', 'contract_templates')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('version')
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.api_v1.endpoints import users, jobs, candidates, applications, contracts, auth, blog_posts, contract_template
+from app.api.api_v1.endpoints import users, jobs, candidates, applications, contracts, auth, blog_posts, contract_template, metrics
 
 api_router = APIRouter()
 
@@ -10,4 +10,5 @@ api_router.include_router(candidates.router, prefix="/candidates", tags=["candid
 api_router.include_router(applications.router, prefix="/applications", tags=["applications"])
 api_router.include_router(contracts.router, prefix="/contracts", tags=["contracts"]) 
 api_router.include_router(blog_posts.router, prefix="/blog", tags=["blog"])
-api_router.include_router(contract_template.router, prefix="/contractTemplate", tags=["contractTemplate"])
\ No newline at end of file
+api_router.include_router(contract_template.router, prefix="/contractTemplate", tags=["contractTemplate"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
\ No newline at end of file
@@ -1,16 +1,22 @@
-from typing import List, Optional, Dict
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import List, Literal, Optional, Dict, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.api.deps import get_db, get_current_active_user
-from app.services.ai_service import AIService
+from app.api.deps import get_db, get_async_db, get_current_active_user
+from app.api.pagination import Page, PageParams, keyset
+from app.api.serialization import trusted_page
+from app.db.queries import application_shortlist, application_summaries, application_with_details
+from app.services.ai_service import ai_service
+from app.services import email_outbox, scoring_queue
+from app.services.user_cache import CurrentUser
 from app.models.models import Application, JobPosting, Candidate, User
 from pydantic import BaseModel
-from app.services.email_feature import send_email
-from .email_template import candidate_application_template, employer_notification_template
-from .contracts import generate_contract
+from app.services.contracts import generate_contract
 
 router = APIRouter()
-ai_service = AIService()
 
 class ApplicationCreate(BaseModel):
     job_id: int
@@ -52,161 +58,273 @@ class ApplicationResponse(BaseModel):
     candidate_id: int
     status: str
     ai_match_score: Optional[int]
+    score_status: Optional[str] = None
     job: JobResponse
     candidate: CandidateResponse
 
     class Config:
         from_attributes = True
 
+class ShortlistEntry(BaseModel):
+    rank: int
+    application_id: int
+    candidate_id: int
+    status: str
+    ai_match_score: int
+    score_status: Optional[str] = None
+    applied_at: Optional[datetime] = None
+    full_name: Optional[str] = None
+    email: Optional[str] = None
+    skills: List[str] = []
+    bio: Optional[str] = None
+    experience: Optional[List[Dict]] = None
+    education: Optional[List[Dict]] = None
+
+class JobSummary(BaseModel):
+    id: int
+    title: str
+    location: str
+    employer_id: int
+
+    class Config:
+        from_attributes = True
+
+class CandidateSummary(BaseModel):
+    id: int
+    user_id: int
+    skills: List[str]
+    user: CandidateUserResponse
+
+    class Config:
+        from_attributes = True
+
+class ApplicationSummary(BaseModel):
+    id: int
+    job_id: int
+    candidate_id: int
+    status: str
+    ai_match_score: Optional[int]
+    score_status: Optional[str] = None
+    created_at: Optional[datetime] = None
+    job: JobSummary
+    candidate: CandidateSummary
+
+    class Config:
+        from_attributes = True
+
+# view=summary drops the job description and the candidate's bio,
+# experience and education from every row
+ApplicationPage = Union[Page[ApplicationResponse], Page[ApplicationSummary]]
+View = Literal["full", "summary"]
+
+def application_list_query(view: View):
+    return application_summaries() if view == "summary" else application_with_details()
+
+def application_page(rows, params: PageParams, view: View):
+    return trusted_page(ApplicationSummary if view == "summary" else ApplicationResponse, rows, params)
+
 class StatusUpdate(BaseModel):
     status: str
+
+class ScoreStatusResponse(BaseModel):
+    application_id: int
+    score_status: Optional[str]
+    ai_match_score: Optional[int]
+    attempts: int = 0
+    last_error: Optional[str] = None
     
 @router.post("/", response_model=ApplicationResponse)
 async def create_application(
     application: ApplicationCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Create a new job application"""
     # Check if job exists
-    job = db.query(JobPosting).filter(JobPosting.id == application.job_id).first()
+    job = await db.get(JobPosting, application.job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job posting not found")
     
     # Get candidate profile
-    candidate = db.query(Candidate).filter(Candidate.user_id == current_user.id).first()
+    result = await db.execute(select(Candidate).where(Candidate.user_id == current_user.id))
+    candidate = result.scalars().first()
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate profile not found")
     
     # Check if already applied
-    existing_application = db.query(Application).filter(
+    result = await db.execute(select(Application.id).where(
         Application.job_id == application.job_id,
         Application.candidate_id == candidate.id
-    ).first()
+    ))
+    existing_application = result.first()
     if existing_application:
         raise HTTPException(status_code=400, detail="Already applied to this job")
     
-    # Calculate match score
-    match_result = await ai_service.match_candidate_with_job(
-        candidate_data={
-            "bio": candidate.bio,
-            "skills": candidate.skills,
-            "experience": candidate.experience,
-            "education": candidate.education
-        },
-        job_data={
-            "title": job.title,
-            "description": job.description,
-            "requirements": job.requirements
-        }
-    )
-    
-    # Create application
+    # Create application; the match score is computed by the scoring worker
     db_application = Application(
         job_id=application.job_id,
         candidate_id=candidate.id,
         status="pending",
-        ai_match_score=match_result["score"]
+        ai_match_score=None
     )
     
     db.add(db_application)
-    db.commit()
-    db.refresh(db_application)
-    #here email notification can be sent to the employer and candidate
-    candidate_email_subject = "Your Job Application has been Successfully Submitted!"
-    candidate_email_content = candidate_application_template(
-    candidate_name=current_user.full_name,
-    job_title=job.title,
-    match_score=match_result["score"]
-    )
-    send_email(
+    scoring_queue.enqueue(db, db_application)
+
+    # Notifications go out from the email worker once this transaction commits
+    email_outbox.enqueue(
+        db,
         to_email=current_user.email,
-        subject=candidate_email_subject,
-        content=candidate_email_content
+        subject="Your Job Application has been Successfully Submitted!",
+        template="candidate_application",
+        context={
+            "candidate_name": current_user.full_name,
+            "job_title": job.title
+        },
+        application=db_application
     )
 
     # Fetch employer details
-    employer_user = db.query(User).filter(User.id == job.employer_id).first()
-
-    # Send email to employer
-    employer_email_subject = "New Candidate Applied for Your Job Posting"
-    employer_email_content = employer_notification_template(
-    employer_name=employer_user.full_name,
-    candidate_name=current_user.full_name,
-    job_title=job.title,
-    match_score=match_result["score"]
-    )
-    send_email(
+    employer_user = await db.get(User, job.employer_id)
+
+    email_outbox.enqueue(
+        db,
         to_email=employer_user.email,
-        subject=employer_email_subject,
-        content=employer_email_content
+        subject="New Candidate Applied for Your Job Posting",
+        template="employer_notification",
+        context={
+            "employer_name": employer_user.full_name,
+            "candidate_name": current_user.full_name,
+            "job_title": job.title
+        },
+        application=db_application
     )
 
-    return db_application
+    try:
+        await db.commit()
+    except IntegrityError:
+        # uq_applications_job_id_candidate_id caught a concurrent duplicate
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Already applied to this job")
+    result = await db.execute(
+        application_with_details().where(Application.id == db_application.id)
+    )
+    return result.scalars().one()
 
-@router.get("/candidate", response_model=List[ApplicationResponse])
+@router.get("/candidate", response_model=ApplicationPage)
 async def get_candidate_applications(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    params: PageParams = Depends(),
+    view: View = "full",
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Get all applications for the current candidate"""
-    candidate = db.query(Candidate).filter(Candidate.user_id == current_user.id).first()
+    result = await db.execute(select(Candidate).where(Candidate.user_id == current_user.id))
+    candidate = result.scalars().first()
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate profile not found")
     
-    applications = (
-        db.query(Application)
-        .join(JobPosting, Application.job_id == JobPosting.id)
-        .join(Candidate, Application.candidate_id == Candidate.id)
-        .join(User, Candidate.user_id == User.id)
-        .filter(Application.candidate_id == candidate.id)
-        .all()
-    )
-    return applications
+    result = await db.execute(keyset(
+        application_list_query(view).where(Application.candidate_id == candidate.id),
+        Application,
+        params
+    ))
+    return application_page(result.scalars().all(), params, view)
+
+@router.get("/employer", response_model=ApplicationPage)
+async def get_all_employer_applications(
+    params: PageParams = Depends(),
+    view: View = "full",
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Get all applications for all job postings by current employer"""
+    if not current_user.is_employer:
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    result = await db.execute(keyset(
+        application_list_query(view).where(Application.job_id.in_(
+            select(JobPosting.id).where(JobPosting.employer_id == current_user.id)
+        )),
+        Application,
+        params
+    ))
+    return application_page(result.scalars().all(), params, view)
 
-@router.get("/employer/{job_id}", response_model=List[ApplicationResponse])
+@router.get("/employer/{job_id}", response_model=ApplicationPage)
 async def get_job_applications(
     job_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    params: PageParams = Depends(),
+    view: View = "full",
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Get all applications for a specific job posting"""
    # if not current_user.is_employer:
     #    raise HTTPException(status_code=403, detail="Not authorized")
     
-    job = db.query(JobPosting).filter(
-        JobPosting.id == job_id,
-       # JobPosting.employer_id == current_user.id
-    ).first()
+    job = await db.get(JobPosting, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job posting not found")
     
-    applications = (
-        db.query(Application)
-        .join(JobPosting, Application.job_id == JobPosting.id)
-        .join(Candidate, Application.candidate_id == Candidate.id)
-        .join(User, Candidate.user_id == User.id)
-        .filter(Application.job_id == job_id)
-        .all()
-    )
-    return applications
+    result = await db.execute(keyset(
+        application_list_query(view).where(Application.job_id == job_id),
+        Application,
+        params
+    ))
+    return application_page(result.scalars().all(), params, view)
+
+@router.get("/employer/{job_id}/shortlist", response_model=List[ShortlistEntry], response_model_exclude_unset=True)
+async def get_job_shortlist(
+    job_id: int,
+    k: int = Query(20, ge=1, le=500),
+    status: List[str] = Query([]),
+    include_profile: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Get the best matching applications for a job posting, highest score first"""
+    job = await db.get(JobPosting, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job posting not found")
+    if not (current_user.is_admin or (current_user.is_employer and job.employer_id == current_user.id)):
+        raise HTTPException(status_code=403, detail="Not authorized")
+    if any(value not in ["pending", "accepted", "rejected"] for value in status):
+        raise HTTPException(status_code=400, detail="Invalid status")
+
+    result = await db.execute(application_shortlist(job_id, k, status, include_profile))
+    shortlist = []
+    for rank, row in enumerate(result.all(), 1):
+        entry = {
+            "rank": rank,
+            "application_id": row.id,
+            "candidate_id": row.candidate_id,
+            "status": row.status,
+            "ai_match_score": row.ai_match_score,
+            "score_status": row.score_status,
+            "applied_at": row.created_at,
+            "full_name": row.full_name,
+            "email": row.email,
+            "skills": row.skills or [],
+        }
+        if include_profile:
+            entry.update(bio=row.bio, experience=row.experience or [], education=row.education or [])
+        shortlist.append(entry)
+    return shortlist
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
 async def get_application(
     application_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Get application details"""
     # Get application with relationships
-    application = (
-        db.query(Application)
-        .join(JobPosting, Application.job_id == JobPosting.id)
-        .join(Candidate, Application.candidate_id == Candidate.id)
-        .join(User, Candidate.user_id == User.id)
-        .filter(Application.id == application_id)
-        .first()
+    result = await db.execute(
+        application_with_details()
+        .where(Application.id == application_id)
     )
+    application = result.scalars().first()
     
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -220,70 +338,120 @@ async def get_application(
     
     return application
 
+@router.get("/{application_id}/score", response_model=ScoreStatusResponse)
+async def get_application_score_status(
+    application_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Get the background scoring status of an application"""
+    result = await db.execute(
+        application_with_details()
+        .where(Application.id == application_id)
+    )
+    application = result.scalars().first()
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    if not (
+        (current_user.is_employer and current_user.id == application.job.employer_id) or
+        (not current_user.is_employer and application.candidate.user_id == current_user.id)
+    ):
+        raise HTTPException(status_code=403, detail="Not authorized to view this application")
+
+    result = await db.execute(scoring_queue.task_status_query(application_id))
+    task = result.scalars().first()
+    return {
+        "application_id": application.id,
+        "score_status": application.score_status,
+        "ai_match_score": application.ai_match_score,
+        "attempts": task.attempts if task else 0,
+        "last_error": task.last_error if task else None
+    }
+
+@router.post("/rescore")
+def rescore_applications(
+    job_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Queue applications on the current employer's jobs for rescoring.
+
+    Each application gets a task on the scoring queue, scored one at a time
+    by ``ai_service.match_candidate_with_job`` as new applications are; use
+    it to score across all of an employer's jobs or to retry failed scores.
+    ``POST /jobs/{job_id}/rescore`` is the bulk path after a posting
+    changes: it rescores one job's applications in chunks with the local
+    match engine. Plain ``def``, so the sync session runs in the threadpool.
+    """
+    if not current_user.is_employer:
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    query = (
+        db.query(Application.id)
+        .join(JobPosting, Application.job_id == JobPosting.id)
+        .filter(JobPosting.employer_id == current_user.id)
+    )
+    if job_id is not None:
+        query = query.filter(Application.job_id == job_id)
+
+    queued = scoring_queue.enqueue_many(db, [application_id for (application_id,) in query])
+    db.commit()
+    return {"queued": queued}
+
 @router.put("/{application_id}/status")
 async def update_application_status(
     application_id: int,
     status: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Update application status (employer only)"""
     if not current_user.is_employer:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = await db.get(Application, application_id)
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
     # Verify employer owns the job posting
-    job = db.query(JobPosting).filter(
-        JobPosting.id == application.job_id,
-        JobPosting.employer_id == current_user.id
-    ).first()
-    if not job:
+    job = await db.get(JobPosting, application.job_id)
+    if not job or job.employer_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
     
     if status not in ["pending", "accepted", "rejected"]:
         raise HTTPException(status_code=400, detail="Invalid status")
     
     application.status = status
-    db.commit()
-    db.refresh(application)
+    await db.commit()
     return {"message": "Application status updated successfully"} 
 
-@router.get("/employer", response_model=List[ApplicationResponse])
-async def get_all_employer_applications(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
-):
-    """Get all applications for all job postings by current employer"""
-    if not current_user.is_employer:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    applications = (
-        db.query(Application)
-        .join(JobPosting, Application.job_id == JobPosting.id)
-        .join(Candidate, Application.candidate_id == Candidate.id)
-        .join(User, Candidate.user_id == User.id)
-        .filter(JobPosting.employer_id == current_user.id)
-        .all()
-    )
-    return applications
-
 @router.post("/{application_id}/status")
 async def accept_application(application_id: int, db: Session = Depends(get_db)):
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = db.execute(
+        application_with_details().where(Application.id == application_id)
+    ).scalars().first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
 
     application.status = "accepted"
-    db.commit()
 
-    # Trigger contract generation
-    contract = await generate_contract(db, application)
+    # Contract, email and status change commit together
+    await generate_contract(db, application)
 
-    # Send email to candidate
-    await send_contract_email_to_candidate(contract)
+    # Queue email to candidate
+    email_outbox.enqueue(
+        db,
+        to_email=application.candidate.user.email,
+        subject="Your Employment Contract is Ready",
+        template="contract_ready",
+        context={
+            "candidate_name": application.candidate.user.full_name,
+            "job_title": application.job.title
+        },
+        application=application
+    )
+    db.commit()
 
     return {"message": "Application accepted and contract generated"}
 
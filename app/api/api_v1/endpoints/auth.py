@@ -1,15 +1,36 @@
+import math
 from datetime import timedelta
 from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from app.core.security import create_access_token, verify_password, get_password_hash
-from app.api.deps import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.security import create_access_token, password_hasher
+from app.api.deps import get_async_db
 from app.models.models import User
+from app.services.rate_limit import LOGIN_ACCOUNT, LOGIN_IP, REGISTER_IP, Rule, rate_limiter
 from pydantic import BaseModel, EmailStr
 
 router = APIRouter()
 
+def client_ip(request: Request) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+async def throttle(rule: Rule, key: str, detail: str) -> None:
+    """Reject with 429 before any bcrypt work once ``key`` has used up ``rule``."""
+    retry_after = await rate_limiter.hit_async(rule, key)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
 class UserCreate(BaseModel):
     email: EmailStr
     password: str
@@ -35,12 +56,21 @@ class Token(BaseModel):
 
 @router.post("/login", response_model=Token)
 async def login(
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """OAuth2 compatible token login"""
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    account = form_data.username.strip().casefold()
+    await throttle(LOGIN_IP, client_ip(request), "Too many login attempts, try again later")
+    await throttle(LOGIN_ACCOUNT, account, "Too many login attempts for this account, try again later")
+    result = await db.execute(select(User).where(User.email == form_data.username))
+    user = result.scalars().first()
+    if user:
+        valid, new_hash = await password_hasher.verify_and_update(form_data.password, user.hashed_password)
+    else:
+        valid, new_hash = False, None
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -52,6 +82,14 @@ async def login(
             detail="Inactive user"
         )
     
+    # Only failed attempts should count against the account
+    await rate_limiter.reset_async(LOGIN_ACCOUNT, account)
+
+    if new_hash:
+        # Stored with a different bcrypt cost than BCRYPT_ROUNDS; upgrade it
+        user.hashed_password = new_hash
+        await db.commit()
+
     access_token = create_access_token(data={"sub": str(user.id)})
     return {
         "access_token": access_token,
@@ -61,12 +99,15 @@ async def login(
 
 @router.post("/register", response_model=UserResponse)
 async def register(
+    request: Request,
     user_in: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Register new user"""
+    await throttle(REGISTER_IP, client_ip(request), "Too many registrations, try again later")
     # Check if user exists
-    user = db.query(User).filter(User.email == user_in.email).first()
+    result = await db.execute(select(User).where(User.email == user_in.email))
+    user = result.scalars().first()
     if user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -76,11 +117,11 @@ async def register(
     # Create new user
     user = User(
         email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await password_hasher.hash(user_in.password),
         full_name=user_in.full_name,
         is_employer=user_in.is_employer
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user 
\ No newline at end of file
@@ -1,17 +1,22 @@
 from pydantic import BaseModel, HttpUrl
 from typing import Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.models.models import BlogPost, User
+from app.models.models import BlogPost
+from app.api.caching import cache_headers, etag, not_modified, versions
 from app.api.deps import get_db, get_current_user
-from app.models.models import User
+from app.api.pagination import Page, PageParams, keyset, page
+from app.api.sse import sse_response
 from typing import List
-from app.services.ai_service import AIService
+from app.services.ai_limiter import AIOverloaded
+from app.services.ai_resilience import AIUnavailable
+from app.services.ai_service import ai_service
+from app.services.user_cache import CurrentUser
 from fastapi import status
 
 router = APIRouter()
-ai_service = AIService()
 
 class BlogPostCreate(BaseModel):
     title: str
@@ -31,13 +36,24 @@ class BlogPostResponse(BlogPostCreate):
 def create_post(
     post_data: BlogPostCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     return create_blog_post(db, post_data, current_user.id)
 
-@router.get("/", response_model=List[BlogPostResponse])
-def get_posts(db: Session = Depends(get_db)):
-    return get_blog_posts(db)
+@router.get("/", response_model=Page[BlogPostResponse])
+def get_posts(
+    request: Request,
+    response: Response,
+    params: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    stmt = keyset(select(BlogPost), BlogPost, params)
+    tag = etag(request, db.execute(versions(stmt, BlogPost)).all())
+    cached = not_modified(request, tag)
+    if cached:
+        return cached
+    response.headers.update(cache_headers(request, tag))
+    return page(db.execute(stmt).scalars().all(), params)
 
 def create_blog_post(db: Session, blog_data: BlogPostCreate, author_id: int):
     blog = BlogPost(**blog_data.dict(), author_id=author_id)
@@ -46,9 +62,6 @@ def create_blog_post(db: Session, blog_data: BlogPostCreate, author_id: int):
     db.refresh(blog)
     return blog
 
-def get_blog_posts(db: Session, skip: int = 0, limit: int = 10):
-    return db.query(BlogPost).offset(skip).limit(limit).all()
-
 
 @router.post("/generate", response_model=str)
 async def generate_blog_ai(title: str):
@@ -62,8 +75,15 @@ async def generate_blog_ai(title: str):
         #     skills={}
         # )
          return bio
+    except (AIOverloaded, AIUnavailable):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI generation failed: {str(e)}")
+
+@router.post("/generate/stream")
+async def stream_blog_ai(title: str):
+    """Stream generated blog content as Server-Sent Events"""
+    return await sse_response(ai_service.stream_blog_content(title=title))
     
     
 @router.get("/{blog_id}", response_model=BlogPostResponse)
@@ -80,7 +100,7 @@ def get_blog_by_id(
 def delete_blog_post(
     blog_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     blog = db.query(BlogPost).filter(BlogPost.id == blog_id).first()
     if not blog:
@@ -97,7 +117,7 @@ def update_blog_post(
     blog_id: int,
     post_data: BlogPostCreate,  # or BlogPostUpdate if you prefer partial updates
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     blog = db.query(BlogPost).filter(BlogPost.id == blog_id).first()
     if not blog:
@@ -1,15 +1,22 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.session import get_db
-from app.services.ai_service import AIService
-from app.models.models import Candidate, User
+import asyncio
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_async_db
+from app.services.ai_limiter import AIOverloaded
+from app.services.ai_service import ai_service
+from app.core.config import settings
+from app.services import match_engine, vector_store
+from app.services.skill_index import skill_index
+from app.models.models import Candidate, JobPosting
 from app.api.deps import get_current_active_user
+from app.services.user_cache import CurrentUser
+from app.api.sse import sse_response
 from pydantic import BaseModel
 import logging
 
 router = APIRouter()
-ai_service = AIService()
 logger = logging.getLogger(__name__)
 
 class EducationBase(BaseModel):
@@ -42,11 +49,16 @@ class CandidateResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class CandidateSearchResponse(BaseModel):
+    total: int
+    skill_counts: Dict[str, int]
+    items: List[CandidateResponse]
+
 @router.post("/", response_model=CandidateResponse)
 async def create_candidate(
     candidate: CandidateCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Create or update a candidate profile"""
     # Verify user is creating their own profile
@@ -54,7 +66,8 @@ async def create_candidate(
         raise HTTPException(status_code=403, detail="Not authorized to create profile for another user")
     
     # Check if profile already exists
-    existing_profile = db.query(Candidate).filter(Candidate.user_id == current_user.id).first()
+    result = await db.execute(select(Candidate).where(Candidate.user_id == current_user.id))
+    existing_profile = result.scalars().first()
     
     if existing_profile:
         # Update existing profile
@@ -62,8 +75,10 @@ async def create_candidate(
         existing_profile.skills = candidate.skills
         existing_profile.experience = [exp.dict() for exp in candidate.experience]
         existing_profile.education = [edu.dict() for edu in candidate.education]
-        db.commit()
-        db.refresh(existing_profile)
+        await db.commit()
+        await db.refresh(existing_profile)
+        await asyncio.to_thread(vector_store.index_candidate, existing_profile)
+        skill_index.update(existing_profile.id, existing_profile.skills)
         return existing_profile
     
     # Create new profile
@@ -76,27 +91,56 @@ async def create_candidate(
     )
     
     db.add(db_candidate)
-    db.commit()
-    db.refresh(db_candidate)
+    await db.commit()
+    await db.refresh(db_candidate)
+    await asyncio.to_thread(vector_store.index_candidate, db_candidate)
+    skill_index.update(db_candidate.id, db_candidate.skills)
     return db_candidate
 
 @router.get("/me", response_model=CandidateResponse)
 async def get_my_profile(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Get current user's candidate profile"""
-    profile = db.query(Candidate).filter(Candidate.user_id == current_user.id).first()
+    result = await db.execute(select(Candidate).where(Candidate.user_id == current_user.id))
+    profile = result.scalars().first()
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
     return profile
 
-@router.post("/generate-bio")
-async def generate_candidate_bio(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+@router.get("/search", response_model=CandidateSearchResponse)
+async def search_candidates(
+    skills: List[str] = Query([]),
+    match: str = Query("all", pattern="^(all|any)$"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
-    """Generate a bio for the candidate using AI"""
+    """Find candidates with all (or any) of the given skills, newest profiles first"""
+    if not (current_user.is_employer or current_user.is_admin):
+        raise HTTPException(status_code=403, detail="Not authorized")
+    if not skills:
+        raise HTTPException(status_code=400, detail="At least one skill is required")
+
+    await skill_index.refresh(db)
+    candidate_ids, skill_counts = skill_index.search(skills, match_all=match == "all")
+    page_ids = candidate_ids[::-1][offset:offset + limit].tolist()
+
+    result = await db.execute(select(Candidate).where(Candidate.id.in_(page_ids)))
+    candidates = {candidate.id: candidate for candidate in result.scalars().all()}
+    return {
+        "total": int(candidate_ids.size),
+        "skill_counts": skill_counts,
+        "items": [candidates[candidate_id] for candidate_id in page_ids if candidate_id in candidates]
+    }
+
+async def get_bio_profile(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+) -> Candidate:
+    """The current candidate's profile, checked to have what a bio needs"""
     # Check if user is a candidate (not an employer)
     if current_user.is_employer:
         raise HTTPException(
@@ -105,7 +149,8 @@ async def generate_candidate_bio(
         )
     
     # Get candidate profile
-    profile = db.query(Candidate).filter(Candidate.user_id == current_user.id).first()
+    result = await db.execute(select(Candidate).where(Candidate.user_id == current_user.id))
+    profile = result.scalars().first()
     if not profile:
         raise HTTPException(
             status_code=404,
@@ -130,7 +175,11 @@ async def generate_candidate_bio(
             status_code=400,
             detail="Please add at least one education entry"
         )
-    
+    return profile
+
+@router.post("/generate-bio")
+async def generate_candidate_bio(profile: Candidate = Depends(get_bio_profile)):
+    """Generate a bio for the candidate using AI"""
     try:
         bio = await ai_service.generate_candidate_bio(
             experience=profile.experience,
@@ -138,6 +187,8 @@ async def generate_candidate_bio(
             skills=profile.skills
         )
         return {"bio": bio}
+    except AIOverloaded:
+        raise
     except Exception as e:
         logger.error(f"Error generating bio: {str(e)}")
         raise HTTPException(
@@ -145,19 +196,30 @@ async def generate_candidate_bio(
             detail="Failed to generate bio. Please try again later."
         )
 
+@router.post("/generate-bio/stream")
+async def stream_candidate_bio(profile: Candidate = Depends(get_bio_profile)):
+    """Stream an AI generated bio for the candidate as Server-Sent Events"""
+    return await sse_response(ai_service.stream_candidate_bio(
+        experience=profile.experience,
+        education=profile.education,
+        skills=profile.skills
+    ))
+
 @router.get("/{candidate_id}/match/{job_id}")
 async def get_job_match(
     candidate_id: int,
     job_id: int,
-    db: Session = Depends(get_db)
+    explain: bool = False,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get AI-powered match score between candidate and job"""
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    candidate = await db.get(Candidate, candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    # You would implement proper job fetching here
-    job_data = {"id": job_id, "title": "Sample Job"}
+    job = await db.get(JobPosting, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job posting not found")
     
     match_result = await ai_service.match_candidate_with_job(
         candidate_data={
@@ -166,7 +228,33 @@ async def get_job_match(
             "experience": candidate.experience,
             "education": candidate.education
         },
-        job_data=job_data
+        job_data={
+            "title": job.title,
+            "description": job.description,
+            "requirements": job.requirements
+        },
+        explain=explain
     )
     
-    return match_result 
\ No newline at end of file
+    return match_result
+
+@router.get("/{candidate_id}/top-jobs")
+async def get_top_jobs_for_candidate(
+    candidate_id: int,
+    k: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Get the active job postings that best match a candidate profile"""
+    if not (current_user.is_employer or current_user.is_admin):
+        raise HTTPException(status_code=403, detail="Not authorized")
+    candidate = await db.get(Candidate, candidate_id)
+    if not candidate:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+
+    # File locks and memmap reads block, so keep them off the event loop
+    results = await asyncio.to_thread(vector_store.job_store().search, match_engine.vectorize_candidate(candidate), k)
+    return [
+        {"job_id": job_id, "similarity": round(similarity, 4)}
+        for job_id, similarity in results
+    ]
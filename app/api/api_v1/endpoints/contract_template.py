@@ -1,14 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
-from app.models.models import ContractTemplate, User
+from app.models.models import ContractTemplate
+from app.api.caching import cache_headers, etag, not_modified, versions
 from app.api.deps import get_db, get_current_user
-from app.services.ai_service import AIService
+from app.api.pagination import Page, PageParams, keyset, page
+from app.api.sse import sse_response
+from app.services.ai_limiter import AIOverloaded
+from app.services.ai_service import ai_service
+from app.services.user_cache import CurrentUser
 from pydantic import BaseModel
 
 router = APIRouter()
-ai_service = AIService()
 
 # =============================
 #         SCHEMAS
@@ -38,7 +43,7 @@ def create_contract_template(
 
    post_data: ContractTemplateCreate,
    db: Session = Depends(get_db),
-   current_user: User = Depends(get_current_user)
+   current_user: CurrentUser = Depends(get_current_user)
         
 ):
    
@@ -48,9 +53,21 @@ def create_contract_template(
     db.refresh(contract)
     return contract
 
-@router.get("/", response_model=List[ContractTemplateResponse])
-def get_all_contracts(db: Session = Depends(get_db)):
-    return db.query(ContractTemplate).order_by(ContractTemplate.id.desc()).all()
+@router.get("/", response_model=Page[ContractTemplateResponse])
+def get_all_contracts(
+    request: Request,
+    response: Response,
+    params: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    stmt = keyset(select(ContractTemplate), ContractTemplate, params)
+    tag = etag(request, db.execute(versions(stmt, ContractTemplate)).all())
+    cached = not_modified(request, tag)
+    if cached:
+        return cached
+    response.headers.update(cache_headers(request, tag))
+    templates = db.execute(stmt).scalars().all()
+    return page(templates, params)
 
 @router.get("/{template_id}", response_model=ContractTemplateResponse)
 def get_contract_by_id(template_id: int, db: Session = Depends(get_db)):
@@ -64,7 +81,7 @@ def update_contract_template(
     template_id: int,
     data: ContractTemplateCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     contract = db.query(ContractTemplate).filter(ContractTemplate.id == template_id).first()
     if not contract:
@@ -83,7 +100,7 @@ def update_contract_template(
 def delete_contract_template(
     template_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     contract = db.query(ContractTemplate).filter(ContractTemplate.id == template_id).first()
     if not contract:
@@ -104,5 +121,12 @@ async def generate_contract_description(prompt: GeneratePrompt):
     try:
         description = await ai_service.generate_contract_description(prompt.contract_title)
         return {"description": description}
+    except AIOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI generation failed: {str(e)}")
+
+@router.post("/generate_description/stream")
+async def stream_contract_description(prompt: GeneratePrompt):
+    """Stream an AI generated contract description as Server-Sent Events"""
+    return await sse_response(ai_service.stream_contract_description(prompt.contract_title))
@@ -2,12 +2,13 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.api.deps import get_db, get_current_active_user, get_current_employer
-from app.services.ai_service import AIService
-from app.models.models import Contract, Application, JobPosting, Candidate, User
+from app.db.queries import application_with_details
+from app.services.contracts import generate_contract as create_contract
+from app.models.models import Contract, Application, JobPosting, Candidate
+from app.services.user_cache import CurrentUser
 from pydantic import BaseModel
 
 router = APIRouter()
-ai_service = AIService()
 
 class ContractResponse(BaseModel):
     id: int
@@ -22,11 +23,13 @@ class ContractResponse(BaseModel):
 async def generate_contract(
     application_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_employer)
+    current_user: CurrentUser = Depends(get_current_employer)
 ):
     """Generate a new contract for an accepted application"""
     # Get application
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = db.execute(
+        application_with_details().where(Application.id == application_id)
+    ).scalars().first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
@@ -38,39 +41,11 @@ async def generate_contract(
     if existing_contract:
         raise HTTPException(status_code=400, detail="Contract already exists for this application")
     
-    # Get job and candidate details
-    job = db.query(JobPosting).filter(JobPosting.id == application.job_id).first()
-    candidate = db.query(Candidate).filter(Candidate.id == application.candidate_id).first()
-    
     # Verify employer owns the job posting
-    if job.employer_id != current_user.id:
+    if application.job.employer_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    # Generate contract using AI
-    contract_content = await ai_service.generate_contract(
-        job_data={
-            "title": job.title,
-            "description": job.description,
-            "requirements": job.requirements,
-            "salary_range": job.salary_range,
-            "location": job.location
-        },
-        candidate_data={
-            "name": User.full_name,
-            "bio": candidate.bio,
-            "experience": candidate.experience,
-            "education": candidate.education
-        }
-    )
-    
-    # Create contract
-    contract = Contract(
-        application_id=application_id,
-        content=contract_content,
-        status="draft"
-    )
-    
-    db.add(contract)
+    contract = await create_contract(db, application)
     db.commit()
     db.refresh(contract)
     return contract
@@ -79,7 +54,7 @@ async def generate_contract(
 async def get_contract(
     contract_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Get contract details"""
     contract = db.query(Contract).filter(Contract.id == contract_id).first()
@@ -101,7 +76,7 @@ async def update_contract_status(
     contract_id: int,
     status: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Update contract status"""
     if status not in ["draft", "sent", "signed"]:
@@ -136,7 +111,7 @@ async def update_contract_status(
 async def approve_contract_by_employer(
     contract_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_employer)
+    current_user: CurrentUser = Depends(get_current_employer)
 ):
     """Employer approves/signs the contract"""
     contract = db.query(Contract).filter(Contract.id == contract_id).first()
@@ -161,7 +136,7 @@ async def approve_contract_by_employer(
 async def sign_contract_by_candidate(
     contract_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Candidate signs the contract"""
     contract = db.query(Contract).filter(Contract.id == contract_id).first()
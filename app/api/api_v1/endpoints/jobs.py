@@ -1,13 +1,27 @@
-from typing import List, Optional, Dict
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.session import get_db
-from app.services.ai_service import AIService
+import asyncio
+from datetime import datetime
+from typing import Any, List, Optional, Dict, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.caching import cache_headers, etag, not_modified, versions
+from app.api.deps import get_current_active_user
+from app.api.fields import field_selector, load_only_fields, project
+from app.api.pagination import Page, PageParams, keyset, page
+from app.api.serialization import TrustedJSONResponse, trusted_page
+from app.api.sse import sse_response
+from app.core.config import settings
+from app.db.session import get_async_db
+from app.services.ai_limiter import AIOverloaded
+from app.services.ai_service import ai_service
+from app.services import job_search, match_engine, rescore, vector_store
+from app.services.user_cache import CurrentUser
 from app.models.models import JobPosting, User
 from pydantic import BaseModel
+import logging
 
 router = APIRouter()
-ai_service = AIService()
+logger = logging.getLogger(__name__)
 
 class SalaryRange(BaseModel):
     min: float
@@ -40,10 +54,48 @@ class JobPostingResponse(BaseModel):
     location: str
     salary_range: Dict
     is_active: bool
+    created_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
+# Job list endpoints return only the requested columns when given fields=
+JobPage = Union[Page[JobPostingResponse], Page[Dict[str, Any]]]
+job_fields = field_selector(JobPostingResponse)
+
+def job_page(rows, params: PageParams, fields: Optional[List[str]]) -> TrustedJSONResponse:
+    if fields:
+        result = page(rows, params)
+        result["items"] = project(result["items"], fields)
+        return TrustedJSONResponse(result)
+    return trusted_page(JobPostingResponse, rows, params)
+
+async def job_list(request: Request, db: AsyncSession, stmt, params: PageParams, fields: Optional[List[str]]):
+    """Serve a page of ``stmt``, or a 304 when the client's copy is current"""
+    stmt = keyset(stmt, JobPosting, params)
+    tag = etag(request, (await db.execute(versions(stmt, JobPosting))).all())
+    cached = not_modified(request, tag)
+    if cached:
+        return cached
+    result = await db.execute(load_only_fields(stmt, JobPosting, fields))
+    response = job_page(result.scalars().all(), params, fields)
+    response.headers.update(cache_headers(request, tag))
+    return response
+
+class JobSearchResult(JobPostingResponse):
+    rank: float
+
+class RescoreRunResponse(BaseModel):
+    id: int
+    job_id: int
+    status: str
+    total: int
+    scored: int
+    progress: float
+    last_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
 class GenerateDescriptionRequest(BaseModel):
     title: str
     requirements: List[str]
@@ -55,7 +107,7 @@ class GenerateDescriptionResponse(BaseModel):
 @router.post("/", response_model=JobPostingResponse)
 async def create_job_posting(
     job: JobPostingCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new job posting with AI-enhanced content"""
     try:
@@ -71,13 +123,17 @@ async def create_job_posting(
         job_data = job.dict()
         filter_result = await ai_service.filter_job_posting(job_data)
         
+        # Unreviewed (AI unavailable) postings are saved as submitted
+        if not filter_result.get("reviewed", True):
+            logger.warning(f"Job posting '{job.title}' saved without an AI review")
         # If not compliant but has feedback, use the AI-generated description
-        if not filter_result["is_compliant"] and "feedback" in filter_result:
-            # Extract the job description from the feedback
+        elif filter_result["is_compliant"] is False and "feedback" in filter_result:
+            # Extract the job description from the feedback, if it has one
             feedback_lines = filter_result["feedback"].split("\n")
-            description_start = next(i for i, line in enumerate(feedback_lines) if "Overview:" in line)
-            description_end = next(i for i, line in enumerate(feedback_lines) if "Feedback and Suggestions:" in line)
-            job.description = "\n".join(feedback_lines[description_start:description_end]).strip()
+            description_start = next((i for i, line in enumerate(feedback_lines) if "Overview:" in line), None)
+            description_end = next((i for i, line in enumerate(feedback_lines) if "Feedback and Suggestions:" in line), None)
+            if description_start is not None and description_end is not None and description_start < description_end:
+                job.description = "\n".join(feedback_lines[description_start:description_end]).strip()
         
         # Create job posting
         db_job = JobPosting(
@@ -90,67 +146,156 @@ async def create_job_posting(
         )
         
         db.add(db_job)
-        db.commit()
-        db.refresh(db_job)
+        await db.commit()
+        await db.refresh(db_job)
+        await asyncio.to_thread(vector_store.index_job, db_job)
         return db_job
+    except AIOverloaded:
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"Job creation error: {e}") 
         raise HTTPException(
             status_code=500,
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
-@router.get("/all")
+@router.get("/all", response_model=JobPage)
 async def get_all_jobs(
-    db: Session = Depends(get_db)
+    request: Request,
+    params: PageParams = Depends(),
+    fields: Optional[List[str]] = Depends(job_fields),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all job postings for an employer"""
-    jobs = db.query(JobPosting).all()
-    return jobs
+    """Get all job postings, newest first"""
+    return await job_list(request, db, select(JobPosting), params, fields)
+
 
+@router.get("/search", response_model=List[JobSearchResult])
+async def search_jobs(
+    q: str = Query(..., min_length=1, max_length=200),
+    location: Optional[str] = None,
+    salary_min: Optional[float] = None,
+    salary_max: Optional[float] = None,
+    currency: Optional[str] = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Search active job postings by title, description and requirements, best match first"""
+    results = await job_search.search_jobs(
+        db,
+        q,
+        location=location,
+        salary_min=salary_min,
+        salary_max=salary_max,
+        currency=currency,
+        limit=limit
+    )
+    return [
+        JobSearchResult(**JobPostingResponse.model_validate(job).model_dump(), rank=round(rank, 6))
+        for job, rank in results
+    ]
 
 @router.get("/{job_id}")
 async def get_job_posting(
     job_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get job posting details"""
-    job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
+    job = await db.get(JobPosting, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job posting not found")
     return job
 
-@router.get("/employer/{employer_id}")
+@router.get("/{job_id}/top-candidates")
+async def get_top_candidates_for_job(
+    job_id: int,
+    k: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Get the candidates whose profiles best match a job posting"""
+    if not (current_user.is_employer or current_user.is_admin):
+        raise HTTPException(status_code=403, detail="Not authorized")
+    job = await db.get(JobPosting, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job posting not found")
+
+    # File locks and memmap reads block, so keep them off the event loop
+    results = await asyncio.to_thread(vector_store.candidate_store().search, match_engine.vectorize_job(job), k)
+    return [
+        {"candidate_id": candidate_id, "similarity": round(similarity, 4)}
+        for candidate_id, similarity in results
+    ]
+
+@router.post("/{job_id}/rescore", response_model=RescoreRunResponse, status_code=202)
+async def rescore_job_applications(
+    job_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Queue a rescore of every application for a job posting"""
+    job = await db.get(JobPosting, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job posting not found")
+    if not (current_user.is_admin or (current_user.is_employer and job.employer_id == current_user.id)):
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    run = await rescore.start(db, job_id)
+    await db.commit()
+    await db.refresh(run)
+    return rescore.run_status(run)
+
+@router.get("/{job_id}/rescore", response_model=RescoreRunResponse)
+async def get_rescore_progress(
+    job_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Get the progress of the latest rescore of a job posting"""
+    job = await db.get(JobPosting, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job posting not found")
+    if not (current_user.is_admin or (current_user.is_employer and job.employer_id == current_user.id)):
+        raise HTTPException(status_code=403, detail="Not authorized")
+    run = (await db.execute(rescore.latest_run_query(job_id))).scalar_one_or_none()
+    if not run:
+        raise HTTPException(status_code=404, detail="No rescore found for this job posting")
+    return rescore.run_status(run)
+
+@router.get("/employer/{employer_id}", response_model=JobPage)
 async def get_employer_jobs(
+    request: Request,
     employer_id: int,
-    db: Session = Depends(get_db)
+    params: PageParams = Depends(),
+    fields: Optional[List[str]] = Depends(job_fields),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all job postings for an employer"""
-    jobs = db.query(JobPosting).filter(JobPosting.employer_id == employer_id).all()
-    return jobs
+    """Get all job postings for an employer, newest first"""
+    return await job_list(request, db, select(JobPosting).where(JobPosting.employer_id == employer_id), params, fields)
 
 
 
 @router.put("/{job_id}/deactivate")
 async def deactivate_job(
     job_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Deactivate a job posting"""
-    job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
+    job = await db.get(JobPosting, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job posting not found")
     
     job.is_active = False
-    db.commit()
-    db.refresh(job)
+    await db.commit()
+    await db.refresh(job)
+    await asyncio.to_thread(vector_store.remove_job, job.id)
     return {"message": "Job posting deactivated successfully"}
 
 @router.post("/generate-description", response_model=GenerateDescriptionResponse)
 async def generate_job_description(
     request: GenerateDescriptionRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Generate a job description using AI"""
     try:
@@ -160,45 +305,67 @@ async def generate_job_description(
             company_info=request.company_info
         )
         return {"description": description}
+    except AIOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate job description: {str(e)}"
         )
 
-@router.get("/", response_model=List[JobPostingResponse])
+@router.post("/generate-description/stream")
+async def stream_job_description(request: GenerateDescriptionRequest):
+    """Stream an AI generated job description as Server-Sent Events"""
+    return await sse_response(ai_service.stream_job_description(
+        title=request.title,
+        requirements=request.requirements,
+        company_info=request.company_info
+    ))
+
+@router.get("/", response_model=JobPage)
 async def get_jobs(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    request: Request,
+    params: PageParams = Depends(),
+    fields: Optional[List[str]] = Depends(job_fields),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all active job postings"""
-    jobs = db.query(JobPosting).filter(JobPosting.is_active == True).offset(skip).limit(limit).all()
-    return jobs 
+    """Get all active job postings, newest first"""
+    return await job_list(request, db, select(JobPosting).where(JobPosting.is_active == True), params, fields)
 
 @router.delete("/{job_id}")
 async def delete_job(
     job_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
+    job = await db.get(JobPosting, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    db.delete(job)
-    db.commit()
+    await db.delete(job)
+    await db.commit()
+    await asyncio.to_thread(vector_store.remove_job, job_id)
     return {"message": "Job deleted successfully"}
 
 @router.put("/update/{job_id}", response_model=JobPostingResponse)
 async def update_job_posting(
     job_id: int,
     job_update: JobPostingUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an existing job posting"""
-    job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
+    job = await db.get(JobPosting, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job posting not found")
 
+    # Scores depend on these fields, so changing them rescores the applications
+    rescore_needed = any(
+        value is not None and value != getattr(job, field)
+        for field, value in (
+            ("title", job_update.title),
+            ("description", job_update.description),
+            ("requirements", job_update.requirements),
+        )
+    )
+
     # Update fields if provided
     if job_update.title is not None:
         job.title = job_update.title
@@ -213,6 +380,9 @@ async def update_job_posting(
     if job_update.is_active is not None:
         job.is_active = job_update.is_active
 
-    db.commit()
-    db.refresh(job)
+    if rescore_needed:
+        await rescore.start(db, job.id)
+    await db.commit()
+    await db.refresh(job)
+    await asyncio.to_thread(vector_store.index_job, job)
     return job
@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.api.deps import get_current_admin, get_db
+from app.core.security import password_hasher
+from app.db.pool import pool_stats
+from app.db.session import async_engine, engine
+from app.services.ai_cache import completion_cache
+from app.services.ai_limiter import ai_limiter
+from app.services.ai_resilience import ai_resilience
+from app.services.ai_service import ai_stream_stats
+from app.services.ai_singleflight import ai_singleflight
+from app.services import email_outbox, scoring_queue
+from app.services.rate_limit import rate_limiter
+from app.services.user_cache import user_cache
+
+# Operational figures, including outbox and rate-limit details, are for admins only
+router = APIRouter(dependencies=[Depends(get_current_admin)])
+
+@router.get("/ai-cache")
+async def get_ai_cache_stats():
+    """Hit/miss counters for the AI completion cache"""
+    return completion_cache.stats()
+
+@router.get("/ai-streams")
+async def get_ai_stream_stats():
+    """Time to first token and duration of streamed AI generations"""
+    return ai_stream_stats.stats()
+
+@router.get("/ai-limiter")
+async def get_ai_limiter_stats():
+    """Concurrency, token budget and queue figures per AI model"""
+    return ai_limiter.stats()
+
+@router.get("/ai-resilience")
+async def get_ai_resilience_stats():
+    """Circuit breaker state per AI model and retry/fallback counts per method"""
+    return ai_resilience.stats()
+
+@router.get("/ai-inflight")
+async def get_ai_inflight_stats():
+    """Counters for coalesced concurrent AI requests"""
+    return ai_singleflight.stats()
+
+@router.get("/scoring-queue")
+def get_scoring_queue_stats(db: Session = Depends(get_db)):
+    """Task counts per status for the background scoring queue"""
+    return scoring_queue.queue_stats(db)
+
+@router.get("/email-outbox")
+def get_email_outbox_stats(db: Session = Depends(get_db)):
+    """Message counts per delivery status for the email outbox"""
+    return email_outbox.outbox_stats(db)
+
+@router.get("/db-pool")
+async def get_db_pool_stats():
+    """Checkout, wait-time and overflow figures for the database connection pools"""
+    return {
+        "sync": pool_stats(engine),
+        "async": pool_stats(async_engine.sync_engine),
+    }
+
+@router.get("/user-cache")
+async def get_user_cache_stats():
+    """Hit/miss counters for the authenticated-user cache"""
+    return user_cache.stats()
+
+@router.get("/password-hashing")
+async def get_password_hashing_stats():
+    """Queue depth and timings of the bcrypt thread pool"""
+    return password_hasher.stats()
+
+
+@router.get("/rate-limit")
+async def get_rate_limit_stats():
+    """Allowed and rejected attempts per login/register rate limit"""
+    return rate_limiter.stats()
\ No newline at end of file
@@ -1,8 +1,11 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.api.deps import get_db, get_current_active_user
+from app.api.pagination import Page, PageParams, keyset, page
 from app.models.models import User
+from app.services.user_cache import CurrentUser, user_cache
 from pydantic import BaseModel, EmailStr
 
 router = APIRouter()
@@ -26,7 +29,7 @@ class UserResponse(UserBase):
 
 @router.get("/me", response_model=UserResponse)
 async def read_user_me(
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Get current user."""
     return current_user
@@ -34,23 +37,25 @@ async def read_user_me(
 @router.put("/me", response_model=UserResponse)
 async def update_user_me(
     user_in: UserUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUser = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Update current user."""
+    user = db.query(User).filter(User.id == current_user.id).first()
     # Update user fields
     for field, value in user_in.dict(exclude_unset=True).items():
-        setattr(current_user, field, value)
+        setattr(user, field, value)
     
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    db.refresh(user)
+    user_cache.invalidate(user.id)
+    return user
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def read_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Get user by ID."""
     user = db.query(User).filter(User.id == user_id).first()
@@ -78,20 +83,19 @@ async def read_user(
 #     users = db.query(User).offset(skip).limit(limit).all()
 #     return users
 
-@router.get("/", response_model=List[UserResponse])
+@router.get("/", response_model=Page[UserResponse])
 async def read_users(
-    skip: int = 0,
-    limit: int = 100,
+    params: PageParams = Depends(),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Get list of users (admin only)."""
     
-    if not getattr(current_user, "is_admin", False):
+    if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have permission to view all users."
         )
     
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
\ No newline at end of file
+    users = db.execute(keyset(select(User), User, params)).scalars().all()
+    return page(users, params)
@@ -0,0 +1,73 @@
+import hashlib
+from typing import Any, Dict, Optional, Sequence
+
+from fastapi import Request, Response
+from sqlalchemy import Select
+
+from app.core.config import settings
+
+# Suffixes the compression middleware adds to the ETag of an encoded body
+ENCODING_SUFFIXES = ("-gzip", "-br")
+
+
+def versions(stmt: Select, model) -> Select:
+    """``stmt`` reduced to the columns that change whenever a row it returns does.
+
+    Run it before the real query: rows come back in the same order with the
+    same limit, but only ``(id, updated_at, version)`` is read. ``version``
+    is bumped by every UPDATE, so edits within the same second (SQLite
+    stores ``updated_at`` to the second) still change it.
+    """
+    return stmt.with_only_columns(model.id, model.updated_at, model.version)
+
+
+def etag(request: Request, rows: Sequence[Sequence[Any]]) -> str:
+    """A strong ETag for the collection at this URL made up of ``rows`` versions.
+
+    Adding, removing or editing a row changes some ``(id, updated_at,
+    version)`` triple and so the tag, without the rows themselves being loaded.
+    """
+    digest = hashlib.sha256(request.url.path.encode("utf-8"))
+    digest.update(request.url.query.encode("utf-8"))
+    for row in rows:
+        digest.update(repr(tuple(row)).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _matching(if_none_match: str, tag: str) -> Optional[str]:
+    """The If-None-Match entry that names ``tag``, in the form the client sent it."""
+    for sent in if_none_match.split(","):
+        sent = sent.strip()
+        if sent == "*":
+            return tag
+        candidate = sent[2:] if sent.startswith("W/") else sent
+        for suffix in ENCODING_SUFFIXES:
+            if candidate.endswith(f'{suffix}"'):
+                candidate = candidate[: -len(suffix) - 1] + '"'
+        if candidate == tag:
+            return sent
+    return None
+
+
+def cache_control(request: Request) -> str:
+    """The Cache-Control value configured for the matched route."""
+    route = request.scope.get("route")
+    path = getattr(route, "path", request.url.path)
+    return settings.CACHE_CONTROL.get(path, settings.CACHE_CONTROL_DEFAULT)
+
+
+def cache_headers(request: Request, tag: str) -> Dict[str, str]:
+    return {"ETag": tag, "Cache-Control": cache_control(request)}
+
+
+def not_modified(request: Request, tag: str) -> Optional[Response]:
+    """A 304 response if the client already holds the representation tagged ``tag``.
+
+    The 304 repeats the ETag the client sent, ``-gzip``/``-br`` suffix
+    included, so it names the encoded representation the client cached.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    matched = _matching(if_none_match, tag) if if_none_match else None
+    if matched:
+        return Response(status_code=304, headers=cache_headers(request, matched))
+    return None
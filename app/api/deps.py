@@ -1,10 +1,12 @@
 from typing import Generator, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, get_async_db
 from app.core.security import decode_token
 from app.models.models import User
+from app.services.user_cache import CurrentUser, user_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
@@ -16,9 +18,9 @@ def get_db() -> Generator:
         db.close()
 
 async def get_current_user(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token: str = Depends(oauth2_scheme)
-) -> User:
+) -> CurrentUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -33,22 +35,26 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = user_cache.get(int(user_id))
     if user is None:
-        raise credentials_exception
+        db_user = await db.get(User, int(user_id))
+        if db_user is None:
+            raise credentials_exception
+        user = CurrentUser.from_orm(db_user)
+        user_cache.set(user)
     
     return user
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
 async def get_current_employer(
-    current_user: User = Depends(get_current_active_user),
-) -> User:
+    current_user: CurrentUser = Depends(get_current_active_user),
+) -> CurrentUser:
     if not current_user.is_employer:
         raise HTTPException(
             status_code=403,
@@ -56,10 +62,12 @@ async def get_current_employer(
         )
     return current_user 
 
-# def get_current_admin_user(current_user: User = Depends(get_current_user)):
-#     if not current_user.is_admin:  # Assuming you have an `is_admin` flag
-#         raise HTTPException(
-#             status_code=status.HTTP_403_FORBIDDEN,
-#             detail="Admin privileges required",
-#         )
-#     return current_user
\ No newline at end of file
+async def get_current_admin(
+    current_user: CurrentUser = Depends(get_current_active_user),
+) -> CurrentUser:
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=403,
+            detail="The user doesn't have enough privileges"
+        )
+    return current_user
@@ -0,0 +1,47 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlalchemy.orm import load_only
+
+# Columns every list query loads regardless of ``fields``, because the
+# keyset cursor is built from them.
+CURSOR_COLUMNS = ("id", "created_at")
+
+
+def field_selector(schema: Type[BaseModel]) -> Callable[..., Optional[List[str]]]:
+    """Build a dependency for a ``fields=`` query parameter over ``schema``.
+
+    The parameter takes a comma-separated subset of the schema's fields and
+    resolves to the list of names, or ``None`` when it is not given.
+    """
+    allowed = list(schema.model_fields)
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None,
+            description=f"Comma-separated fields to return, any of: {', '.join(allowed)}",
+        ),
+    ) -> Optional[List[str]]:
+        if fields is None:
+            return None
+        names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        unknown = [name for name in names if name not in allowed]
+        if not names or unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown) or fields}")
+        return names
+
+    return dependency
+
+
+def load_only_fields(stmt: Select, model, names: Optional[Sequence[str]]) -> Select:
+    """Load just the selected columns (plus the cursor columns) from ``model``."""
+    if not names:
+        return stmt
+    columns = dict.fromkeys([*CURSOR_COLUMNS, *names])
+    return stmt.options(load_only(*(getattr(model, name) for name in columns)))
+
+
+def project(items: Sequence[Any], names: Sequence[str]) -> List[Dict[str, Any]]:
+    return [{name: getattr(item, name) for name in names} for item in items]
@@ -0,0 +1,80 @@
+import base64
+import json
+from datetime import datetime
+from typing import Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import Select, String, literal, tuple_
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a list endpoint; pass ``next_cursor`` back as ``cursor`` for the next one."""
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+class PageParams:
+    """Query parameters shared by every paginated endpoint."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    payload = json.dumps([created_at.isoformat(), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _created_at_param(value: datetime):
+    # SQLite stores server_default=now() timestamps as "YYYY-MM-DD HH:MM:SS"
+    # text, while SQLAlchemy binds datetimes with a ".000000" suffix that
+    # compares as a different string; bind the stored form instead.
+    if settings.DATABASE_URL.startswith("sqlite") and value.microsecond == 0:
+        return literal(value.strftime("%Y-%m-%d %H:%M:%S"), String)
+    return literal(value)
+
+
+def keyset(stmt: Select, model, params: PageParams) -> Select:
+    """Order ``stmt`` newest first on ``(created_at, id)`` and seek past the cursor.
+
+    One extra row is fetched so :func:`page` can tell whether another page
+    exists. With an index ending in ``(created_at, id)`` each page is a
+    single index range scan, however deep it is.
+    """
+    stmt = stmt.order_by(model.created_at.desc(), model.id.desc())
+    if params.cursor:
+        created_at, item_id = decode_cursor(params.cursor)
+        stmt = stmt.where(
+            tuple_(model.created_at, model.id) < tuple_(_created_at_param(created_at), literal(item_id))
+        )
+    return stmt.limit(params.limit + 1)
+
+
+def page(rows: Sequence, params: PageParams) -> dict:
+    """Build the ``{"items", "next_cursor"}`` envelope from rows fetched by :func:`keyset`."""
+    items = list(rows[:params.limit])
+    next_cursor = None
+    if len(rows) > params.limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,61 @@
+import json
+import logging
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.services.ai_limiter import AIOverloaded
+from app.services.ai_resilience import AIUnavailable
+
+logger = logging.getLogger(__name__)
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Stop nginx from buffering the stream until it completes
+    "X-Accel-Buffering": "no",
+}
+
+
+def _event(data: dict, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _events(first: Optional[str], chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    if first is None:
+        yield _event({}, event="done")
+        return
+    yield _event({"text": first})
+    try:
+        async for chunk in chunks:
+            yield _event({"text": chunk})
+    except Exception as e:
+        # The 200 status has already been sent, so failures become an event
+        logger.error(f"AI stream failed: {str(e)}")
+        yield _event({"detail": f"AI generation failed: {str(e)}"}, event="error")
+        return
+    yield _event({}, event="done")
+
+
+async def sse_response(chunks: AsyncIterator[str]) -> StreamingResponse:
+    """Send text chunks as Server-Sent Events.
+
+    Each chunk is a ``data: {"text": ...}`` message; the stream ends with an
+    ``event: done`` message, or ``event: error`` with a ``detail`` if the
+    generation fails part way. Clients append the texts in order.
+
+    The first chunk is awaited before the response starts, so a call the
+    AI limiter turns away still gets a 429, one with no fallback while the
+    model is down a 503, and one that fails outright a 500, like the
+    non-streaming endpoints.
+    """
+    try:
+        first = await chunks.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except (AIOverloaded, AIUnavailable):
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"AI generation failed: {str(e)}")
+    return StreamingResponse(_events(first, chunks), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -16,6 +16,7 @@ class Settings(BaseSettings):
 
     # Database configuration
     DATABASE_URL: str = Field(..., env='DATABASE_URL')
+    ASYNC_DATABASE_URL: Optional[str] = None  # derived from DATABASE_URL when unset
     POSTGRES_SERVER: Optional[str] = None
     POSTGRES_USER: Optional[str] = None
     POSTGRES_PASSWORD: Optional[str] = None
@@ -26,11 +27,128 @@ class Settings(BaseSettings):
     def SQLALCHEMY_DATABASE_URI(self) -> str:
         return self.DATABASE_URL
 
+    # Database connection pool (applied to the sync and async engines separately)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None  # Postgres only
+    DB_POOL_WAIT_WARN_MS: int = 100
+
+    # List endpoint pagination
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
+
+    # Response compression and conditional GET
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller bodies are sent as is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5  # used when the optional brotli package is installed
+    # Cache-Control for ETagged read endpoints, keyed by route path
+    # (e.g. {"/api/v1/blog/": "public, max-age=60"}); "no-cache" makes
+    # clients revalidate every time, which costs a 304 when nothing changed
+    CACHE_CONTROL_DEFAULT: str = "no-cache"
+    CACHE_CONTROL: Dict[str, str] = {}
+
     JWT_SECRET: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_ENTRIES: int = 10_000
+
+    # Login/register rate limiting: token buckets of BURST attempts, refilled
+    # at PER_MINUTE. Set RATE_LIMIT_SQLITE_PATH to share them between workers.
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_SQLITE_PATH: Optional[str] = None
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False  # only behind a proxy that sets it
+    LOGIN_IP_BURST: int = 30
+    LOGIN_IP_PER_MINUTE: float = 30.0
+    LOGIN_ACCOUNT_BURST: int = 5
+    LOGIN_ACCOUNT_PER_MINUTE: float = 2.0
+    REGISTER_IP_BURST: int = 5
+    REGISTER_IP_PER_MINUTE: float = 2.0
+
+    # "openai", or "fake" for the deterministic local stand-in (no key or network)
+    AI_BACKEND: str = "openai"
+    OPENAI_API_KEY: Optional[str] = None
+    AI_FAKE_SEED: int = 0
+    AI_FAKE_LATENCY_MS: float = 400.0  # median time to first token
+    AI_FAKE_LATENCY_SIGMA: float = 0.5  # log-normal spread around the median
+    AI_FAKE_TOKENS_PER_SECOND: float = 60.0  # 0 returns the whole text at once
+    AI_FAKE_ERROR_RATE: float = 0.0
+    AI_FAKE_ERROR_STATUS: int = 503
+    AI_FAKE_HANG_RATE: float = 0.0
+
+    # OpenAI request limits, per model and per process; the per-model dicts
+    # (JSON in the environment) override the defaults for named models
+    AI_MAX_CONCURRENCY: int = 8
+    AI_MODEL_CONCURRENCY: Dict[str, int] = {"gpt-4": 4}
+    AI_TOKENS_PER_MINUTE: int = 90_000
+    AI_MODEL_TOKENS_PER_MINUTE: Dict[str, int] = {"gpt-4": 10_000}
+    AI_QUEUE_MAX_DEPTH: int = 50
+    AI_QUEUE_MAX_WAIT_SECONDS: float = 20.0
+    AI_INTERACTIVE_SHARE: int = 3  # interactive calls let through per background call
+
+    # OpenAI call deadlines, retries and circuit breaker
+    AI_TIMEOUT_SECONDS: float = 30.0
+    AI_METHOD_TIMEOUT_SECONDS: Dict[str, float] = {"generate_contract": 90.0, "generate_blog_content": 60.0}
+    AI_STREAM_IDLE_SECONDS: float = 20.0
+    AI_MAX_RETRIES: int = 2
+    AI_RETRY_BASE_SECONDS: float = 0.5
+    AI_RETRY_MAX_SECONDS: float = 8.0
+    AI_BREAKER_FAILURE_THRESHOLD: int = 5
+    AI_BREAKER_RESET_SECONDS: float = 30.0
+
+    # AI completion cache
+    AI_CACHE_ENABLED: bool = True
+    AI_CACHE_TTL_SECONDS: int = 60 * 60 * 24
+    AI_CACHE_MAX_ENTRIES: int = 1024
+    AI_CACHE_SQLITE_PATH: Optional[str] = None
+    AI_CACHE_SQLITE_MAX_ENTRIES: int = 100_000
+    AI_CACHE_DISABLED_METHODS: List[str] = []
+
+    # Candidate/job matching
+    MATCH_VECTOR_DIM: int = 256
+    AI_MATCH_EXPLAIN: bool = False
+    VECTOR_STORE_PATH: str = "data/vectors"
+    VECTOR_STORE_NLIST: int = 1024
+    VECTOR_STORE_NPROBE: int = 16
+    SKILL_INDEX_REFRESH_SECONDS: float = 30.0
+
+    # Background match scoring
+    SCORING_WORKER_ENABLED: bool = True
+    SCORING_CONCURRENCY: int = 4
+    SCORING_BATCH_SIZE: int = 20
+    SCORING_POLL_INTERVAL_SECONDS: float = 1.0
+    SCORING_MAX_ATTEMPTS: int = 5
+    SCORING_RETRY_BASE_SECONDS: int = 5
+    SCORING_LOCK_TIMEOUT_SECONDS: int = 300
+
+    # Batch rescoring of all applications for a job
+    RESCORE_WORKER_ENABLED: bool = True
+    RESCORE_CHUNK_SIZE: int = 500
+    RESCORE_POLL_INTERVAL_SECONDS: float = 2.0
+    RESCORE_LOCK_TIMEOUT_SECONDS: int = 120
 
-    OPENAI_API_KEY: str
+    # Email delivery
+    SMTP_HOST: Optional[str] = None
+    SMTP_PORT: int = 587
+    SMTP_USER: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_USE_TLS: bool = True
+    SMTP_IDLE_TIMEOUT_SECONDS: int = 60
+    EMAIL_FROM: str = "no-reply@ai-recruitment.local"
+    EMAIL_WORKER_ENABLED: bool = True
+    EMAIL_BATCH_SIZE: int = 50
+    EMAIL_POLL_INTERVAL_SECONDS: float = 2.0
+    EMAIL_MAX_ATTEMPTS: int = 6
+    EMAIL_RETRY_BASE_SECONDS: int = 30
+    EMAIL_LOCK_TIMEOUT_SECONDS: int = 300
+    EMAIL_SCORE_WAIT_SECONDS: int = 120
 
     class Config:
         case_sensitive = True
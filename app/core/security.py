@@ -1,10 +1,16 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes made with a different cost are reported by verify_and_update so
+# login can replace them.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
@@ -27,4 +33,69 @@ def decode_token(token: str) -> dict:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
-        return None 
\ No newline at end of file
+        return None
+
+class PasswordHasher:
+    """Runs bcrypt on a small dedicated thread pool.
+
+    bcrypt takes hundreds of milliseconds of CPU by design; run inline in an
+    ``async def`` handler it stalls every request on the event loop. The
+    pool size caps how many cores password work can take, and requests
+    beyond it wait in the executor queue, which ``stats`` reports.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.max_queued = 0
+        self.total_wait = 0.0
+        self.total_run = 0.0
+
+    def _run(self, fn: Callable, args: tuple, submitted: float):
+        started = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            self.total_wait += started - submitted
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+                self.total_run += time.perf_counter() - started
+
+    async def _submit(self, fn: Callable, *args):
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._run, fn, args, time.perf_counter())
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(pwd_context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Check a password; the second item is a new hash when the stored one uses an outdated cost."""
+        return await self._submit(pwd_context.verify_and_update, password, hashed_password)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            completed = self.completed
+            return {
+                "workers": self.workers,
+                "rounds": settings.BCRYPT_ROUNDS,
+                "queued": self.queued,
+                "running": self.running,
+                "max_queued": self.max_queued,
+                "completed": completed,
+                "wait_ms_avg": round(self.total_wait / completed * 1000, 3) if completed else 0.0,
+                "run_ms_avg": round(self.total_run / completed * 1000, 3) if completed else 0.0,
+            }
+
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS)
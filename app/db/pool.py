@@ -0,0 +1,150 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Number of recent checkout waits kept for the percentile figures.
+WAIT_SAMPLE_SIZE = 2048
+
+
+class PoolMetrics:
+    """Checkout counters and recent wait times for one connection pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.slow_waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.peak_overflow = 0
+        self._waits = deque(maxlen=WAIT_SAMPLE_SIZE)
+        self._lock = threading.Lock()
+
+    def record_wait(self, pool: QueuePool, seconds: float) -> None:
+        overflow = max(pool.overflow(), 0)
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+            self._waits.append(seconds)
+        if seconds * 1000 >= settings.DB_POOL_WAIT_WARN_MS:
+            with self._lock:
+                self.slow_waits += 1
+            logger.warning(
+                f"Waited {seconds * 1000:.0f}ms for a {self.name} database connection ({pool.status()})"
+            )
+
+    def record_timeout(self, pool: QueuePool, seconds: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+        logger.error(
+            f"Gave up after {seconds * 1000:.0f}ms waiting for a {self.name} database connection ({pool.status()})"
+        )
+
+    def _percentile(self, waits, fraction: float) -> float:
+        return waits[min(int(len(waits) * fraction), len(waits) - 1)] if waits else 0.0
+
+    def stats(self, pool: QueuePool) -> Dict:
+        with self._lock:
+            waits = sorted(self._waits)
+            checkouts = self.checkouts
+            return {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "peak_overflow": self.peak_overflow,
+                "checkouts": checkouts,
+                "timeouts": self.timeouts,
+                "slow_waits": self.slow_waits,
+                "wait_ms_avg": round(self.total_wait / checkouts * 1000, 3) if checkouts else 0.0,
+                "wait_ms_p50": round(self._percentile(waits, 0.5) * 1000, 3),
+                "wait_ms_p95": round(self._percentile(waits, 0.95) * 1000, 3),
+                "wait_ms_max": round(self.max_wait * 1000, 3),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout from the underlying queue.
+
+    ``_do_get`` is where a caller blocks when the pool and its overflow are
+    exhausted, so the time spent there is the time a request starved.
+    """
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout(self, time.perf_counter() - start)
+            raise
+        self.metrics.record_wait(self, time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith(":"))
+
+
+def engine_options(url: str, is_async: bool = False) -> Dict:
+    """Keyword arguments for create_engine/create_async_engine from the pool settings."""
+    if _is_memory_sqlite(url) or (is_async and url.startswith("sqlite")):
+        # In-memory SQLite lives in a single connection, and pooled aiosqlite
+        # connections pin a worker thread and event loop each; keep
+        # SQLAlchemy's default pool for both.
+        return {}
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    timeout = settings.DB_STATEMENT_TIMEOUT_MS
+    if timeout and url.startswith("postgres"):
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(timeout)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+
+def instrument(engine, name: str) -> None:
+    """Attach a PoolMetrics to the engine's pool if it is an instrumented one."""
+    pool = engine.pool
+    if isinstance(pool, _InstrumentedPoolMixin):
+        pool.metrics = PoolMetrics(name)
+
+
+def pool_stats(engine) -> Dict:
+    pool = engine.pool
+    if not isinstance(pool, _InstrumentedPoolMixin):
+        return {"pool": type(pool).__name__, "instrumented": False}
+    return pool.metrics.stats(pool)
@@ -0,0 +1,82 @@
+from typing import Optional, Sequence
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import joinedload, load_only
+
+from app.models.models import Application, Candidate, JobPosting, User
+
+# Every relationship ApplicationResponse serializes is many-to-one, so one
+# LEFT OUTER JOIN per relationship loads a whole page in a single statement.
+# Lazy loading would cost up to three extra SELECTs per row, and is not
+# available at all on an AsyncSession.
+APPLICATION_DETAIL_OPTIONS = (
+    joinedload(Application.job),
+    joinedload(Application.candidate).joinedload(Candidate.user),
+)
+
+
+def application_with_details() -> Select:
+    """Select applications with their job, candidate and candidate user loaded.
+
+    Add ``where``/``order_by`` clauses as needed; works with sync and async
+    sessions alike.
+    """
+    return select(Application).options(*APPLICATION_DETAIL_OPTIONS)
+
+
+# Same joins, restricted to the columns ApplicationSummary shows: the job
+# description and the candidate's bio, experience and education stay in
+# the database.
+APPLICATION_SUMMARY_OPTIONS = (
+    joinedload(Application.job).load_only(
+        JobPosting.id, JobPosting.title, JobPosting.location, JobPosting.employer_id
+    ),
+    joinedload(Application.candidate)
+    .load_only(Candidate.id, Candidate.user_id, Candidate.skills)
+    .joinedload(Candidate.user)
+    .load_only(User.id, User.email, User.full_name),
+)
+
+
+def application_summaries() -> Select:
+    """Like :func:`application_with_details`, loading only what ApplicationSummary needs."""
+    return select(Application).options(*APPLICATION_SUMMARY_OPTIONS)
+
+
+SHORTLIST_COLUMNS = (
+    Application.id,
+    Application.candidate_id,
+    Application.status,
+    Application.ai_match_score,
+    Application.score_status,
+    Application.created_at,
+    User.full_name,
+    User.email,
+    Candidate.skills,
+)
+SHORTLIST_PROFILE_COLUMNS = (Candidate.bio, Candidate.experience, Candidate.education)
+
+
+def application_shortlist(
+    job_id: int,
+    k: int,
+    statuses: Optional[Sequence[str]] = None,
+    include_profile: bool = False,
+) -> Select:
+    """Select the ``k`` best scored applications for a job as plain rows.
+
+    Reads ix_applications_job_id_ai_match_score_id in order and stops after
+    ``k`` rows, so the cost does not grow with the number of applicants.
+    Only the columns a shortlist shows are fetched; the experience and
+    education JSON come along only with ``include_profile``.
+    """
+    columns = SHORTLIST_COLUMNS + (SHORTLIST_PROFILE_COLUMNS if include_profile else ())
+    stmt = (
+        select(*columns)
+        .join(Candidate, Application.candidate_id == Candidate.id)
+        .join(User, Candidate.user_id == User.id)
+        .where(Application.job_id == job_id, Application.ai_match_score.is_not(None))
+    )
+    if statuses:
+        stmt = stmt.where(Application.status.in_(statuses))
+    return stmt.order_by(Application.ai_match_score.desc(), Application.id).limit(k)
@@ -1,12 +1,21 @@
-from fastapi import FastAPI
+import math
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
 from app.api.api_v1.api import api_router
+from app.services.ai_limiter import AIOverloaded
+from app.services.ai_resilience import AIUnavailable
+from app.services.scoring_queue import scoring_worker
+from app.services.email_outbox import email_worker
+from app.services.rescore import rescore_worker
 
 app = FastAPI(
     title="AI Recruitment API",
     description="API for AI-powered recruitment and staffing platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -18,9 +27,48 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
+@app.exception_handler(AIOverloaded)
+async def ai_overloaded_handler(request: Request, exc: AIOverloaded):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "The AI service is busy, please try again shortly"},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))},
+    )
+
+@app.exception_handler(AIUnavailable)
+async def ai_unavailable_handler(request: Request, exc: AIUnavailable):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "The AI service is temporarily unavailable, please try again later"},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))},
+    )
+
+@app.on_event("startup")
+async def start_background_workers():
+    if settings.SCORING_WORKER_ENABLED:
+        scoring_worker.start()
+    if settings.EMAIL_WORKER_ENABLED:
+        email_worker.start()
+    if settings.RESCORE_WORKER_ENABLED:
+        rescore_worker.start()
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    await scoring_worker.stop()
+    await email_worker.stop()
+    await rescore_worker.stop()
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to AI Recruitment API"} 
\ No newline at end of file
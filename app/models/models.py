@@ -1,6 +1,6 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text, DateTime, JSON
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Boolean, Column, DDL, ForeignKey, Index, Integer, String, Text, DateTime, JSON, UniqueConstraint, event
+from sqlalchemy.orm import relationship, synonym
+from sqlalchemy.sql import func, literal_column
 from app.db.base_class import Base
 
 class User(Base):
@@ -18,11 +18,15 @@ class User(Base):
 
     blog_posts = relationship("BlogPost", back_populates="author")
 
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
+
 class Candidate(Base):
     __tablename__ = "candidates"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     bio = Column(Text)
     skills = Column(JSON)
     experience = Column(JSON)
@@ -45,9 +49,18 @@ class JobPosting(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Bumped by every UPDATE; list ETags hash it with updated_at, which only
+    # has one-second resolution on SQLite
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version + 1"))
 
     employer = relationship("User", backref="job_postings")
 
+    __table_args__ = (
+        Index("ix_job_postings_created_at_id", "created_at", "id"),
+        Index("ix_job_postings_employer_id_created_at_id", "employer_id", "created_at", "id"),
+        Index("ix_job_postings_is_active_created_at_id", "is_active", "created_at", "id"),
+    )
+
 class Application(Base):
     __tablename__ = "applications"
 
@@ -56,17 +69,97 @@ class Application(Base):
     candidate_id = Column(Integer, ForeignKey("candidates.id"))
     status = Column(String)  # pending, accepted, rejected
     ai_match_score = Column(Integer)
+    score_status = Column(String, default="scoring", server_default="scored")  # scoring, scored, failed
+    # Bumped on every score write; a scoring task only writes if it is
+    # unchanged since the task read the profile, so a late task cannot
+    # overwrite a newer batch rescore
+    score_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     job = relationship("JobPosting", backref="applications")
     candidate = relationship("Candidate", backref="applications")
 
+    __table_args__ = (
+        # One application per candidate per job; also serves lookups by job_id
+        UniqueConstraint("job_id", "candidate_id", name="uq_applications_job_id_candidate_id"),
+        Index("ix_applications_job_id_created_at_id", "job_id", "created_at", "id"),
+        Index("ix_applications_candidate_id_created_at_id", "candidate_id", "created_at", "id"),
+        # Walks a job's applications in id order for batch rescoring
+        Index("ix_applications_job_id_id", "job_id", "id"),
+        # Serves a job's shortlist best score first without sorting
+        Index("ix_applications_job_id_ai_match_score_id", "job_id", ai_match_score.desc(), "id"),
+    )
+
+class ScoringTask(Base):
+    __tablename__ = "scoring_tasks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    application_id = Column(Integer, ForeignKey("applications.id", ondelete="CASCADE"), nullable=False, index=True)
+    status = Column(String, nullable=False, default="queued")  # queued, running, done, failed, superseded
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+    run_after = Column(DateTime(timezone=True), server_default=func.now())
+    locked_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    application = relationship("Application")
+
+    __table_args__ = (
+        Index("ix_scoring_tasks_status_run_after", "status", "run_after"),
+    )
+
+class RescoreRun(Base):
+    __tablename__ = "rescore_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("job_postings.id", ondelete="CASCADE"), nullable=False)
+    status = Column(String, nullable=False, default="queued")  # queued, running, done, failed, superseded
+    total = Column(Integer, nullable=False, default=0)
+    scored = Column(Integer, nullable=False, default=0)
+    # Highest application id written so far; a resumed run continues after it
+    last_application_id = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+    locked_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_rescore_runs_job_id_id", "job_id", "id"),
+        Index("ix_rescore_runs_status", "status"),
+    )
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    template = Column(String, nullable=False)
+    context = Column(JSON, nullable=False)
+    application_id = Column(Integer, ForeignKey("applications.id", ondelete="SET NULL"), index=True)
+    status = Column(String, nullable=False, default="queued")  # queued, sending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+    run_after = Column(DateTime(timezone=True), server_default=func.now())
+    locked_at = Column(DateTime(timezone=True))
+    sent_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    application = relationship("Application")
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_run_after", "status", "run_after"),
+    )
+
 class Contract(Base):
     __tablename__ = "contracts"
 
     id = Column(Integer, primary_key=True, index=True)
-    application_id = Column(Integer, ForeignKey("applications.id"))
+    application_id = Column(Integer, ForeignKey("applications.id"), index=True)
     content = Column(Text)
     status = Column(String)  # draft, sent, signed
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -78,14 +171,23 @@ class BlogPost(Base):
     __tablename__ = "blog_posts"
 
     id = Column(Integer, primary_key=True, index=True)
-    author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    author_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     title = Column(Text, nullable=False)
     content = Column(Text, nullable=False)
     image_url = Column(Text)
     created_date = Column(DateTime(timezone=True), server_default=func.now())
     published_date = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # See JobPosting.version
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version + 1"))
+    # The keyset pagination helpers order and build cursors on created_at
+    created_at = synonym("created_date")
 
     author = relationship("User", back_populates="blog_posts")
+
+    __table_args__ = (
+        Index("ix_blog_posts_created_date_id", "created_date", "id"),
+    )
     
 class ContractTemplate(Base):
     __tablename__ = "contract_templates"
@@ -95,6 +197,56 @@ class ContractTemplate(Base):
     contract_title = Column(Text, nullable=False)
     description = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # See JobPosting.version
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version + 1"))
+    author_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     
     author = relationship("User")
+
+    __table_args__ = (
+        Index("ix_contract_templates_created_at_id", "created_at", "id"),
+    )
+
+# Full-text search over job postings (see app/services/job_search.py). The
+# index lives outside the mapped columns because each backend builds it
+# differently: Postgres keeps a generated tsvector column with a GIN index,
+# SQLite an external-content FTS5 table kept in sync by triggers.
+JOB_SEARCH_DDL = {
+    "postgresql": [
+        """ALTER TABLE job_postings ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(requirements::text, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        ) STORED""",
+        "CREATE INDEX ix_job_postings_search_vector ON job_postings USING gin (search_vector)",
+    ],
+    "sqlite": [
+        """CREATE VIRTUAL TABLE job_postings_fts USING fts5(
+            title, requirements, description, content='job_postings', content_rowid='id'
+        )""",
+        """CREATE TRIGGER job_postings_fts_ai AFTER INSERT ON job_postings BEGIN
+            INSERT INTO job_postings_fts (rowid, title, requirements, description)
+            VALUES (new.id, new.title, new.requirements, new.description);
+        END""",
+        """CREATE TRIGGER job_postings_fts_ad AFTER DELETE ON job_postings BEGIN
+            INSERT INTO job_postings_fts (job_postings_fts, rowid, title, requirements, description)
+            VALUES ('delete', old.id, old.title, old.requirements, old.description);
+        END""",
+        """CREATE TRIGGER job_postings_fts_au AFTER UPDATE ON job_postings BEGIN
+            INSERT INTO job_postings_fts (job_postings_fts, rowid, title, requirements, description)
+            VALUES ('delete', old.id, old.title, old.requirements, old.description);
+            INSERT INTO job_postings_fts (rowid, title, requirements, description)
+            VALUES (new.id, new.title, new.requirements, new.description);
+        END""",
+    ],
+}
+
+for dialect, statements in JOB_SEARCH_DDL.items():
+    for statement in statements:
+        event.listen(JobPosting.__table__, "after_create", DDL(statement).execute_if(dialect=dialect))
+event.listen(
+    JobPosting.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS job_postings_fts").execute_if(dialect="sqlite"),
+)
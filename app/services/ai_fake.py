@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import logging
+import random
+import re
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+import openai
+from openai.types import CompletionUsage
+from openai.types.chat import ChatCompletion, ChatCompletionChunk, ChatCompletionMessage
+from openai.types.chat import chat_completion, chat_completion_chunk
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+TOKENS_PER_WORD = 4 / 3
+
+WORDS = (
+    "team product customers growth quality delivery platform data systems design "
+    "experience projects results impact ownership collaboration reliable scalable "
+    "modern practices tools process strategy goals clear focus develop support "
+    "improve build lead deliver manage review plan ensure maintain engage"
+).split()
+
+ERRORS = {
+    400: openai.BadRequestError,
+    401: openai.AuthenticationError,
+    429: openai.RateLimitError,
+}
+
+
+def _rng(model: str, messages: List[Dict], temperature: float, max_tokens: int) -> random.Random:
+    """A generator seeded by the request, so equal requests get equal text."""
+    digest = hashlib.sha256(repr((model, messages, temperature, max_tokens)).encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 16))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 4) -> str:
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def _bullets(rng: random.Random, count: int = 4) -> str:
+    return "\n".join(f"- {_sentence(rng)}" for _ in range(count))
+
+
+def _search(pattern: str, text: str, default: str) -> str:
+    match = re.search(pattern, text)
+    return match.group(1).strip() if match else default
+
+
+def fake_text(model: str, messages: List[Dict], temperature: float, max_tokens: int) -> str:
+    """Deterministic text shaped like what the prompt asks for.
+
+    Recognises the prompts AIService sends, e.g. match analyses start with
+    a ``Score: N/100`` line and blog articles with the ``Title:`` prefix
+    that generate_blog_content strips. Output is capped near ``max_tokens``.
+    """
+    rng = _rng(model, messages, temperature, max_tokens)
+    prompt = "\n".join(str(message.get("content") or "") for message in messages)
+
+    if "Analyze the match" in prompt:
+        score = _search(r"computed matching score is (\d+)/100", prompt, str(rng.randint(40, 95)))
+        text = f"Score: {score}/100\n\nStrengths:\n{_bullets(rng, 3)}\n\nGaps:\n{_bullets(rng, 2)}"
+    elif "Review and enhance this job posting" in prompt:
+        text = f"Overall the posting is clear and professional.\n\nSuggestions:\n{_bullets(rng, 3)}\n\nNo compliance issues found."
+    elif "job description" in prompt:
+        title = _search(r"Job Title: (.+)", prompt, "Team Member")
+        text = (
+            f"{title}\n\nOverview\n{_paragraph(rng)}\n\nKey Responsibilities\n{_bullets(rng)}"
+            f"\n\nRequired Qualifications\n{_bullets(rng)}\n\nWhat We Offer\n{_bullets(rng, 3)}"
+        )
+    elif "employment contract" in prompt:
+        sections = ["Parties", "Terms and Conditions", "Compensation and Benefits", "Work Schedule and Location",
+                    "Confidentiality", "Termination", "Signatures"]
+        text = "EMPLOYMENT CONTRACT\n\n" + "\n\n".join(
+            f"{number}. {section}\n{_paragraph(rng, 3)}" for number, section in enumerate(sections, 1)
+        )
+    elif "blog article" in prompt:
+        title = _search(r"blog article about: '(.+)'", prompt, "Untitled")
+        text = f"Title: {title}\n\n" + "\n\n".join(_paragraph(rng, 5) for _ in range(4))
+    else:
+        text = "\n\n".join(_paragraph(rng) for _ in range(3))
+
+    words = text.split(" ")
+    limit = int(max_tokens / TOKENS_PER_WORD)
+    return " ".join(words[:limit]) if len(words) > limit else text
+
+
+def _usage(messages: List[Dict], text: str) -> CompletionUsage:
+    prompt_tokens = sum(len(str(message.get("content") or "")) for message in messages) // CHARS_PER_TOKEN
+    completion_tokens = int(len(text.split()) * TOKENS_PER_WORD)
+    return CompletionUsage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+    )
+
+
+def _status_error(status_code: int) -> openai.APIStatusError:
+    request = httpx.Request("POST", "https://fake.local/v1/chat/completions")
+    response = httpx.Response(status_code, request=request)
+    error_class = ERRORS.get(status_code, openai.InternalServerError if status_code >= 500 else openai.APIStatusError)
+    return error_class(f"Injected fake error {status_code}", response=response, body=None)
+
+
+class FakeCompletions:
+    """Stands in for ``AsyncOpenAI().chat.completions``.
+
+    Text depends only on the request. Latency and failures are drawn from
+    a generator seeded with ``AI_FAKE_SEED``: time to first token is
+    log-normal around ``AI_FAKE_LATENCY_MS``, after which text arrives at
+    ``AI_FAKE_TOKENS_PER_SECOND``. ``AI_FAKE_ERROR_RATE`` of calls fail with
+    ``AI_FAKE_ERROR_STATUS`` and ``AI_FAKE_HANG_RATE`` never answer.
+    """
+
+    def __init__(self, seed: int):
+        self._random = random.Random(seed)
+        self.calls = 0
+
+    def _first_token_delay(self) -> float:
+        median = settings.AI_FAKE_LATENCY_MS / 1000
+        if median <= 0:
+            return 0.0
+        return self._random.lognormvariate(0, settings.AI_FAKE_LATENCY_SIGMA) * median
+
+    def _token_delay(self) -> float:
+        rate = settings.AI_FAKE_TOKENS_PER_SECOND
+        return 1 / rate if rate > 0 else 0.0
+
+    async def _before_first_token(self) -> None:
+        roll = self._random.random()
+        delay = self._first_token_delay()
+        if roll < settings.AI_FAKE_HANG_RATE:
+            await asyncio.Event().wait()
+        await asyncio.sleep(delay)
+        if roll < settings.AI_FAKE_HANG_RATE + settings.AI_FAKE_ERROR_RATE:
+            raise _status_error(settings.AI_FAKE_ERROR_STATUS)
+
+    async def create(
+        self,
+        model: str,
+        messages: List[Dict],
+        temperature: float = 1.0,
+        max_tokens: Optional[int] = None,
+        stream: bool = False,
+        **kwargs,
+    ):
+        self.calls += 1
+        text = fake_text(model, messages, temperature, max_tokens or 1024)
+        completion_id = f"chatcmpl-fake-{hashlib.sha1(text.encode('utf-8')).hexdigest()[:24]}"
+        await self._before_first_token()
+        if stream:
+            return self._stream(completion_id, model, text)
+
+        await asyncio.sleep(self._token_delay() * len(text.split()) * TOKENS_PER_WORD)
+        return ChatCompletion(
+            id=completion_id,
+            object="chat.completion",
+            created=int(time.time()),
+            model=model,
+            choices=[chat_completion.Choice(
+                index=0,
+                finish_reason="stop",
+                message=ChatCompletionMessage(role="assistant", content=text),
+            )],
+            usage=_usage(messages, text),
+        )
+
+    async def _stream(self, completion_id: str, model: str, text: str) -> AsyncIterator[ChatCompletionChunk]:
+        created = int(time.time())
+        words = text.split(" ")
+        delay = self._token_delay() * TOKENS_PER_WORD
+        for index, word in enumerate(words):
+            if index:
+                await asyncio.sleep(delay)
+            content = word if index == 0 else " " + word
+            yield ChatCompletionChunk(
+                id=completion_id,
+                object="chat.completion.chunk",
+                created=created,
+                model=model,
+                choices=[chat_completion_chunk.Choice(
+                    index=0,
+                    finish_reason=None,
+                    delta=chat_completion_chunk.ChoiceDelta(role="assistant" if index == 0 else None, content=content),
+                )],
+            )
+        yield ChatCompletionChunk(
+            id=completion_id,
+            object="chat.completion.chunk",
+            created=created,
+            model=model,
+            choices=[chat_completion_chunk.Choice(index=0, finish_reason="stop", delta=chat_completion_chunk.ChoiceDelta())],
+        )
+
+
+class FakeChat:
+    def __init__(self, completions: FakeCompletions):
+        self.completions = completions
+
+
+class FakeAsyncOpenAI:
+    """Drop-in for the parts of ``AsyncOpenAI`` that AIService uses."""
+
+    def __init__(self, seed: int = 0):
+        self.chat = FakeChat(FakeCompletions(seed))
+        logger.info("Using the fake AI backend; no OpenAI requests will be made")
@@ -0,0 +1,91 @@
+"""Plain-template stand-ins for AI generated text.
+
+AIService serves these when a model's circuit is open or its retries run
+out, so a page still gets a usable starting point it can edit.
+"""
+from typing import Dict, List
+
+
+def _bullets(items: List[str]) -> str:
+    return "\n".join(f"- {item}" for item in items if item)
+
+
+def job_description(title: str, requirements: List[str], company_info: str) -> str:
+    sections = [
+        f"{title}",
+        f"About us\n{company_info.strip()}" if company_info and company_info.strip() else "",
+        f"The role\nWe are looking for a {title} to join our team.",
+        f"Requirements\n{_bullets(requirements)}" if requirements else "",
+        "How to apply\nSubmit your application through this posting and we will be in touch.",
+    ]
+    return "\n\n".join(section for section in sections if section)
+
+
+def candidate_bio(experience: List[Dict], education: List[Dict], skills: List[str]) -> str:
+    sentences = []
+    if experience:
+        latest = experience[0]
+        sentences.append(f"I am a {latest.get('position', 'professional')} at {latest.get('company', 'my current company')}.")
+        if len(experience) > 1:
+            earlier = ", ".join(
+                f"{exp.get('position')} at {exp.get('company')}" for exp in experience[1:3] if exp.get("position")
+            )
+            if earlier:
+                sentences.append(f"Previously I worked as {earlier}.")
+    if education:
+        edu = education[0]
+        sentences.append(
+            f"I hold a {edu.get('degree', 'degree')} in {edu.get('field', 'my field')} from {edu.get('institution', 'university')}."
+        )
+    if skills:
+        sentences.append(f"My skills include {', '.join(skills[:10])}.")
+    return " ".join(sentences)
+
+
+def contract_description(contract_title: str) -> str:
+    return (
+        f"This {contract_title} sets out the terms agreed between the parties, including the scope of work, "
+        "duration, compensation, confidentiality obligations and the conditions under which either party "
+        "may end the agreement."
+    )
+
+
+def contract(job_data: Dict, candidate_data: Dict) -> str:
+    salary = job_data.get("salary_range") or {}
+    name = (candidate_data.get("user") or {}).get("full_name") or candidate_data.get("name") or "the Employee"
+    title = job_data.get("title", "the Position")
+    return f"""EMPLOYMENT CONTRACT
+
+1. Parties
+This contract is made between the Employer and {name} (the "Employee").
+
+2. Position
+The Employee is employed as {title}, based in {job_data.get('location', 'a location agreed by the parties')}.
+
+3. Compensation
+Annual salary within the range {salary.get('currency', '')} {salary.get('min', '')} - {salary.get('max', '')}, as agreed in writing.
+
+4. Work Schedule and Location
+Working hours and place of work are as agreed between the parties.
+
+5. Confidentiality
+The Employee keeps the Employer's confidential information private during and after employment.
+
+6. Termination
+Either party may end this contract with written notice as required by applicable law.
+
+7. Signatures
+
+Employer: ____________________    Date: __________
+
+Employee: ____________________    Date: __________
+"""
+
+
+def job_posting_review(job_posting: Dict) -> Dict:
+    return {
+        "feedback": "Automated review is temporarily unavailable; this posting has not been reviewed.",
+        "is_compliant": None,
+        "reviewed": False,
+        "original_posting": job_posting,
+    }
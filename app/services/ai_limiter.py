@@ -0,0 +1,259 @@
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Deque, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, BACKGROUND)
+
+# Token budgets are tracked over a sliding window of this length.
+WINDOW_SECONDS = 60.0
+# Rough characters per token for estimating prompt size before the call.
+CHARS_PER_TOKEN = 4
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar("ai_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def background_priority():
+    """Queue AI calls made inside the block behind interactive requests."""
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class AIOverloaded(Exception):
+    """Raised instead of queueing an AI call that could not start in time."""
+
+    def __init__(self, model: str, reason: str, retry_after: float):
+        super().__init__(f"{model}: {reason}")
+        self.model = model
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def estimate_tokens(messages: List[Dict], max_tokens: int) -> int:
+    """Prompt tokens estimated from its length, plus the completion allowance.
+
+    Providers charge ``max_tokens`` against the rate limit up front, so
+    the estimate does too.
+    """
+    chars = sum(len(str(message.get("content") or "")) for message in messages)
+    return chars // CHARS_PER_TOKEN + max_tokens
+
+
+class Reservation:
+    def __init__(self, priority: str, tokens: int):
+        self.priority = priority
+        self.entry = [0.0, tokens]
+        self.future: Optional[asyncio.Future] = None
+        self.queued_at = time.monotonic()
+        self.used: Optional[int] = None  # actual tokens, once the response reports them
+
+    @property
+    def tokens(self) -> int:
+        return self.entry[1]
+
+
+class ModelLimiter:
+    """Concurrency cap, token-per-minute budget and wait queue for one model.
+
+    Waiting callers are kept in one FIFO per priority. When both have
+    callers, a background one is let through after every
+    ``AI_INTERACTIVE_SHARE`` interactive ones, so a scoring backlog cannot
+    starve users and is not starved by them either. Callers are refused at
+    once when their queue is ``AI_QUEUE_MAX_DEPTH`` deep, and after
+    ``AI_QUEUE_MAX_WAIT_SECONDS`` in it.
+
+    The concurrency cap adapts to the provider: a 429 halves it, and each
+    success raises it again by ``1 / limit``, back up to the configured
+    maximum.
+    """
+
+    def __init__(self, model: str, concurrency: int, tokens_per_minute: int):
+        self.model = model
+        self.max_concurrency = concurrency
+        self.limit = float(concurrency)
+        self.tokens_per_minute = tokens_per_minute
+        self.running = 0
+        self._waiters: Dict[str, Deque[Reservation]] = {priority: deque() for priority in PRIORITIES}
+        self._interactive_streak = 0
+        self._window: Deque[list] = deque()
+        self._window_tokens = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.granted = {priority: 0 for priority in PRIORITIES}
+        self.rejected = {"queue_full": 0, "wait_timeout": 0}
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _expire(self, now: float) -> None:
+        while self._window and self._window[0][0] <= now - WINDOW_SECONDS:
+            self._window_tokens -= self._window.popleft()[1]
+
+    def _fits(self, tokens: int, now: float) -> bool:
+        self._expire(now)
+        # A request larger than the whole budget still runs, alone
+        return self._window_tokens + tokens <= self.tokens_per_minute or not self._window
+
+    def _next_priority(self) -> Optional[str]:
+        interactive, background = self._waiters[INTERACTIVE], self._waiters[BACKGROUND]
+        if interactive and background:
+            return BACKGROUND if self._interactive_streak >= settings.AI_INTERACTIVE_SHARE else INTERACTIVE
+        if interactive:
+            return INTERACTIVE
+        if background:
+            return BACKGROUND
+        return None
+
+    def _dispatch(self) -> None:
+        self._timer = None
+        now = time.monotonic()
+        while self.running < int(self.limit):
+            priority = self._next_priority()
+            if priority is None:
+                return
+            reservation = self._waiters[priority][0]
+            if not self._fits(reservation.tokens, now):
+                # Wake up when the oldest usage leaves the window
+                delay = self._window[0][0] + WINDOW_SECONDS - now
+                self._timer = asyncio.get_running_loop().call_later(max(delay, 0.01), self._dispatch)
+                return
+            self._waiters[priority].popleft()
+            self._interactive_streak = self._interactive_streak + 1 if priority == INTERACTIVE else 0
+            self._grant(reservation, now)
+            reservation.future.set_result(None)
+
+    def _grant(self, reservation: Reservation, now: float) -> None:
+        self.running += 1
+        reservation.entry[0] = now
+        self._window.append(reservation.entry)
+        self._window_tokens += reservation.tokens
+        self.granted[reservation.priority] += 1
+        waited = now - reservation.queued_at
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def _retry_after(self) -> float:
+        queued = sum(len(waiters) for waiters in self._waiters.values())
+        return max(1.0, queued / max(int(self.limit), 1))
+
+    async def acquire(self, tokens: int, priority: str) -> Reservation:
+        reservation = Reservation(priority, tokens)
+        now = time.monotonic()
+        if (
+            self.running < int(self.limit)
+            and not any(self._waiters.values())
+            and self._fits(tokens, now)
+        ):
+            self._grant(reservation, now)
+            return reservation
+
+        waiters = self._waiters[priority]
+        if len(waiters) >= settings.AI_QUEUE_MAX_DEPTH:
+            self.rejected["queue_full"] += 1
+            raise AIOverloaded(self.model, f"{priority} queue is full", self._retry_after())
+
+        reservation.future = asyncio.get_running_loop().create_future()
+        waiters.append(reservation)
+        if self._timer is None:
+            self._dispatch()
+        try:
+            await asyncio.wait_for(asyncio.shield(reservation.future), settings.AI_QUEUE_MAX_WAIT_SECONDS)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if reservation.future.done():
+                # Granted just as the wait ended; hand the slot back
+                self.release(reservation)
+            else:
+                waiters.remove(reservation)
+                reservation.future.cancel()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self.rejected["wait_timeout"] += 1
+            raise AIOverloaded(self.model, f"no capacity within {settings.AI_QUEUE_MAX_WAIT_SECONDS:.0f}s", self._retry_after())
+        return reservation
+
+    def release(self, reservation: Reservation, used_tokens: Optional[int] = None, throttled: bool = False) -> None:
+        self.running -= 1
+        if used_tokens is not None:
+            now = time.monotonic()
+            self._expire(now)
+            if reservation.entry[0] > now - WINDOW_SECONDS:
+                self._window_tokens += used_tokens - reservation.entry[1]
+            reservation.entry[1] = used_tokens
+        if throttled:
+            self.throttled += 1
+            self.limit = max(1.0, self.limit / 2)
+            logger.warning(f"Provider rate limited {self.model}; concurrency cut to {int(self.limit)}")
+        else:
+            self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+        if self._timer is None:
+            self._dispatch()
+
+    def stats(self) -> Dict:
+        self._expire(time.monotonic())
+        granted = sum(self.granted.values())
+        return {
+            "concurrency_limit": int(self.limit),
+            "max_concurrency": self.max_concurrency,
+            "running": self.running,
+            "queued": {priority: len(waiters) for priority, waiters in self._waiters.items()},
+            "tokens_last_minute": self._window_tokens,
+            "tokens_per_minute": self.tokens_per_minute,
+            "granted": dict(self.granted),
+            "rejected": dict(self.rejected),
+            "provider_throttled": self.throttled,
+            "wait_ms_avg": round(self.total_wait / granted * 1000, 1) if granted else 0.0,
+            "wait_ms_max": round(self.max_wait * 1000, 1),
+        }
+
+
+class AILimiter:
+    """Per-model :class:`ModelLimiter` instances shared by the whole process."""
+
+    def __init__(self):
+        self._models: Dict[str, ModelLimiter] = {}
+
+    def for_model(self, model: str) -> ModelLimiter:
+        limiter = self._models.get(model)
+        if limiter is None:
+            limiter = self._models[model] = ModelLimiter(
+                model,
+                settings.AI_MODEL_CONCURRENCY.get(model, settings.AI_MAX_CONCURRENCY),
+                settings.AI_MODEL_TOKENS_PER_MINUTE.get(model, settings.AI_TOKENS_PER_MINUTE),
+            )
+        return limiter
+
+    @asynccontextmanager
+    async def slot(self, model: str, messages: List[Dict], max_tokens: int):
+        """Hold a slot for ``model`` for the duration of the block.
+
+        Yields the reservation; set ``reservation.used`` to the actual token
+        count once the response reports it.
+        """
+        limiter = self.for_model(model)
+        reservation = await limiter.acquire(estimate_tokens(messages, max_tokens), _priority.get())
+        throttled = False
+        try:
+            yield reservation
+        except Exception as e:
+            throttled = getattr(e, "status_code", None) == 429
+            raise
+        finally:
+            limiter.release(reservation, reservation.used, throttled)
+
+    def stats(self) -> Dict:
+        return {model: limiter.stats() for model, limiter in self._models.items()}
+
+
+ai_limiter = AILimiter()
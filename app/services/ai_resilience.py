@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, TypeVar
+
+import openai
+
+from app.core.config import settings
+from app.services.ai_limiter import AIOverloaded
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Statuses worth retrying: timeouts, conflicts, rate limits and server errors.
+TRANSIENT_STATUS_CODES = {408, 409, 429}
+
+
+def is_transient(error: Exception) -> bool:
+    if isinstance(error, (asyncio.TimeoutError, openai.APIConnectionError)):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return status_code is not None and (status_code in TRANSIENT_STATUS_CODES or status_code >= 500)
+
+
+class AIUnavailable(Exception):
+    """The model is failing or its circuit is open; callers serve a fallback."""
+
+    def __init__(self, model: str, reason: str, retry_after: float):
+        super().__init__(f"{model}: {reason}")
+        self.model = model
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Stops calling a model after ``failure_threshold`` failures in a row.
+
+    While open, calls fail at once with :class:`AIUnavailable`. After
+    ``reset_seconds`` a single trial call is let through: success closes the
+    circuit, failure opens it for another period.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.rejected = 0
+        self._probing = False
+
+    def _retry_after(self) -> float:
+        return max(1.0, self.opened_at + self.reset_seconds - time.monotonic())
+
+    def before_call(self) -> None:
+        if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_seconds:
+            self.state = HALF_OPEN
+            self._probing = False
+        if self.state == OPEN or (self.state == HALF_OPEN and self._probing):
+            self.rejected += 1
+            raise AIUnavailable(self.name, "circuit open", self._retry_after())
+        if self.state == HALF_OPEN:
+            self._probing = True
+
+    def record_success(self) -> None:
+        if self.state != CLOSED:
+            logger.info(f"Circuit for {self.name} closed")
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.trips += 1
+                logger.error(f"Circuit for {self.name} opened after {self.failures} failures")
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self._probing = False
+
+    def abandon(self) -> None:
+        """A trial call was cancelled before it finished; allow another."""
+        self._probing = False
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "retry_after_seconds": round(self._retry_after(), 1) if self.state == OPEN else None,
+        }
+
+
+class AIResilience:
+    """Deadlines, jittered retries and per-model circuit breakers for AI calls."""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._methods: Dict[str, Dict[str, int]] = {}
+
+    def breaker(self, model: str) -> CircuitBreaker:
+        breaker = self._breakers.get(model)
+        if breaker is None:
+            breaker = self._breakers[model] = CircuitBreaker(
+                model, settings.AI_BREAKER_FAILURE_THRESHOLD, settings.AI_BREAKER_RESET_SECONDS
+            )
+        return breaker
+
+    def timeout(self, method: str) -> float:
+        return settings.AI_METHOD_TIMEOUT_SECONDS.get(method, settings.AI_TIMEOUT_SECONDS)
+
+    def count(self, method: str, event: str) -> None:
+        counts = self._methods.setdefault(
+            method, {"calls": 0, "retries": 0, "timeouts": 0, "failures": 0, "fallbacks": 0}
+        )
+        counts[event] += 1
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter keeps retries from many requests from arriving together
+        return random.uniform(0, min(settings.AI_RETRY_MAX_SECONDS, settings.AI_RETRY_BASE_SECONDS * 2 ** attempt))
+
+    async def call(self, method: str, model: str, attempt: Callable[[float], Awaitable[T]]) -> T:
+        """Run ``attempt(deadline)`` until it succeeds, retrying transient errors.
+
+        ``deadline`` is a ``time.monotonic()`` value shared by all attempts;
+        the attempt must give up by then. Raises :class:`AIUnavailable` when
+        the circuit is open or retries run out, and re-raises errors that
+        retrying cannot fix (bad requests, authentication) unchanged.
+        """
+        breaker = self.breaker(model)
+        deadline = time.monotonic() + self.timeout(method)
+        self.count(method, "calls")
+        tries = 0
+        while True:
+            breaker.before_call()
+            try:
+                result = await attempt(deadline)
+            except AIOverloaded:
+                breaker.abandon()
+                raise
+            except asyncio.CancelledError:
+                breaker.abandon()
+                raise
+            except Exception as e:
+                if not is_transient(e):
+                    breaker.abandon()
+                    raise
+                breaker.record_failure()
+                self.count(method, "timeouts" if isinstance(e, asyncio.TimeoutError) else "failures")
+                delay = self._backoff(tries)
+                if tries >= settings.AI_MAX_RETRIES or time.monotonic() + delay >= deadline:
+                    reason = "timed out" if isinstance(e, asyncio.TimeoutError) else str(e)
+                    raise AIUnavailable(model, f"{method} failed after {tries + 1} attempts: {reason}", delay or 1.0) from e
+                tries += 1
+                self.count(method, "retries")
+                logger.warning(f"Retrying {method} in {delay:.2f}s after: {e!r}")
+                await asyncio.sleep(delay)
+                continue
+            breaker.record_success()
+            return result
+
+    def stats(self) -> Dict:
+        return {
+            "breakers": {model: breaker.stats() for model, breaker in self._breakers.items()},
+            "methods": {method: dict(counts) for method, counts in self._methods.items()},
+        }
+
+
+ai_resilience = AIResilience()
@@ -1,25 +1,258 @@
-from typing import Dict, List
+from typing import AsyncIterator, Callable, Dict, List, Optional
+import asyncio
 import logging
+import threading
+import time
 from openai import AsyncOpenAI
 from app.core.config import settings
+from app.services.ai_cache import completion_cache, make_cache_key
+from app.services.ai_fake import FakeAsyncOpenAI
+from app.services.ai_limiter import AIOverloaded, ai_limiter
+from app.services.ai_resilience import AIUnavailable, ai_resilience, is_transient
+from app.services.ai_singleflight import ai_singleflight
+from app.services import ai_fallbacks, match_engine
 import openai
-import re
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class StreamStats:
+    """Time to first token and total duration of streamed completions."""
+
+    def __init__(self):
+        self.streams = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.first_tokens = 0
+        self.total_first_token = 0.0
+        self.max_first_token = 0.0
+        self.total_duration = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, first_token: Optional[float], duration: float, cached: bool, failed: bool) -> None:
+        with self._lock:
+            self.streams += 1
+            self.cache_hits += int(cached)
+            self.errors += int(failed)
+            self.total_duration += duration
+            if first_token is not None:
+                self.first_tokens += 1
+                self.total_first_token += first_token
+                self.max_first_token = max(self.max_first_token, first_token)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            streams = self.streams
+            first_tokens = self.first_tokens
+            return {
+                "streams": streams,
+                "cache_hits": self.cache_hits,
+                "errors": self.errors,
+                "first_token_ms_avg": round(self.total_first_token / first_tokens * 1000, 1) if first_tokens else 0.0,
+                "first_token_ms_max": round(self.max_first_token * 1000, 1),
+                "duration_ms_avg": round(self.total_duration / streams * 1000, 1) if streams else 0.0,
+            }
+
+
+ai_stream_stats = StreamStats()
+
+
+async def _strip_stream(chunks: AsyncIterator[str], skip: int = 0) -> AsyncIterator[str]:
+    """Streaming counterpart of ``text.strip()[skip:]``: leading whitespace
+    and then ``skip`` characters are dropped; trailing whitespace is kept
+    because the end of the stream is not known in advance."""
+    started = False
+    async for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        if skip:
+            dropped = min(skip, len(chunk))
+            chunk, skip = chunk[dropped:], skip - dropped
+        if chunk:
+            yield chunk
+
+
+async def _with_fallback(chunks: AsyncIterator[str], method: str, fallback: Callable[[], str]) -> AsyncIterator[str]:
+    """Yield ``fallback()`` in place of a stream that fails before its first chunk."""
+    started = False
+    try:
+        async for chunk in chunks:
+            started = True
+            yield chunk
+    except AIUnavailable as e:
+        if started:
+            raise
+        logger.warning(f"Serving fallback for {method}: {e}")
+        ai_resilience.count(method, "fallbacks")
+        yield fallback()
+
+
 class AIService:
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-        logger.info("AIService initialized with AsyncOpenAI client")
-        if not settings.OPENAI_API_KEY:
-            logger.error("OpenAI API key not configured!")
-        openai.api_key = settings.OPENAI_API_KEY
+        if settings.AI_BACKEND == "fake":
+            self.client = FakeAsyncOpenAI(seed=settings.AI_FAKE_SEED)
+        else:
+            if not settings.OPENAI_API_KEY:
+                logger.error("OpenAI API key not configured!")
+            # Retries are handled by ai_resilience, which also sees the failures;
+            # without a key every call fails with a 401 instead of startup failing
+            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY or "not-configured", max_retries=0)
+            logger.info("AIService initialized with AsyncOpenAI client")
+            openai.api_key = settings.OPENAI_API_KEY
+        self.cache = completion_cache
+        self.singleflight = ai_singleflight
+        self.limiter = ai_limiter
+        self.resilience = ai_resilience
+        self.stream_stats = ai_stream_stats
+
+    def _fallback(self, method: str, error: Exception, text):
+        logger.warning(f"Serving fallback for {method}: {error}")
+        self.resilience.count(method, "fallbacks")
+        return text
+
+    def _cache_enabled(self, method: str, use_cache: bool) -> bool:
+        return (
+            use_cache
+            and settings.AI_CACHE_ENABLED
+            and method not in settings.AI_CACHE_DISABLED_METHODS
+        )
 
-    async def generate_job_description(self, title: str, requirements: List[str], company_info: str) -> str:
-        logger.info(f"Generating job description for: {title}")
+    async def _complete(
+        self,
+        method: str,
+        model: str,
+        messages: List[Dict],
+        temperature: float,
+        max_tokens: int,
+        use_cache: bool = True,
+    ) -> str:
+        """Run a chat completion and return the message text.
+
+        Repeats are served from the cache, and concurrent identical requests
+        share a single upstream call. Each attempt takes its own limiter
+        slot and must finish by the method's deadline; raises
+        :class:`AIUnavailable` when the model is failing.
+        """
+        cacheable = self._cache_enabled(method, use_cache)
+        key = make_cache_key(model, messages, temperature, max_tokens)
+        if cacheable:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info(f"AI cache hit for {method}")
+                return cached
+
+        async def attempt(deadline: float):
+            async with self.limiter.slot(model, messages, max_tokens) as reservation:
+                response = await asyncio.wait_for(
+                    self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    ),
+                    deadline - time.monotonic()
+                )
+                if response.usage is not None:
+                    reservation.used = response.usage.total_tokens
+            return response
+
+        async def fetch() -> str:
+            started = time.monotonic()
+            response = await self.resilience.call(method, model, attempt)
+            content = response.choices[0].message.content
+            if cacheable and content is not None:
+                self.cache.set(key, content, latency=time.monotonic() - started)
+            return content
+
+        return await self.singleflight.do(key, fetch)
+
+    async def _stream(
+        self,
+        method: str,
+        model: str,
+        messages: List[Dict],
+        temperature: float,
+        max_tokens: int,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """Yield a chat completion's text as the model produces it.
+
+        Uses the same cache key as :meth:`_complete`: a cached completion is
+        yielded in one piece, and a stream that runs to the end caches its
+        full text for both paths. Streams are not coalesced.
+
+        Opening the stream is retried like :meth:`_complete`; once text has
+        been sent a failure ends the stream, and a gap of more than
+        ``AI_STREAM_IDLE_SECONDS`` between chunks counts as one. A transient
+        failure before the first chunk, including that timeout, raises
+        :class:`AIUnavailable` so :func:`_with_fallback` can step in.
+        """
+        cacheable = self._cache_enabled(method, use_cache)
+        key = make_cache_key(model, messages, temperature, max_tokens)
+        started = time.monotonic()
+        if cacheable:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info(f"AI cache hit for {method} (stream)")
+                self.stream_stats.record(time.monotonic() - started, time.monotonic() - started, True, False)
+                yield cached
+                return
+
+        first_token = None
+        parts: List[str] = []
+        failed = True
         try:
-            prompt = f"""Please write a professional job description for the following position:
+            # The slot is held until the last chunk has been read
+            async with self.limiter.slot(model, messages, max_tokens):
+                async def attempt(deadline: float):
+                    return await asyncio.wait_for(
+                        self.client.chat.completions.create(
+                            model=model,
+                            messages=messages,
+                            temperature=temperature,
+                            max_tokens=max_tokens,
+                            stream=True
+                        ),
+                        deadline - time.monotonic()
+                    )
+
+                stream = (await self.resilience.call(method, model, attempt)).__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(stream.__anext__(), settings.AI_STREAM_IDLE_SECONDS)
+                    except StopAsyncIteration:
+                        break
+                    except Exception as e:
+                        if is_transient(e):
+                            self.resilience.breaker(model).record_failure()
+                            if not parts:
+                                # Nothing sent yet, so the caller can still serve a fallback
+                                reason = "timed out" if isinstance(e, asyncio.TimeoutError) else str(e)
+                                raise AIUnavailable(model, f"{method} stream failed before its first chunk: {reason}", 1.0) from e
+                        raise
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    if first_token is None:
+                        first_token = time.monotonic() - started
+                    parts.append(delta)
+                    yield delta
+            failed = False
+        finally:
+            duration = time.monotonic() - started
+            self.stream_stats.record(first_token, duration, False, failed)
+            if failed:
+                logger.error(f"Streaming {method} stopped after {len(parts)} chunks")
+            elif cacheable and parts:
+                self.cache.set(key, "".join(parts), latency=duration)
+
+    def _job_description_messages(self, title: str, requirements: List[str], company_info: str) -> List[Dict]:
+        prompt = f"""Please write a professional job description for the following position:
 
 Job Title: {title}
 
@@ -36,30 +269,45 @@ Write a compelling job description that includes:
 4. What the company offers
 
 The tone should be professional but engaging."""
+        return [
+            {"role": "system", "content": "You are a professional recruiter writing compelling job descriptions."},
+            {"role": "user", "content": prompt}
+        ]
+
+    async def generate_job_description(self, title: str, requirements: List[str], company_info: str, use_cache: bool = True) -> str:
+        logger.info(f"Generating job description for: {title}")
+        try:
             logger.info("Sending request to OpenAI API")
-            response = await self.client.chat.completions.create(
+            content = await self._complete(
+                "generate_job_description",
                 model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a professional recruiter writing compelling job descriptions."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._job_description_messages(title, requirements, company_info),
                 temperature=0.7,
-                max_tokens=500
+                max_tokens=500,
+                use_cache=use_cache
             )
             logger.info("Successfully received response from OpenAI")
-            return response.choices[0].message.content.strip()
+            return content.strip()
+        except AIOverloaded:
+            raise
+        except AIUnavailable as e:
+            return self._fallback("generate_job_description", e, ai_fallbacks.job_description(title, requirements, company_info))
         except Exception as e:
             logger.error(f"Error in generate_job_description: {str(e)}")
             raise Exception(f"Failed to generate job description: {str(e)}")
 
-    async def generate_candidate_bio(
-        self,
-        experience: List[Dict],
-        education: List[Dict],
-        skills: List[str]
-    ) -> str:
-        """Generate a professional bio for a candidate based on their experience, education, and skills."""
-
+    def stream_job_description(self, title: str, requirements: List[str], company_info: str, use_cache: bool = True) -> AsyncIterator[str]:
+        logger.info(f"Streaming job description for: {title}")
+        return _with_fallback(_strip_stream(self._stream(
+            "generate_job_description",
+            model="gpt-4",
+            messages=self._job_description_messages(title, requirements, company_info),
+            temperature=0.7,
+            max_tokens=500,
+            use_cache=use_cache
+        )), "generate_job_description", lambda: ai_fallbacks.job_description(title, requirements, company_info))
+
+    def _candidate_bio_messages(self, experience: List[Dict], education: List[Dict], skills: List[str]) -> List[Dict]:
         # Format experience and education into readable text
         experience_text = "\n".join([
             f"- {exp['position']} at {exp['company']} ({exp['duration']}): {exp['description']}"
@@ -85,23 +333,76 @@ Skills: {skills_text}
 
 Write a concise, professional bio that highlights their key achievements, expertise, and value proposition. 
 The bio should be written in first person and be approximately 2-3 paragraphs long."""
+        return [
+            {"role": "system", "content": "You are a professional resume writer helping to craft compelling candidate bios."},
+            {"role": "user", "content": prompt}
+        ]
 
+    async def generate_candidate_bio(
+        self,
+        experience: List[Dict],
+        education: List[Dict],
+        skills: List[str],
+        use_cache: bool = True
+    ) -> str:
+        """Generate a professional bio for a candidate based on their experience, education, and skills."""
         try:
-            response = await self.client.chat.completions.create(
+            content = await self._complete(
+                "generate_candidate_bio",
                 model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a professional resume writer helping to craft compelling candidate bios."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._candidate_bio_messages(experience, education, skills),
                 temperature=0.7,
-                max_tokens=500
+                max_tokens=500,
+                use_cache=use_cache
             )
-            return response.choices[0].message.content.strip()
+            return content.strip()
+        except AIOverloaded:
+            raise
+        except AIUnavailable as e:
+            return self._fallback("generate_candidate_bio", e, ai_fallbacks.candidate_bio(experience, education, skills))
         except Exception as e:
             logger.error(f"Error in generate_candidate_bio: {str(e)}")
             raise Exception(f"Failed to generate bio: {str(e)}")
 
-    async def match_candidate_with_job(self, candidate_data: Dict, job_data: Dict) -> Dict:
+    def stream_candidate_bio(
+        self,
+        experience: List[Dict],
+        education: List[Dict],
+        skills: List[str],
+        use_cache: bool = True
+    ) -> AsyncIterator[str]:
+        """Streaming variant of :meth:`generate_candidate_bio`."""
+        return _with_fallback(_strip_stream(self._stream(
+            "generate_candidate_bio",
+            model="gpt-4",
+            messages=self._candidate_bio_messages(experience, education, skills),
+            temperature=0.7,
+            max_tokens=500,
+            use_cache=use_cache
+        )), "generate_candidate_bio", lambda: ai_fallbacks.candidate_bio(experience, education, skills))
+
+    async def match_candidate_with_job(
+        self,
+        candidate_data: Dict,
+        job_data: Dict,
+        explain: Optional[bool] = None,
+        use_cache: bool = True
+    ) -> Dict:
+        """Score a candidate against a job with the local match engine.
+
+        The score is always computed offline. When ``explain`` is set (defaults
+        to ``settings.AI_MATCH_EXPLAIN``) the LLM is asked for a written
+        analysis of the match; otherwise a short local summary is returned.
+        """
+        result = match_engine.score_candidate(candidate_data, job_data)
+        if explain is None:
+            explain = settings.AI_MATCH_EXPLAIN
+        if not explain:
+            return {
+                "score": result["score"],
+                "analysis": match_engine.summarize_match(result)
+            }
+
         prompt = f"""Analyze the match between the candidate and job posting:
 
 Candidate:
@@ -110,26 +411,27 @@ Candidate:
 Job Posting:
 {job_data}
 
-Provide a matching score (0-100) and explanation."""
+The candidate's computed matching score is {result["score"]}/100.
+Explain the strengths and gaps behind this score."""
 
-        response = await self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=300,
-            temperature=0.3
-        )
-
-        analysis = response.choices[0].message.content
-        # score = 75  # Placeholder logic; replace with real parsing
-        match = re.search(r"Score:\s*(\d+)", analysis)
-        score = int(match.group(1)) if match else 0 
+        try:
+            analysis = await self._complete(
+                "match_candidate_with_job",
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=300,
+                temperature=0.3,
+                use_cache=use_cache
+            )
+        except AIUnavailable as e:
+            analysis = self._fallback("match_candidate_with_job", e, match_engine.summarize_match(result))
 
         return {
-            "score": score,
+            "score": result["score"],
             "analysis": analysis
         }
 
-    async def generate_contract(self, job_data: Dict, candidate_data: Dict) -> str:
+    async def generate_contract(self, job_data: Dict, candidate_data: Dict, use_cache: bool = True) -> str:
         prompt = f"""Generate a professional employment contract with the following details:
 
 Job Information:
@@ -152,15 +454,19 @@ Please create a formal employment contract that includes:
 
 Use formal legal language while maintaining clarity."""
 
-        response = await self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=2000,
-            temperature=0.3
-        )
-        return response.choices[0].message.content
+        try:
+            return await self._complete(
+                "generate_contract",
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=2000,
+                temperature=0.3,
+                use_cache=use_cache
+            )
+        except AIUnavailable as e:
+            return self._fallback("generate_contract", e, ai_fallbacks.contract(job_data, candidate_data))
 
-    async def filter_job_posting(self, job_posting: Dict) -> Dict:
+    async def filter_job_posting(self, job_posting: Dict, use_cache: bool = True) -> Dict:
         prompt = f"""Review and enhance this job posting:
 
 Title: {job_posting['title']}
@@ -178,57 +484,95 @@ Please:
 
 Provide structured feedback and suggestions."""
 
-        response = await self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=800,
-            temperature=0.3
-        )
-
-        feedback = response.choices[0].message.content
+        try:
+            feedback = await self._complete(
+                "filter_job_posting",
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=800,
+                temperature=0.3,
+                use_cache=use_cache
+            )
+        except AIUnavailable as e:
+            return self._fallback("filter_job_posting", e, ai_fallbacks.job_posting_review(job_posting))
         is_compliant = "discriminatory" not in feedback.lower() and "illegal" not in feedback.lower()
 
         return {
             "feedback": feedback,
             "is_compliant": is_compliant,
+            "reviewed": True,
             "original_posting": job_posting
         }
 
-    async def generate_blog_content(self, title: str) -> str:
-            
-            prompt = f"Write a detailed, professional blog article about: '{title}'"
+    def _blog_content_messages(self, title: str) -> List[Dict]:
+        prompt = f"Write a detailed, professional blog article about: '{title}'"
+        return [
+            {"role": "system", "content": "You are a professional content writer helping to craft compelling blog posts."},
+            {"role": "user", "content": prompt}
+        ]
+
+    async def generate_blog_content(self, title: str, use_cache: bool = True) -> str:
             
-            response = await self.client.chat.completions.create(
+            content = await self._complete(
+                "generate_blog_content",
                 model="gpt-4",
-                messages=[
-                     {"role": "system", "content": "You are a professional content writer helping to craft compelling blog posts."},
-                    {"role": "user", "content": prompt}
-                    ],
+                messages=self._blog_content_messages(title),
                 temperature=0.7,
-                max_tokens=500
+                max_tokens=500,
+                use_cache=use_cache
             )
 
             #return response.choices[0].message.content
-            responseData =  response.choices[0].message.content.strip()
+            responseData =  content.strip()
             return  responseData[7:]
             #return response.choices[0].message['content']
+
+    def stream_blog_content(self, title: str, use_cache: bool = True) -> AsyncIterator[str]:
+        # Drops the same 7 leading characters as generate_blog_content
+        return _strip_stream(self._stream(
+            "generate_blog_content",
+            model="gpt-4",
+            messages=self._blog_content_messages(title),
+            temperature=0.7,
+            max_tokens=500,
+            use_cache=use_cache
+        ), skip=7)
         
-    async def generate_contract_description(self, contract_title: str) -> str:
+    def _contract_description_messages(self, contract_title: str) -> List[Dict]:
         prompt = f"Write a professional description for a contract titled: '{contract_title}'"
+        return [
+            {"role": "system", "content": "You are a professional content writer helping to craft compelling contract templates."},
+            {"role": "user", "content": prompt}
+        ]
+
+    async def generate_contract_description(self, contract_title: str, use_cache: bool = True) -> str:
         try:
-            response = await self.client.chat.completions.create(
+            content = await self._complete(
+                "generate_contract_description",
                 model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a professional content writer helping to craft compelling contract templates."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._contract_description_messages(contract_title),
                 temperature=0.7,
-                max_tokens=500
+                max_tokens=500,
+                use_cache=use_cache
             )
-            return response.choices[0].message.content.strip()
+            return content.strip()
+        except AIOverloaded:
+            raise
+        except AIUnavailable as e:
+            return self._fallback("generate_contract_description", e, ai_fallbacks.contract_description(contract_title))
         except Exception as e:
             logger.error(f"Error generating contract description: {str(e)}")
             raise Exception(f"Failed to generate contract description: {str(e)}")
+
+    def stream_contract_description(self, contract_title: str, use_cache: bool = True) -> AsyncIterator[str]:
+        return _with_fallback(_strip_stream(self._stream(
+            "generate_contract_description",
+            model="gpt-4",
+            messages=self._contract_description_messages(contract_title),
+            temperature=0.7,
+            max_tokens=500,
+            use_cache=use_cache
+        )), "generate_contract_description", lambda: ai_fallbacks.contract_description(contract_title))
         
         
             
@@ -252,4 +596,7 @@ Provide structured feedback and suggestions."""
     #     prompt=prompt,
     #     max_tokens=150
     # )
-    
\ No newline at end of file
+
+
+# One client, connection pool and set of limits for the whole process
+ai_service = AIService()
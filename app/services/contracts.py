@@ -1,29 +1,38 @@
-from openai import AsyncOpenAI  
-import openai
+from sqlalchemy.orm import Session
 
-async def generate_contract(db, application):
-    job = application.job
-    candidate = application.candidate
-    employer = application.employer
+from app.models.models import Application, Contract
+from app.services.ai_service import ai_service
 
-    prompt = f"""
-    Write a professional employment contract between:
-    - Employer: {employer.company_name}, Email: {employer.email}
-    - Candidate: {candidate.full_name}, Email: {candidate.email}
-    For the job role: {job.title}, Description: {job.description}, Salary: {job.salary}
-    Include standard terms, responsibilities, termination, and duration.
-    """
 
-    ai_content = call_gpt(prompt)  # returns contract text
+async def generate_contract(db: Session, application: Application) -> Contract:
+    """Draft a contract for ``application`` and add it to the caller's transaction.
 
-    new_contract = Contract(
-        job_id=job.id,
-        application_id=application.id,
-        employer_id=employer.id,
-        candidate_id=candidate.id,
-        content=ai_content,
+    ``application`` needs its job and candidate (with user) loaded, as
+    :func:`app.db.queries.application_with_details` does. Nothing is
+    committed here.
+    """
+    job = application.job
+    candidate = application.candidate
+    salary_range = job.salary_range or {}
+    content = await ai_service.generate_contract(
+        job_data={
+            "title": job.title,
+            "description": job.description,
+            "requirements": job.requirements,
+            "salary_range": {
+                "currency": salary_range.get("currency", ""),
+                "min": salary_range.get("min", ""),
+                "max": salary_range.get("max", ""),
+            },
+            "location": job.location,
+        },
+        candidate_data={
+            "user": {"full_name": candidate.user.full_name, "email": candidate.user.email},
+            "bio": candidate.bio,
+            "experience": candidate.experience,
+            "education": candidate.education,
+        },
     )
-    db.add(new_contract)
-    db.commit()
-    db.refresh(new_contract)
-    return new_contract
+    contract = Contract(application=application, content=content, status="draft")
+    db.add(contract)
+    return contract
@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import smtplib
+import time
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.api.api_v1.endpoints import email_template
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.models import Application, EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES: Dict[str, Callable[..., str]] = {
+    "candidate_application": email_template.candidate_application_template,
+    "employer_notification": email_template.employer_notification_template,
+    "contract_ready": email_template.contract_ready_template,
+}
+
+# Templates that show the application's match score, which is filled in from
+# the application row at send time rather than frozen at enqueue time.
+SCORED_TEMPLATES = {"candidate_application", "employer_notification"}
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def enqueue(
+    db: Session,
+    to_email: str,
+    subject: str,
+    template: str,
+    context: Dict,
+    application: Optional[Application] = None,
+) -> EmailOutbox:
+    """Add a message to the outbox in the caller's transaction.
+
+    Nothing is committed here: the message is only sent if the surrounding
+    transaction commits, and it survives SMTP outages once it has.
+    """
+    if template not in TEMPLATES:
+        raise ValueError(f"Unknown email template: {template}")
+    message = EmailOutbox(
+        to_email=to_email,
+        subject=subject,
+        template=template,
+        context=context,
+        application=application,
+        status="queued",
+        attempts=0,
+    )
+    db.add(message)
+    return message
+
+
+def render(message: EmailOutbox) -> str:
+    context = dict(message.context)
+    if message.template in SCORED_TEMPLATES:
+        context["match_score"] = message.application.ai_match_score if message.application else None
+    return TEMPLATES[message.template](**context)
+
+
+def outbox_stats(db: Session) -> Dict:
+    counts = dict(db.query(EmailOutbox.status, func.count(EmailOutbox.id)).group_by(EmailOutbox.status).all())
+    return {status: counts.get(status, 0) for status in ("queued", "sending", "sent", "failed")}
+
+
+class SMTPConnection:
+    """A reusable SMTP session that reconnects when idle too long or dropped."""
+
+    def __init__(self):
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=30)
+        if settings.SMTP_USE_TLS:
+            smtp.starttls()
+        if settings.SMTP_USER:
+            smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD or "")
+        return smtp
+
+    def _session(self) -> smtplib.SMTP:
+        if self._smtp is not None and time.monotonic() - self._last_used > settings.SMTP_IDLE_TIMEOUT_SECONDS:
+            self.close()
+        if self._smtp is None:
+            self._smtp = self._connect()
+        return self._smtp
+
+    def send(self, message: EmailMessage) -> None:
+        try:
+            self._session().send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            self.close()
+            self._session().send_message(message)
+        self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
+
+class EmailWorker:
+    """Drains the email_outbox table in batches over a shared SMTP session.
+
+    Messages tied to an application wait (up to ``EMAIL_SCORE_WAIT_SECONDS``)
+    for its match score so the notification can include it. Without
+    ``SMTP_HOST`` configured, messages are logged instead of sent.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self.connection = SMTPConnection()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self.run())
+            logger.info("Email worker started")
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._task is not None:
+            await self._task
+            self._task = None
+        self.connection.close()
+
+    async def run(self) -> None:
+        while not self._stopping:
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Email worker loop error: {str(e)}")
+                processed = 0
+            if not processed:
+                await asyncio.sleep(settings.EMAIL_POLL_INTERVAL_SECONDS)
+
+    async def run_once(self) -> int:
+        return await asyncio.to_thread(self._drain_batch, settings.EMAIL_BATCH_SIZE)
+
+    def _claim(self, db: Session, limit: int) -> List[EmailOutbox]:
+        now = _now()
+        stale = now - timedelta(seconds=settings.EMAIL_LOCK_TIMEOUT_SECONDS)
+        score_deadline = now - timedelta(seconds=settings.EMAIL_SCORE_WAIT_SECONDS)
+        messages = (
+            db.query(EmailOutbox)
+            .outerjoin(Application, EmailOutbox.application_id == Application.id)
+            .filter(
+                or_(
+                    (EmailOutbox.status == "queued") & (EmailOutbox.run_after <= now),
+                    (EmailOutbox.status == "sending") & (EmailOutbox.locked_at < stale),
+                ),
+                or_(
+                    EmailOutbox.template.notin_(SCORED_TEMPLATES),
+                    Application.id.is_(None),
+                    Application.score_status != "scoring",
+                    EmailOutbox.created_at < score_deadline,
+                ),
+            )
+            .order_by(EmailOutbox.run_after, EmailOutbox.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=EmailOutbox)
+            .all()
+        )
+        for message in messages:
+            message.status = "sending"
+            message.locked_at = now
+            message.attempts += 1
+        db.commit()
+        return messages
+
+    def _build(self, message: EmailOutbox) -> EmailMessage:
+        email = EmailMessage()
+        email["From"] = settings.EMAIL_FROM
+        email["To"] = message.to_email
+        email["Subject"] = message.subject
+        email.set_content(render(message), subtype="html")
+        return email
+
+    def _deliver(self, email: EmailMessage) -> None:
+        if not settings.SMTP_HOST:
+            logger.info(f"SMTP_HOST not set, logging email to {email['To']}: {email['Subject']}")
+            return
+        self.connection.send(email)
+
+    def _drain_batch(self, limit: int) -> int:
+        db = self.session_factory()
+        try:
+            messages = self._claim(db, limit)
+            results: List[Tuple[EmailOutbox, Optional[str]]] = []
+            for message in messages:
+                try:
+                    self._deliver(self._build(message))
+                    results.append((message, None))
+                except Exception as e:
+                    results.append((message, str(e)))
+
+            now = _now()
+            for message, error in results:
+                if error is None:
+                    message.status = "sent"
+                    message.sent_at = now
+                    message.last_error = None
+                elif message.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+                    message.status = "failed"
+                    message.last_error = error
+                    logger.error(f"Email {message.id} to {message.to_email} failed permanently: {error}")
+                else:
+                    delay = settings.EMAIL_RETRY_BASE_SECONDS * 2 ** (message.attempts - 1)
+                    message.status = "queued"
+                    message.run_after = now + timedelta(seconds=delay)
+                    message.last_error = error
+                    logger.warning(f"Email {message.id} failed (attempt {message.attempts}), retrying in {delay}s: {error}")
+            db.commit()
+            return len(messages)
+        finally:
+            db.close()
+
+
+email_worker = EmailWorker()
+
+
+async def main() -> None:
+    worker = EmailWorker()
+    await worker.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Select, column, func, literal_column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import JOB_SEARCH_DDL, JobPosting
+
+WORD_RE = re.compile(r"\w+")
+
+# Per-column weights for SQLite's bm25(), in job_postings_fts column order
+# (title, requirements, description), mirroring the A/B/C tsvector weights.
+FTS5_WEIGHTS = (10.0, 4.0, 1.0)
+# ts_rank_cd normalisation flags: 2 divides by document length, the
+# nearest Postgres gets to BM25's length normalisation; 32 maps to 0-1.
+TS_RANK_NORMALIZATION = 2 | 32
+
+search_vector = literal_column("job_postings.search_vector")
+job_postings_fts = table("job_postings_fts", column("rowid"))
+
+
+def fts5_query(text: str) -> Optional[str]:
+    """Quote every word so user input cannot use FTS5 query syntax; words are ANDed."""
+    words = WORD_RE.findall(text)
+    return " ".join(f'"{word}"' for word in words) or None
+
+
+def _filters(
+    location: Optional[str],
+    salary_min: Optional[float],
+    salary_max: Optional[float],
+    currency: Optional[str],
+) -> list:
+    conditions = [JobPosting.is_active == True]
+    if location:
+        conditions.append(JobPosting.location.ilike(f"%{location}%"))
+    # A job matches a salary filter when its range overlaps the requested one
+    if salary_min is not None:
+        conditions.append(JobPosting.salary_range["max"].as_float() >= salary_min)
+    if salary_max is not None:
+        conditions.append(JobPosting.salary_range["min"].as_float() <= salary_max)
+    if currency:
+        # Postings store whatever case the employer typed, so compare upper-cased
+        currency_code = func.upper(func.trim(JobPosting.salary_range["currency"].as_string()))
+        conditions.append(currency_code == currency.strip().upper())
+    return conditions
+
+
+def search_statement(
+    dialect: str,
+    text: str,
+    location: Optional[str] = None,
+    salary_min: Optional[float] = None,
+    salary_max: Optional[float] = None,
+    currency: Optional[str] = None,
+    limit: int = 50,
+) -> Optional[Select]:
+    """Build the ranked search query for a dialect, or None if ``text`` has no words.
+
+    Selects ``(JobPosting, rank)`` rows, best match first; a higher rank is
+    a better match on both backends.
+    """
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery(literal_column("'english'::regconfig"), text)
+        rank = func.ts_rank_cd(search_vector, tsquery, TS_RANK_NORMALIZATION)
+        stmt = select(JobPosting, rank.label("rank")).where(search_vector.op("@@")(tsquery))
+    elif dialect == "sqlite":
+        match = fts5_query(text)
+        if match is None:
+            return None
+        # bm25() is lower-is-better, so negate it to rank like ts_rank_cd
+        rank = -func.bm25(literal_column("job_postings_fts"), *FTS5_WEIGHTS)
+        stmt = (
+            select(JobPosting, rank.label("rank"))
+            .join(job_postings_fts, job_postings_fts.c.rowid == JobPosting.id)
+            .where(literal_column("job_postings_fts").op("MATCH")(match))
+        )
+    else:
+        raise ValueError(f"Job search is not supported on {dialect}")
+
+    return (
+        stmt.where(*_filters(location, salary_min, salary_max, currency))
+        .order_by(rank.desc(), JobPosting.id.desc())
+        .limit(limit)
+    )
+
+
+async def search_jobs(db: AsyncSession, text: str, **filters) -> List[Tuple[JobPosting, float]]:
+    stmt = search_statement(db.bind.dialect.name, text, **filters)
+    if stmt is None:
+        return []
+    result = await db.execute(stmt)
+    return [(job, float(rank or 0.0)) for job, rank in result.all()]
+
+
+def rebuild(connection) -> None:
+    """Create a missing SQLite FTS index and repopulate it from job_postings.
+
+    Postgres databases get the search column from the Alembic migration and
+    keep it current on their own.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_postings_fts'"
+    ).first()
+    if not exists:
+        for statement in JOB_SEARCH_DDL["sqlite"]:
+            connection.exec_driver_sql(statement)
+    connection.exec_driver_sql("INSERT INTO job_postings_fts (job_postings_fts) VALUES ('rebuild')")
+
+
+def main() -> None:
+    from app.db.session import engine
+
+    with engine.begin() as connection:
+        rebuild(connection)
+
+
+if __name__ == "__main__":
+    main()
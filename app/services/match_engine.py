@@ -0,0 +1,168 @@
+import math
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Sequence, Set
+
+import numpy as np
+
+from app.core.config import settings
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+STOPWORDS = frozenset(
+    """a an and are as at be by for from has have in is it its of on or our that the
+    their this to was we were will with you your i my me experience years year
+    """.split()
+)
+
+# Cosine similarity between two unrelated profiles sits near zero and rarely
+# climbs above this value even for strong matches, so it is treated as "1.0".
+SIMILARITY_CEILING = 0.6
+SIMILARITY_WEIGHT = 0.5
+COVERAGE_WEIGHT = 0.5
+# Share of a requirement's terms that must appear in a profile for it to be
+# reported as matched.
+REQUIREMENT_MATCH_RATIO = 0.5
+
+
+def _get(obj: Any, field: str, default=None):
+    if isinstance(obj, dict):
+        return obj.get(field, default)
+    return getattr(obj, field, default)
+
+
+def tokenize(text: str) -> List[str]:
+    tokens = []
+    for token in TOKEN_RE.findall(text.lower()):
+        token = token.rstrip(".")
+        if token and token not in STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def candidate_text(candidate: Any) -> str:
+    """Flatten a candidate (ORM row or dict) into the text that gets vectorized."""
+    parts = [_get(candidate, "bio") or ""]
+    parts.extend(_get(candidate, "skills") or [])
+    for exp in _get(candidate, "experience") or []:
+        parts.extend(str(exp.get(key, "")) for key in ("position", "company", "description"))
+    for edu in _get(candidate, "education") or []:
+        parts.extend(str(edu.get(key, "")) for key in ("degree", "field", "institution"))
+    return " ".join(parts)
+
+
+def job_text(job: Any) -> str:
+    """Flatten a job posting (ORM row or dict) into the text that gets vectorized."""
+    parts = [_get(job, "title") or "", _get(job, "description") or ""]
+    parts.extend(_get(job, "requirements") or [])
+    return " ".join(parts)
+
+
+def _features(tokens: Sequence[str]) -> Iterable[str]:
+    yield from tokens
+    for first, second in zip(tokens, tokens[1:]):
+        yield f"{first} {second}"
+
+
+def vectorize_tokens(tokens: Sequence[str], dim: int) -> np.ndarray:
+    """Signed feature hashing of unigrams and bigrams with sublinear tf, L2-normalised."""
+    counts: Dict[str, int] = {}
+    for feature in _features(tokens):
+        counts[feature] = counts.get(feature, 0) + 1
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature, count in counts.items():
+        h = zlib.crc32(feature.encode("utf-8"))
+        sign = 1.0 if h & 0x80000000 else -1.0
+        vector[h % dim] += sign * (1.0 + math.log(count))
+
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+def vectorize(text: str, dim: int = None) -> np.ndarray:
+    return vectorize_tokens(tokenize(text), dim or settings.MATCH_VECTOR_DIM)
+
+
+def vectorize_candidate(candidate: Any, dim: int = None) -> np.ndarray:
+    return vectorize(candidate_text(candidate), dim)
+
+
+def vectorize_job(job: Any, dim: int = None) -> np.ndarray:
+    return vectorize(job_text(job), dim)
+
+
+def requirement_terms(job: Any) -> List[Set[str]]:
+    """Token sets for each stated requirement of a job."""
+    terms = []
+    for requirement in _get(job, "requirements") or []:
+        tokens = set(tokenize(str(requirement)))
+        if tokens:
+            terms.append(tokens)
+    return terms
+
+
+def combine_scores(similarity: np.ndarray, coverage: np.ndarray, has_requirements: bool) -> np.ndarray:
+    """Blend cosine similarity and requirement coverage into 0-100 integer scores."""
+    scaled = np.clip(similarity / SIMILARITY_CEILING, 0.0, 1.0)
+    if has_requirements:
+        blended = SIMILARITY_WEIGHT * scaled + COVERAGE_WEIGHT * coverage
+    else:
+        blended = scaled
+    return np.rint(blended * 100).astype(np.int32)
+
+
+def score_candidates_for_job(candidates: Sequence[Any], job: Any) -> List[Dict]:
+    """Score many candidates against one job in a single matrix product.
+
+    Returns one dict per candidate with the integer ``score`` and the
+    requirements that were and were not found in the candidate's profile.
+    """
+    if not candidates:
+        return []
+
+    dim = settings.MATCH_VECTOR_DIM
+    job_vector = vectorize_job(job, dim)
+    requirements = requirement_terms(job)
+    requirement_labels = [str(r) for r in _get(job, "requirements") or [] if tokenize(str(r))]
+
+    token_lists = [tokenize(candidate_text(candidate)) for candidate in candidates]
+    matrix = np.vstack([vectorize_tokens(tokens, dim) for tokens in token_lists])
+    similarity = matrix @ job_vector
+
+    coverage = np.zeros(len(candidates), dtype=np.float32)
+    matched: List[List[str]] = []
+    for i, tokens in enumerate(token_lists):
+        token_set = set(tokens)
+        ratios = [len(terms & token_set) / len(terms) for terms in requirements]
+        matched.append([label for label, ratio in zip(requirement_labels, ratios) if ratio >= REQUIREMENT_MATCH_RATIO])
+        if requirements:
+            coverage[i] = sum(ratios) / len(requirements)
+
+    scores = combine_scores(similarity, coverage, bool(requirements))
+    return [
+        {
+            "score": int(scores[i]),
+            "similarity": round(float(similarity[i]), 4),
+            "matched_requirements": matched[i],
+            "missing_requirements": [label for label in requirement_labels if label not in matched[i]],
+        }
+        for i in range(len(candidates))
+    ]
+
+
+def score_candidate(candidate: Any, job: Any) -> Dict:
+    return score_candidates_for_job([candidate], job)[0]
+
+
+def summarize_match(result: Dict) -> str:
+    """Plain-text explanation used when the LLM explanation step is disabled."""
+    lines = [f"Score: {result['score']}"]
+    if result["matched_requirements"]:
+        lines.append("Matched requirements: " + ", ".join(result["matched_requirements"]))
+    if result["missing_requirements"]:
+        lines.append("Missing requirements: " + ", ".join(result["missing_requirements"]))
+    lines.append(f"Profile similarity: {result['similarity']:.2f}")
+    return "\n".join(lines)
@@ -0,0 +1,207 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# The SQLite backend drops buckets that have refilled completely once per
+# this many takes; a missing bucket and a full one behave the same.
+PRUNE_EVERY = 1000
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A token bucket: ``burst`` attempts at once, refilled at ``per_minute``."""
+
+    name: str
+    burst: int
+    per_minute: float
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60.0
+
+    @property
+    def refill_seconds(self) -> float:
+        """Time for an empty bucket to fill up again."""
+        return self.burst / self.rate if self.rate > 0 else float("inf")
+
+
+def _take(state: Optional[Tuple[float, float]], rule: Rule, now: float) -> Tuple[Tuple[float, float], float]:
+    """Refill a ``(tokens, updated_at)`` bucket and try to take one token.
+
+    Returns the new state and 0.0 if a token was taken, otherwise the number
+    of seconds until one will be available.
+    """
+    tokens, updated_at = state if state is not None else (float(rule.burst), now)
+    tokens = min(float(rule.burst), tokens + max(now - updated_at, 0.0) * rule.rate)
+    if tokens >= 1.0:
+        return (tokens - 1.0, now), 0.0
+    retry_after = (1.0 - tokens) / rule.rate if rule.rate > 0 else float("inf")
+    return (tokens, now), retry_after
+
+
+class MemoryBuckets:
+    """Per-process buckets as ``key -> (tokens, updated_at)`` tuples.
+
+    The least recently used keys are dropped beyond ``max_keys``; those are
+    the idle ones, whose buckets have mostly refilled anyway.
+    """
+
+    name = "memory"
+    # Takes are a dict update under an uncontended lock; fine on the event loop
+    blocking = False
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rule: Rule) -> float:
+        now = time.monotonic()
+        with self._lock:
+            state, retry_after = _take(self._buckets.get(key), rule, now)
+            self._buckets[key] = state
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class SQLiteBuckets:
+    """Buckets in a SQLite file shared by the worker processes on one host.
+
+    Each take is a read-modify-write inside ``BEGIN IMMEDIATE``, so
+    concurrent workers cannot both spend the last token.
+    """
+
+    name = "sqlite"
+    # BEGIN IMMEDIATE waits up to the connection timeout for other workers
+    blocking = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._takes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+
+    def take(self, key: str, rule: Rule) -> float:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?", (key,)
+                ).fetchone()
+                state, retry_after = _take(row, rule, now)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+                    (key, state[0], state[1]),
+                )
+                self._takes += 1
+                if self._takes % PRUNE_EVERY == 0:
+                    self._conn.execute(
+                        "DELETE FROM rate_limit_buckets WHERE key LIKE ? AND updated_at < ?",
+                        (f"{rule.name}:%", now - rule.refill_seconds),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return retry_after
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM rate_limit_buckets WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM rate_limit_buckets")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM rate_limit_buckets").fetchone()[0]
+
+
+class RateLimiter:
+    """Token-bucket limits keyed on ``<rule>:<key>``, e.g. ``login_ip:203.0.113.7``."""
+
+    def __init__(self, backend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.allowed: Dict[str, int] = {}
+        self.limited: Dict[str, int] = {}
+
+    def hit(self, rule: Rule, key: str) -> float:
+        """Spend one attempt; returns 0.0 if allowed, else seconds to wait."""
+        if not self.enabled:
+            return 0.0
+        retry_after = self.backend.take(f"{rule.name}:{key}", rule)
+        counts = self.limited if retry_after else self.allowed
+        counts[rule.name] = counts.get(rule.name, 0) + 1
+        if retry_after:
+            logger.info(f"Rate limited {rule.name} for {key}, retry in {retry_after:.0f}s")
+        return retry_after
+
+    def reset(self, rule: Rule, key: str) -> None:
+        if self.enabled:
+            self.backend.delete(f"{rule.name}:{key}")
+
+    async def hit_async(self, rule: Rule, key: str) -> float:
+        """:meth:`hit` for async handlers; a blocking backend runs on a thread."""
+        if self.enabled and self.backend.blocking:
+            return await asyncio.to_thread(self.hit, rule, key)
+        return self.hit(rule, key)
+
+    async def reset_async(self, rule: Rule, key: str) -> None:
+        if self.enabled and self.backend.blocking:
+            await asyncio.to_thread(self.reset, rule, key)
+        else:
+            self.reset(rule, key)
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "backend": self.backend.name,
+            "buckets": len(self.backend),
+            "allowed": dict(self.allowed),
+            "limited": dict(self.limited),
+        }
+
+
+LOGIN_IP = Rule("login_ip", settings.LOGIN_IP_BURST, settings.LOGIN_IP_PER_MINUTE)
+LOGIN_ACCOUNT = Rule("login_account", settings.LOGIN_ACCOUNT_BURST, settings.LOGIN_ACCOUNT_PER_MINUTE)
+REGISTER_IP = Rule("register_ip", settings.REGISTER_IP_BURST, settings.REGISTER_IP_PER_MINUTE)
+
+rate_limiter = RateLimiter(
+    SQLiteBuckets(settings.RATE_LIMIT_SQLITE_PATH)
+    if settings.RATE_LIMIT_SQLITE_PATH
+    else MemoryBuckets(settings.RATE_LIMIT_MAX_KEYS),
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
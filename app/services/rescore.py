@@ -0,0 +1,224 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.models import Application, Candidate, JobPosting, RescoreRun
+from app.services import match_engine
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+async def start(db: AsyncSession, job_id: int) -> RescoreRun:
+    """Queue a rescore of every application for a job in the caller's transaction.
+
+    Unfinished runs for the job are marked ``superseded``; their workers stop
+    at the next chunk, and the new run starts again from the first
+    application so every score reflects the current posting.
+    """
+    await db.execute(
+        update(RescoreRun)
+        .where(RescoreRun.job_id == job_id, RescoreRun.status.in_(ACTIVE_STATUSES))
+        .values(status="superseded", finished_at=_now())
+    )
+    total = await db.scalar(
+        select(func.count(Application.id)).where(Application.job_id == job_id, Application.candidate_id.is_not(None))
+    )
+    run = RescoreRun(job_id=job_id, status="queued", total=total or 0, scored=0, last_application_id=0)
+    db.add(run)
+    return run
+
+
+def latest_run_query(job_id: int):
+    return select(RescoreRun).where(RescoreRun.job_id == job_id).order_by(RescoreRun.id.desc()).limit(1)
+
+
+def run_status(run: RescoreRun) -> Dict:
+    return {
+        "id": run.id,
+        "job_id": run.job_id,
+        "status": run.status,
+        "total": run.total,
+        "scored": run.scored,
+        "progress": round(min(run.scored / run.total, 1.0), 4) if run.total else (1.0 if run.status == "done" else 0.0),
+        "last_error": run.last_error,
+        "created_at": run.created_at,
+        "finished_at": run.finished_at,
+    }
+
+
+class RescoreWorker:
+    """Works through queued rescore runs one chunk at a time.
+
+    Each chunk of ``RESCORE_CHUNK_SIZE`` applications is read in id order
+    past the run's ``last_application_id``, scored in one batch by the local
+    match engine and written back with a single executemany UPDATE (which
+    bumps ``score_version``, so older scoring tasks cannot overwrite it), in the
+    same transaction that advances the cursor. A crash therefore loses at
+    most the chunk in flight: a run left ``running`` for longer than
+    ``RESCORE_LOCK_TIMEOUT_SECONDS`` is claimed again and resumes after the
+    last committed chunk.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self.run())
+            logger.info("Rescore worker started")
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def run(self) -> None:
+        while not self._stopping:
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Rescore worker loop error: {str(e)}")
+                processed = 0
+            if not processed:
+                await asyncio.sleep(settings.RESCORE_POLL_INTERVAL_SECONDS)
+
+    async def run_once(self) -> int:
+        run_id = await asyncio.to_thread(self._claim)
+        if run_id is None:
+            return 0
+        try:
+            while await asyncio.to_thread(self._process_chunk, run_id):
+                if self._stopping:
+                    await asyncio.to_thread(self._release, run_id)
+                    break
+        except Exception as e:
+            logger.error(f"Rescore run {run_id} failed: {str(e)}")
+            await asyncio.to_thread(self._fail, run_id, str(e))
+        return 1
+
+    def _claim(self) -> Optional[int]:
+        db = self.session_factory()
+        try:
+            now = _now()
+            stale = now - timedelta(seconds=settings.RESCORE_LOCK_TIMEOUT_SECONDS)
+            run = (
+                db.query(RescoreRun)
+                .filter(
+                    or_(
+                        RescoreRun.status == "queued",
+                        (RescoreRun.status == "running") & (RescoreRun.locked_at < stale),
+                    )
+                )
+                .order_by(RescoreRun.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if run is None:
+                return None
+            if run.status == "running":
+                logger.warning(f"Resuming rescore run {run.id} after application {run.last_application_id}")
+            run.status = "running"
+            run.locked_at = now
+            db.commit()
+            return run.id
+        finally:
+            db.close()
+
+    def _process_chunk(self, run_id: int) -> bool:
+        """Score and write the next chunk; returns whether the run has more."""
+        db = self.session_factory()
+        try:
+            run = db.get(RescoreRun, run_id)
+            if run is None or run.status != "running":
+                # Superseded by a newer run for the same job
+                return False
+            job = db.get(JobPosting, run.job_id)
+            rows = db.execute(
+                select(Application.id, Candidate.bio, Candidate.skills, Candidate.experience, Candidate.education)
+                .join(Candidate, Application.candidate_id == Candidate.id)
+                .where(Application.job_id == run.job_id, Application.id > run.last_application_id)
+                .order_by(Application.id)
+                .limit(settings.RESCORE_CHUNK_SIZE)
+            ).all()
+
+            now = _now()
+            if rows and job is not None:
+                results = match_engine.score_candidates_for_job(rows, job)
+                # Core executemany: bumping score_version needs a SET expression,
+                # which ORM bulk update by primary key does not take
+                applications = Application.__table__
+                db.connection().execute(
+                    update(applications)
+                    .where(applications.c.id == bindparam("application_id"))
+                    .values(
+                        ai_match_score=bindparam("score"),
+                        score_status="scored",
+                        score_version=applications.c.score_version + 1,
+                    ),
+                    [
+                        {"application_id": row.id, "score": result["score"]}
+                        for row, result in zip(rows, results)
+                    ],
+                )
+                run.scored += len(rows)
+                run.last_application_id = rows[-1].id
+            run.locked_at = now
+            if job is None or len(rows) < settings.RESCORE_CHUNK_SIZE:
+                run.status = "done"
+                run.finished_at = now
+                logger.info(f"Rescore run {run_id} for job {run.job_id} finished: {run.scored} applications")
+            db.commit()
+            return run.status == "running"
+        finally:
+            db.close()
+
+    def _release(self, run_id: int) -> None:
+        """Hand an interrupted run back to the queue so it resumes promptly."""
+        db = self.session_factory()
+        try:
+            db.query(RescoreRun).filter(RescoreRun.id == run_id, RescoreRun.status == "running").update(
+                {RescoreRun.status: "queued", RescoreRun.locked_at: None}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def _fail(self, run_id: int, error: str) -> None:
+        db = self.session_factory()
+        try:
+            db.query(RescoreRun).filter(RescoreRun.id == run_id, RescoreRun.status == "running").update(
+                {RescoreRun.status: "failed", RescoreRun.last_error: error, RescoreRun.finished_at: _now()},
+                synchronize_session=False,
+            )
+            db.commit()
+        finally:
+            db.close()
+
+
+rescore_worker = RescoreWorker()
+
+
+async def main() -> None:
+    worker = RescoreWorker()
+    await worker.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,234 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.models import Application, ScoringTask
+from app.services.ai_limiter import background_priority
+from app.services.ai_service import AIService, ai_service as shared_ai_service
+
+logger = logging.getLogger(__name__)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def enqueue(db: Session, application: Application) -> ScoringTask:
+    """Queue an application for scoring in the caller's transaction.
+
+    Nothing is committed here, so the task becomes visible to workers in the
+    same commit that makes the application visible.
+    """
+    application.score_status = "scoring"
+    task = ScoringTask(application=application, status="queued", attempts=0)
+    db.add(task)
+    return task
+
+
+def enqueue_many(db: Session, application_ids: List[int]) -> int:
+    """Queue many applications for rescoring, skipping ones already queued."""
+    if not application_ids:
+        return 0
+    pending = {
+        application_id
+        for (application_id,) in db.query(ScoringTask.application_id).filter(
+            ScoringTask.application_id.in_(application_ids),
+            ScoringTask.status.in_(["queued", "running"]),
+        )
+    }
+    to_queue = [application_id for application_id in application_ids if application_id not in pending]
+    db.query(Application).filter(Application.id.in_(to_queue)).update(
+        {Application.score_status: "scoring"}, synchronize_session=False
+    )
+    db.bulk_insert_mappings(
+        ScoringTask,
+        [{"application_id": application_id, "status": "queued", "attempts": 0} for application_id in to_queue],
+    )
+    return len(to_queue)
+
+
+def task_status_query(application_id: int) -> Select:
+    """Latest scoring task for an application, usable from sync or async sessions."""
+    return (
+        select(ScoringTask)
+        .where(ScoringTask.application_id == application_id)
+        .order_by(ScoringTask.id.desc())
+        .limit(1)
+    )
+
+
+def get_task_status(db: Session, application_id: int) -> Optional[ScoringTask]:
+    return db.execute(task_status_query(application_id)).scalars().first()
+
+
+def queue_stats(db: Session) -> Dict:
+    counts = dict(db.query(ScoringTask.status, func.count(ScoringTask.id)).group_by(ScoringTask.status).all())
+    return {status: counts.get(status, 0) for status in ("queued", "running", "done", "failed", "superseded")}
+
+
+class ScoringWorker:
+    """Drains the scoring_tasks table with bounded concurrency.
+
+    Tasks are claimed in batches with ``FOR UPDATE SKIP LOCKED`` so several
+    workers (or API processes) can share the queue. A task left ``running``
+    longer than ``SCORING_LOCK_TIMEOUT_SECONDS`` is assumed to belong to a
+    crashed worker and is claimed again.
+    """
+
+    def __init__(self, session_factory=SessionLocal, ai_service: Optional[AIService] = None):
+        self.session_factory = session_factory
+        self.ai_service = ai_service or shared_ai_service
+        self.concurrency = settings.SCORING_CONCURRENCY
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self.run())
+            logger.info(f"Scoring worker started with concurrency {self.concurrency}")
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def run(self) -> None:
+        while not self._stopping:
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Scoring worker loop error: {str(e)}")
+                processed = 0
+            if not processed:
+                await asyncio.sleep(settings.SCORING_POLL_INTERVAL_SECONDS)
+
+    async def run_once(self) -> int:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        task_ids = await asyncio.to_thread(self._claim, settings.SCORING_BATCH_SIZE)
+        await asyncio.gather(*(self._process(task_id) for task_id in task_ids))
+        return len(task_ids)
+
+    def _claim(self, limit: int) -> List[int]:
+        db = self.session_factory()
+        try:
+            now = _now()
+            stale = now - timedelta(seconds=settings.SCORING_LOCK_TIMEOUT_SECONDS)
+            tasks = (
+                db.query(ScoringTask)
+                .filter(
+                    or_(
+                        (ScoringTask.status == "queued") & (ScoringTask.run_after <= now),
+                        (ScoringTask.status == "running") & (ScoringTask.locked_at < stale),
+                    )
+                )
+                .order_by(ScoringTask.run_after, ScoringTask.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            for task in tasks:
+                task.status = "running"
+                task.locked_at = now
+                task.attempts += 1
+            db.commit()
+            return [task.id for task in tasks]
+        finally:
+            db.close()
+
+    def _load(self, task_id: int) -> Tuple[int, Dict]:
+        db = self.session_factory()
+        try:
+            task = db.query(ScoringTask).filter(ScoringTask.id == task_id).one()
+            candidate = task.application.candidate
+            job = task.application.job
+            return task.application.score_version, {
+                "candidate_data": {
+                    "bio": candidate.bio,
+                    "skills": candidate.skills,
+                    "experience": candidate.experience,
+                    "education": candidate.education
+                },
+                "job_data": {
+                    "title": job.title,
+                    "description": job.description,
+                    "requirements": job.requirements
+                },
+            }
+        finally:
+            db.close()
+
+    def _complete(self, task_id: int, score: int, score_version: int) -> None:
+        db = self.session_factory()
+        try:
+            task = db.query(ScoringTask).filter(ScoringTask.id == task_id).one()
+            task.last_error = None
+            written = db.query(Application).filter(
+                Application.id == task.application_id,
+                Application.score_version == score_version,
+            ).update(
+                {
+                    Application.ai_match_score: score,
+                    Application.score_status: "scored",
+                    Application.score_version: Application.score_version + 1,
+                },
+                synchronize_session=False,
+            )
+            if written:
+                task.status = "done"
+            else:
+                # Scored again (e.g. by a rescore run) after this task read the profile
+                task.status = "superseded"
+                logger.info(f"Scoring task {task_id} discarded: application {task.application_id} has a newer score")
+            db.commit()
+        finally:
+            db.close()
+
+    def _fail(self, task_id: int, error: str) -> None:
+        db = self.session_factory()
+        try:
+            task = db.query(ScoringTask).filter(ScoringTask.id == task_id).one()
+            task.last_error = error
+            if task.attempts >= settings.SCORING_MAX_ATTEMPTS:
+                task.status = "failed"
+                task.application.score_status = "failed"
+                logger.error(f"Scoring task {task_id} failed permanently: {error}")
+            else:
+                delay = settings.SCORING_RETRY_BASE_SECONDS * 2 ** (task.attempts - 1)
+                task.status = "queued"
+                task.run_after = _now() + timedelta(seconds=delay)
+                logger.warning(f"Scoring task {task_id} failed (attempt {task.attempts}), retrying in {delay}s: {error}")
+            db.commit()
+        finally:
+            db.close()
+
+    async def _process(self, task_id: int) -> None:
+        async with self._semaphore:
+            try:
+                score_version, payload = await asyncio.to_thread(self._load, task_id)
+                with background_priority():
+                    result = await self.ai_service.match_candidate_with_job(**payload)
+                await asyncio.to_thread(self._complete, task_id, result["score"], score_version)
+            except Exception as e:
+                await asyncio.to_thread(self._fail, task_id, str(e))
+
+
+scoring_worker = ScoringWorker()
+
+
+async def main() -> None:
+    worker = ScoringWorker()
+    await worker.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+import asyncio
+import functools
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.models import Candidate
+
+logger = logging.getLogger(__name__)
+
+EMPTY = np.empty(0, dtype=np.int32)
+# Each refresh re-reads profiles changed this long before the previous one,
+# so clock skew and second-resolution timestamps cannot drop a change.
+SYNC_OVERLAP_SECONDS = 60
+
+# Spellings that refer to the same skill, mapped to one canonical name.
+SYNONYMS: Dict[str, str] = {
+    "k8s": "kubernetes",
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "py": "python",
+    "python3": "python",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "csharp": "c#",
+    "c sharp": "c#",
+    "cpp": "c++",
+    "ml": "machine learning",
+    "sklearn": "scikit-learn",
+    "scikit learn": "scikit-learn",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+    "google cloud platform": "google cloud",
+}
+
+WHITESPACE_RE = re.compile(r"\s+")
+EDGE_PUNCTUATION = " \t\n.,;:!?'\"()[]{}"
+
+
+@functools.lru_cache(maxsize=65536)
+def normalize_skill(skill: str) -> str:
+    """Case-fold, tidy and map a skill onto its canonical spelling."""
+    skill = WHITESPACE_RE.sub(" ", str(skill).casefold()).strip(EDGE_PUNCTUATION)
+    return SYNONYMS.get(skill, skill)
+
+
+def normalize_skills(skills: Optional[Iterable[str]]) -> List[str]:
+    return sorted({normalize_skill(skill) for skill in skills or []} - {""})
+
+
+class SkillIndex:
+    """Inverted index from normalized skill to a sorted array of candidate ids.
+
+    Posting lists are immutable numpy arrays that are replaced, never
+    modified, so searches only hold the lock long enough to grab them.
+    Each process builds its own copy from the candidates table on first
+    use. It then picks up profiles created or edited elsewhere every
+    ``SKILL_INDEX_REFRESH_SECONDS``, and applies this process's own edits
+    immediately through :meth:`update`.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._synced_at: Optional[datetime] = None
+        self._refreshed_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def update_many(self, rows: Sequence[Tuple[int, Optional[Iterable[str]]]]) -> None:
+        """Replace the indexed skills of each ``(candidate_id, skills)`` row."""
+        if not rows:
+            return
+        changed = np.unique(np.fromiter((candidate_id for candidate_id, _ in rows), dtype=np.int32))
+        additions: Dict[str, List[int]] = {}
+        for candidate_id, skills in rows:
+            for skill in normalize_skills(skills):
+                additions.setdefault(skill, []).append(candidate_id)
+
+        with self._write_lock:
+            postings = dict(self._postings)
+            for skill, ids in postings.items():
+                pos = np.searchsorted(ids, changed)
+                valid = pos < len(ids)
+                hits = pos[valid][ids[pos[valid]] == changed[valid]]
+                if hits.size:
+                    postings[skill] = np.delete(ids, hits)
+            for skill, ids in additions.items():
+                postings[skill] = np.union1d(postings.get(skill, EMPTY), np.asarray(ids, dtype=np.int32))
+            postings = {skill: ids for skill, ids in postings.items() if ids.size}
+            with self._lock:
+                self._postings = postings
+
+    def update(self, candidate_id: int, skills: Optional[Iterable[str]]) -> None:
+        self.update_many([(candidate_id, skills)])
+
+    def postings(self, skill: str) -> np.ndarray:
+        with self._lock:
+            return self._postings.get(normalize_skill(skill), EMPTY)
+
+    def search(self, skills: Sequence[str], match_all: bool = True) -> Tuple[np.ndarray, Dict[str, int]]:
+        """Candidate ids having all (or any) of ``skills``, plus the count per skill."""
+        with self._lock:
+            lists = {skill: self._postings.get(skill, EMPTY) for skill in normalize_skills(skills)}
+        counts = {skill: int(ids.size) for skill, ids in lists.items()}
+        if not lists:
+            return EMPTY, counts
+        ordered = sorted(lists.values(), key=len)
+        if match_all:
+            result = ordered[0]
+            for ids in ordered[1:]:
+                if not result.size:
+                    break
+                result = np.intersect1d(result, ids, assume_unique=True)
+        else:
+            result = np.unique(np.concatenate(ordered))
+        return result, counts
+
+    async def refresh(self, db: AsyncSession, force: bool = False) -> None:
+        """Load the index on first use, then fold in recent profile changes."""
+        if not force and time.monotonic() - self._refreshed_at < settings.SKILL_INDEX_REFRESH_SECONDS:
+            return
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if not force and time.monotonic() - self._refreshed_at < settings.SKILL_INDEX_REFRESH_SECONDS:
+                return
+            started = datetime.now(timezone.utc)
+            stmt = select(Candidate.id, Candidate.skills)
+            if self._synced_at is not None:
+                since = self._synced_at - timedelta(seconds=SYNC_OVERLAP_SECONDS)
+                stmt = stmt.where(or_(Candidate.created_at >= since, Candidate.updated_at >= since))
+            result = await db.execute(stmt)
+            rows = result.all()
+            self.update_many(rows)
+            if self._synced_at is None:
+                logger.info(f"Built skill index: {len(rows)} candidates, {len(self)} skills")
+            self._synced_at = started
+            self._refreshed_at = time.monotonic()
+
+
+skill_index = SkillIndex()
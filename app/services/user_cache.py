@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.models.models import User
+from app.services.ai_cache import MemoryTier
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """The fields of an authenticated user that request handlers read.
+
+    Returned by ``get_current_user`` in place of the ORM row; endpoints that
+    need to modify the user load it with ``db.get(User, current_user.id)``.
+    """
+
+    id: int
+    email: str
+    full_name: str
+    is_active: bool
+    is_employer: bool
+    is_admin: bool
+
+    @classmethod
+    def from_orm(cls, user: User) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            is_employer=user.is_employer,
+            is_admin=user.is_admin,
+        )
+
+
+class UserCache:
+    """Per-process TTL cache of authenticated users, keyed by id.
+
+    Writes through ``invalidate`` take effect at once in this process; other
+    worker processes see them once their entry expires, so
+    ``USER_CACHE_TTL_SECONDS`` bounds how long a deactivated user or revoked
+    role can linger.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self._tier = MemoryTier(max_entries, ttl_seconds)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[CurrentUser]:
+        user = self._tier.get(str(user_id))
+        if user is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return user
+
+    def set(self, user: CurrentUser) -> None:
+        self._tier.set(str(user.id), user)
+
+    def invalidate(self, user_id: int) -> None:
+        self._tier.delete(str(user_id))
+
+    def clear(self) -> None:
+        self._tier.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._tier),
+        }
+
+
+user_cache = UserCache(
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
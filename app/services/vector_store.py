@@ -0,0 +1,383 @@
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services import match_engine
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+INITIAL_CAPACITY = 1024
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64
+ASSIGN_CHUNK = 65536
+
+
+class VectorStore:
+    """Append-only float32 vector file shared between worker processes via mmap.
+
+    Rows live in ``<name>.f32`` and the database id of each row in
+    ``<name>.ids``; a small ``<name>.json`` holds the row count and, once
+    :meth:`train` has run, the inverted-file layout. Training clusters the
+    rows with spherical k-means and rewrites them grouped by cluster, so a
+    query only scans the ``nprobe`` closest clusters plus rows appended
+    since the last training run. Updates overwrite a row in place unless
+    the vector moved to another cluster, in which case the old row is
+    tombstoned (id -1) and the new one appended.
+    """
+
+    def __init__(self, directory: str, name: str, dim: int, nprobe: int):
+        self.directory = directory
+        self.name = name
+        self.dim = dim
+        self.nprobe = nprobe
+        self._lock = threading.RLock()
+        self._meta_mtime = None
+        self._meta: Dict = {}
+        self._vectors: Optional[np.memmap] = None
+        self._ids: Optional[np.memmap] = None
+        self._centroids: Optional[np.ndarray] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, suffix: str) -> str:
+        return os.path.join(self.directory, f"{self.name}.{suffix}")
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """Hold the in-process lock plus a shared or exclusive flock on the store.
+
+        Writers take it exclusively and readers shared, so no process reads
+        rows while another is rewriting them (as :meth:`train` does).
+        """
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self._path("lock"), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_lock(self):
+        return self._file_lock(exclusive=True)
+
+    def _read_lock(self):
+        return self._file_lock(exclusive=False)
+
+    def _write_meta(self) -> None:
+        tmp = self._path("json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._meta, f)
+        os.replace(tmp, self._path("json"))
+        self._meta_mtime = self._meta_signature()
+
+    def _meta_signature(self) -> Tuple[int, int, int]:
+        # os.replace gives every write a new inode, so this changes even
+        # when two writes land within one mtime tick
+        stat = os.stat(self._path("json"))
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _map(self, capacity: int) -> None:
+        for suffix, dtype, shape in (("f32", np.float32, (capacity, self.dim)), ("ids", np.int64, (capacity,))):
+            path = self._path(suffix)
+            size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            if not os.path.exists(path) or os.path.getsize(path) < size:
+                with open(path, "ab") as f:
+                    f.truncate(size)
+        self._vectors = np.memmap(self._path("f32"), dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        self._ids = np.memmap(self._path("ids"), dtype=np.int64, mode="r+", shape=(capacity,))
+
+    def _refresh(self) -> None:
+        """Pick up changes written by other processes since the last call."""
+        path = self._path("json")
+        if not os.path.exists(path):
+            if not self._meta:
+                self._meta = {"dim": self.dim, "count": 0, "capacity": INITIAL_CAPACITY, "offsets": None}
+                self._map(INITIAL_CAPACITY)
+                self._write_meta()
+            return
+        mtime = self._meta_signature()
+        if mtime == self._meta_mtime:
+            return
+        with open(path) as f:
+            meta = json.load(f)
+        if meta["dim"] != self.dim:
+            raise ValueError(
+                f"Vector store {self.name} has dim {meta['dim']}, expected {self.dim}; rebuild it"
+            )
+        if meta["capacity"] != self._meta.get("capacity") or self._vectors is None:
+            self._map(meta["capacity"])
+        if meta.get("offsets") != self._meta.get("offsets"):
+            centroids = self._path("centroids.npy")
+            self._centroids = np.load(centroids) if meta.get("offsets") else None
+        self._meta = meta
+        self._meta_mtime = mtime
+
+    def _find_row(self, item_id: int) -> Optional[int]:
+        rows = np.flatnonzero(self._ids[:self._meta["count"]] == item_id)
+        return int(rows[0]) if len(rows) else None
+
+    def __len__(self) -> int:
+        with self._read_lock():
+            self._refresh()
+            return int(np.count_nonzero(self._ids[:self._meta["count"]] >= 0))
+
+    def _cluster_of(self, vector: np.ndarray) -> int:
+        return int(np.argmax(self._centroids @ vector))
+
+    def _row_cluster(self, row: int) -> Optional[int]:
+        offsets = self._meta.get("offsets")
+        if not offsets or row >= offsets[-1]:
+            return None
+        return int(np.searchsorted(offsets, row, side="right") - 1)
+
+    def _append(self, item_id: int, vector: np.ndarray) -> None:
+        count = self._meta["count"]
+        if count >= self._meta["capacity"]:
+            self._vectors.flush()
+            self._ids.flush()
+            self._meta["capacity"] *= 2
+            self._map(self._meta["capacity"])
+        self._vectors[count] = vector
+        self._ids[count] = item_id
+        self._meta["count"] = count + 1
+
+    def upsert(self, item_id: int, vector: np.ndarray) -> None:
+        vector = np.asarray(vector, dtype=np.float32)
+        with self._write_lock():
+            self._refresh()
+            row = self._find_row(item_id)
+            if row is not None:
+                cluster = self._row_cluster(row)
+                if cluster is None or cluster == self._cluster_of(vector):
+                    self._vectors[row] = vector
+                    self._vectors.flush()
+                    return
+                self._ids[row] = -1
+            self._append(item_id, vector)
+            self._vectors.flush()
+            self._ids.flush()
+            self._write_meta()
+
+    def upsert_many(self, items: Iterable[Tuple[int, np.ndarray]]) -> int:
+        """Write many ``(id, vector)`` pairs under one lock with a single flush.
+
+        Rows are located through an id -> row map built once, rather than a
+        scan per item as :meth:`upsert` does. ``items`` may be a generator;
+        it is consumed while the write lock is held. Returns the number of
+        items written.
+        """
+        written = 0
+        with self._write_lock():
+            self._refresh()
+            count = self._meta["count"]
+            ids = np.asarray(self._ids[:count])
+            live = np.flatnonzero(ids >= 0)
+            rows = dict(zip(ids[live].tolist(), live.tolist()))
+            for item_id, vector in items:
+                vector = np.asarray(vector, dtype=np.float32)
+                row = rows.get(item_id)
+                if row is not None:
+                    cluster = self._row_cluster(row)
+                    if cluster is None or cluster == self._cluster_of(vector):
+                        self._vectors[row] = vector
+                        written += 1
+                        continue
+                    self._ids[row] = -1
+                rows[item_id] = self._meta["count"]
+                self._append(item_id, vector)
+                written += 1
+            self._vectors.flush()
+            self._ids.flush()
+            self._write_meta()
+        return written
+
+    def remove(self, item_id: int) -> None:
+        with self._write_lock():
+            self._refresh()
+            row = self._find_row(item_id)
+            if row is None:
+                return
+            self._ids[row] = -1
+            self._ids.flush()
+            self._write_meta()
+
+    def get(self, item_id: int) -> Optional[np.ndarray]:
+        with self._read_lock():
+            self._refresh()
+            row = self._find_row(item_id)
+            return None if row is None else np.array(self._vectors[row])
+
+    def _candidate_ranges(self, query: np.ndarray) -> List[Tuple[int, int]]:
+        count = self._meta["count"]
+        offsets = self._meta.get("offsets")
+        if not offsets:
+            return [(0, count)]
+        nprobe = min(self.nprobe, len(offsets) - 1)
+        probe = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        ranges = [(offsets[c], offsets[c + 1]) for c in sorted(probe)]
+        ranges.append((offsets[-1], count))
+        return ranges
+
+    def search(self, query: np.ndarray, k: int, exclude: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Return up to ``k`` ``(id, cosine similarity)`` pairs, best first."""
+        query = np.asarray(query, dtype=np.float32)
+        with self._read_lock():
+            self._refresh()
+            ids_parts, score_parts = [], []
+            for start, end in self._candidate_ranges(query):
+                if end > start:
+                    ids_parts.append(self._ids[start:end])
+                    score_parts.append(self._vectors[start:end] @ query)
+            if not score_parts:
+                return []
+            # Copy the ids out of the mapping while the read lock is held
+            ids = np.concatenate(ids_parts)
+        scores = np.concatenate(score_parts)
+        scores[ids < 0] = -np.inf
+        if exclude is not None:
+            scores[ids == exclude] = -np.inf
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(ids[i]), float(scores[i])) for i in top if np.isfinite(scores[i])]
+
+    def train(self, nlist: int, seed: int = 0) -> None:
+        """Cluster live rows and rewrite the files grouped by cluster."""
+        with self._write_lock():
+            self._refresh()
+            count = self._meta["count"]
+            live = np.flatnonzero(self._ids[:count] >= 0)
+            if len(live) < nlist * 4:
+                logger.info(f"Skipping IVF training for {self.name}: {len(live)} rows is too few")
+                return
+
+            rng = np.random.default_rng(seed)
+            sample = rng.choice(live, size=min(len(live), nlist * KMEANS_SAMPLE_PER_LIST), replace=False)
+            data = np.asarray(self._vectors[np.sort(sample)])
+            centroids = data[rng.choice(len(data), size=nlist, replace=False)].copy()
+            for _ in range(KMEANS_ITERATIONS):
+                assignment = np.argmax(data @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, assignment, data)
+                norms = np.linalg.norm(sums, axis=1, keepdims=True)
+                filled = norms[:, 0] > 0
+                centroids[filled] = sums[filled] / norms[filled]
+
+            assignment = np.empty(len(live), dtype=np.int32)
+            for start in range(0, len(live), ASSIGN_CHUNK):
+                chunk = live[start:start + ASSIGN_CHUNK]
+                assignment[start:start + ASSIGN_CHUNK] = np.argmax(self._vectors[chunk] @ centroids.T, axis=1)
+            order = np.argsort(assignment, kind="stable")
+            rows = live[order]
+
+            vectors = np.asarray(self._vectors[rows])
+            ids = np.asarray(self._ids[rows])
+            self._vectors[:len(rows)] = vectors
+            self._ids[:len(rows)] = ids
+            # Tombstone the vacated tail so no row there can match an id
+            self._ids[len(rows):count] = -1
+            self._vectors.flush()
+            self._ids.flush()
+
+            counts = np.bincount(assignment, minlength=nlist)
+            np.save(self._path("centroids.npy"), centroids)
+            self._centroids = centroids
+            self._meta["count"] = len(rows)
+            self._meta["offsets"] = [0] + np.cumsum(counts).tolist()
+            self._write_meta()
+            logger.info(f"Trained IVF layout for {self.name}: {len(rows)} rows in {nlist} lists")
+
+
+_stores: Dict[str, VectorStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(name: str) -> VectorStore:
+    with _stores_lock:
+        store = _stores.get(name)
+        if store is None:
+            store = VectorStore(
+                settings.VECTOR_STORE_PATH,
+                name,
+                dim=settings.MATCH_VECTOR_DIM,
+                nprobe=settings.VECTOR_STORE_NPROBE,
+            )
+            _stores[name] = store
+        return store
+
+
+def candidate_store() -> VectorStore:
+    return get_store("candidates")
+
+
+def job_store() -> VectorStore:
+    return get_store("jobs")
+
+
+def index_candidate(candidate: Any) -> None:
+    """Store the match vector for a candidate row; failures are logged, not raised."""
+    try:
+        candidate_store().upsert(candidate.id, match_engine.vectorize_candidate(candidate))
+    except Exception as e:
+        logger.error(f"Failed to index candidate {candidate.id}: {str(e)}")
+
+
+def index_job(job: Any) -> None:
+    """Store the match vector for an active job row and drop inactive ones."""
+    try:
+        if job.is_active is False:
+            job_store().remove(job.id)
+        else:
+            job_store().upsert(job.id, match_engine.vectorize_job(job))
+    except Exception as e:
+        logger.error(f"Failed to index job {job.id}: {str(e)}")
+
+
+def remove_job(job_id: int) -> None:
+    try:
+        job_store().remove(job_id)
+    except Exception as e:
+        logger.error(f"Failed to remove job {job_id} from index: {str(e)}")
+
+
+def rebuild(db) -> None:
+    """Re-index every candidate and active job, then train the IVF layout."""
+    from app.models.models import Candidate, JobPosting
+
+    candidate_store().upsert_many(
+        (candidate.id, match_engine.vectorize_candidate(candidate))
+        for candidate in db.query(Candidate).yield_per(1000)
+    )
+    job_store().upsert_many(
+        (job.id, match_engine.vectorize_job(job))
+        for job in db.query(JobPosting).filter(JobPosting.is_active == True).yield_per(1000)
+    )
+    for store in (candidate_store(), job_store()):
+        store.train(settings.VECTOR_STORE_NLIST)
+
+
+def main() -> None:
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        rebuild(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
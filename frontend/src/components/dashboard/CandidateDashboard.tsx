@@ -67,7 +67,7 @@ const CandidateDashboard = () => {
       try {
         // Fetch all data in parallel
         const [jobsData, applicationsData, profileData] = await Promise.all([
-          jobs.getAll(),
+          jobs.getPage().then((page) => page.items),
           applications.getCandidateApplications(),
           candidates.getMyProfile().catch(() => null)
         ]);
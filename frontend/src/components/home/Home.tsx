@@ -84,7 +84,8 @@ const Home = () => {
 
        const fetchJobs = async () => {
       try {
-        const res = await jobs.getAllJobs();
+        // The newest page is plenty for the home page
+        const { items: res } = await jobs.getAllJobsPage();
         console.log('fetched jobs', res)
         const sortedJobs = res.sort(
           (a: Job, b: Job) =>
@@ -36,14 +36,17 @@ const JobList = () => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [jobList, setJobList] = useState<Job[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [searchTerm, setSearchTerm] = useState('');
   const [locationFilter, setLocationFilter] = useState('');
 
   useEffect(() => {
     const fetchJobs = async () => {
       try {
-        const data = await jobs.getAll();
-        setJobList(data);
+        const page = await jobs.getPage();
+        setJobList(page.items);
+        setNextCursor(page.next_cursor);
         setLoading(false);
       } catch (error) {
         console.error('Error fetching jobs:', error);
@@ -55,6 +58,21 @@ const JobList = () => {
     fetchJobs();
   }, []);
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const page = await jobs.getPage(nextCursor);
+      setJobList((current) => [...current, ...page.items]);
+      setNextCursor(page.next_cursor);
+    } catch (error) {
+      console.error('Error fetching jobs:', error);
+      setError('Failed to load more jobs. Please try again later.');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const filteredJobs = jobList.filter((job) => {
     const matchesSearch = job.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
       job.description.toLowerCase().includes(searchTerm.toLowerCase());
@@ -179,7 +197,7 @@ const JobList = () => {
             </Grid>
           ))}
 
-          {filteredJobs.length === 0 && (
+          {filteredJobs.length === 0 && !nextCursor && (
             <Grid item xs={12}>
               <Alert severity="info">
                 No jobs found matching your criteria. Try adjusting your search filters.
@@ -187,6 +205,14 @@ const JobList = () => {
             </Grid>
           )}
         </Grid>
+
+        {nextCursor && (
+          <Box sx={{ display: 'flex', justifyContent: 'center', my: 4 }}>
+            <Button variant="outlined" onClick={loadMore} disabled={loadingMore}>
+              {loadingMore ? <CircularProgress size={24} /> : 'Load more jobs'}
+            </Button>
+          </Box>
+        )}
       </Container>
     </>
   );
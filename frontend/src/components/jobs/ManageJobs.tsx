@@ -38,65 +38,73 @@ const ManageJobs: React.FC = () => {
   const currentEmployerId = user?.id || null;
   const isAdmin = user?.id || false;
 
-  // Function to fetch application counts
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  // Function to fetch application counts for a page of jobs
   const fetchApplicationCounts = async (jobsData: Job[]) => {
     const applicationsCount: { [key: number]: number } = {};
-    let allApplications: Application[] = [];
+    let pageApplications: Application[] = [];
 
     for (const job of jobsData) {
       const apps = await applications.getJobApplications(job.id);
       applicationsCount[job.id] = apps.length;
-      allApplications = [...allApplications, ...apps];
+      pageApplications = [...pageApplications, ...apps];
     }
 
-    setJobApplicationsCount(applicationsCount);
-    setRecentApplications(allApplications);
+    setJobApplicationsCount((current) => ({ ...current, ...applicationsCount }));
+    setRecentApplications((current) => [...current, ...pageApplications]);
   };
 
-  useEffect(() => {
-    const fetchJobs = async () => {
-      try {
-        const storedUser = localStorage.getItem("user");
-        const user = storedUser ? JSON.parse(storedUser) : null;
-
-        if (!user) return;
-
-        let res: any[] = [];
-
-        if (user.isAdmin) {
-          res = await jobs.getAllJobs();
-        } else if (user.isEmployer) {
-          res = await jobs.getEmployerJobs(Number(user.id));
-        } else {
-          return;
-        }
-
-        const normalized = res.map((job: any) => ({
-          ...job,
-          requirements: Array.isArray(job.requirements)
-            ? job.requirements
-            : typeof job.requirements === 'string'
-            ? JSON.parse(job.requirements)
-            : [],
-        }));
-
-        const sorted = normalized
-          .filter((job: Job) => job.created_at)
-          .sort(
-            (a: Job, b: Job) =>
-              new Date(b.created_at).getTime() - new Date(a.created_at).getTime()
-          );
-
-        setJobList(sorted);
-        fetchApplicationCounts(sorted); // ← Fetch application counts here
-      } catch (error) {
-        console.error('Failed to fetch jobs:', error);
-      }
-    };
+  // One page of the signed-in user's jobs, newest first
+  const fetchJobsPage = async (cursor?: string | null) => {
+    const storedUser = localStorage.getItem("user");
+    const user = storedUser ? JSON.parse(storedUser) : null;
+
+    if (!user) return null;
 
-    fetchJobs();
+    if (user.isAdmin) {
+      return jobs.getAllJobsPage(cursor);
+    } else if (user.isEmployer) {
+      return jobs.getEmployerJobsPage(Number(user.id), cursor);
+    }
+    return null;
+  };
+
+  const loadJobs = async (cursor?: string | null) => {
+    const page = await fetchJobsPage(cursor);
+    if (!page) return;
+
+    const normalized: Job[] = page.items.map((job: any) => ({
+      ...job,
+      requirements: Array.isArray(job.requirements)
+        ? job.requirements
+        : typeof job.requirements === 'string'
+        ? JSON.parse(job.requirements)
+        : [],
+    }));
+
+    setJobList((current) => (cursor ? [...current, ...normalized] : normalized));
+    setNextCursor(page.next_cursor);
+    fetchApplicationCounts(normalized); // ← Fetch application counts here
+  };
+
+  useEffect(() => {
+    loadJobs().catch((error) => console.error('Failed to fetch jobs:', error));
   }, []);
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      await loadJobs(nextCursor);
+    } catch (error) {
+      console.error('Failed to fetch jobs:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleView = (id: number) => {
     navigate(`/jobs/${id}`);
   };
@@ -227,6 +235,14 @@ const ManageJobs: React.FC = () => {
             </Typography>
           )}
         </Grid>
+
+        {nextCursor && (
+          <Box display="flex" justifyContent="center" mt={4}>
+            <Button variant="outlined" onClick={loadMore} disabled={loadingMore}>
+              {loadingMore ? 'Loading…' : 'Load more jobs'}
+            </Button>
+          </Box>
+        )}
       </Container>
     </>
   );
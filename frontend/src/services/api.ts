@@ -20,6 +20,38 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+// List endpoints return { items, next_cursor } pages; next_cursor is null
+// on the last page.
+export interface Page<T = any> {
+  items: T[];
+  next_cursor: string | null;
+}
+
+const getPage = async (url: string, params: Record<string, any> = {}, cursor?: string | null): Promise<Page> => {
+  const response = await api.get(url, {
+    params: cursor ? { ...params, cursor } : params,
+  });
+  return response.data;
+};
+
+// Follow the cursor and return every item, but stop after maxPages pages
+// so a caller can never pull a whole table. Views that list jobs page
+// through getPage instead.
+const MAX_PAGES = 5;
+
+const getAllPages = async (url: string, params: Record<string, any> = {}, maxPages: number = MAX_PAGES) => {
+  const items: any[] = [];
+  let cursor: string | null = null;
+  let pages = 0;
+  do {
+    const page: Page = await getPage(url, params, cursor);
+    items.push(...page.items);
+    cursor = page.next_cursor;
+    pages += 1;
+  } while (cursor && pages < maxPages);
+  return items;
+};
+
 // Helper function to format error messages
 const formatErrorMessage = (error: any): string => {
   if (typeof error === 'string') return error;
@@ -189,8 +221,11 @@ export const jobs = {
   },
 
   getAll: async () => {
-    const response = await api.get('/jobs');
-    return response.data;
+    return getAllPages('/jobs');
+  },
+
+  getPage: async (cursor?: string | null) => {
+    return getPage('/jobs', {}, cursor);
   },
 
   getById: async (id: number) => {
@@ -199,12 +234,18 @@ export const jobs = {
   },
 
   getEmployerJobs: async (employerId: number) => {
-    const response = await api.get(`/jobs/employer/${employerId}`);
-    return response.data;
+    return getAllPages(`/jobs/employer/${employerId}`);
+  },
+
+  getEmployerJobsPage: async (employerId: number, cursor?: string | null) => {
+    return getPage(`/jobs/employer/${employerId}`, {}, cursor);
   },
    getAllJobs: async () => {
-    const response = await api.get("/jobs/all");
-    return response.data;
+    return getAllPages("/jobs/all");
+  },
+
+  getAllJobsPage: async (cursor?: string | null) => {
+    return getPage("/jobs/all", {}, cursor);
   },
 
   update: async (id: number, data: any) => {
@@ -236,16 +277,13 @@ export const applications = {
   },
 
   getCandidateApplications: async () => {
-    const response = await api.get('/applications/candidate');
-    return response.data;
+    return getAllPages('/applications/candidate');
   },
   getEmployerApplications: async () => {
-    const response = await api.get(`/applications/employer`);
-    return response.data;
+    return getAllPages(`/applications/employer`);
   },
   getJobApplications: async (jobId: number) => {
-    const response = await api.get(`/applications/employer/${jobId}`);
-    return response.data;
+    return getAllPages(`/applications/employer/${jobId}`);
   },
   
   updateStatus: async (applicationId: number, status: string) => {
@@ -327,8 +365,7 @@ export const blogs = {
   },
 
   getAll: async () => {
-    const response = await api.get('/blog/');
-    return response.data;
+    return getAllPages('/blog/');
   },
 
   getById: async (id: number) => {
@@ -382,8 +419,7 @@ export const blogs = {
 export const users = {
   // Fetch all users
   getAll: async () => {
-    const response = await api.get('/users');  
-    return response.data;
+    return getAllPages('/users');
   },
 
   // Fetch a user by ID
@@ -407,8 +443,7 @@ export const contractTemplates = {
   },
 
   getAll: async () => {
-    const response = await api.get('/contractTemplate/');
-    return response.data;
+    return getAllPages('/contractTemplate/');
   },
 
   getById: async (id: number) => {
@@ -0,0 +1,137 @@
+"""Requests/sec of the same list query over the sync and the async session.
+
+The "sync" route is what the endpoints did before: an ``async def`` handler
+running ``SessionLocal`` queries on the event loop. The "async" route runs
+the same query through ``AsyncSessionLocal``. While each route is under
+load, a side client pings a route that touches no database, so the report
+also shows how long unrelated requests wait behind blocked queries.
+
+    python scripts/bench_db_async.py --requests 2000 --concurrency 50
+    DATABASE_URL=postgresql://... python scripts/bench_db_async.py --no-seed
+
+Without DATABASE_URL a temporary SQLite database is created and seeded.
+SQLite queries finish in microseconds, so the gap is far wider against a
+networked Postgres.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+os.environ.setdefault("JWT_SECRET", "bench")
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import select
+
+from app.db.base_class import Base
+from app.db.session import AsyncSessionLocal, SessionLocal, engine
+from app.models.models import JobPosting, User
+
+QUERY = select(JobPosting).where(JobPosting.is_active.is_(True)).order_by(JobPosting.id.desc()).limit(20)
+
+bench = FastAPI()
+
+
+@bench.get("/sync")
+async def sync_route():
+    db = SessionLocal()
+    try:
+        return [job.title for job in db.execute(QUERY).scalars()]
+    finally:
+        db.close()
+
+
+@bench.get("/async")
+async def async_route():
+    async with AsyncSessionLocal() as db:
+        return [job.title for job in (await db.execute(QUERY)).scalars()]
+
+
+@bench.get("/ping")
+async def ping():
+    return {"ok": True}
+
+
+def seed(jobs: int) -> None:
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        employer = User(email="bench-employer@example.com", hashed_password="x", full_name="Bench", is_employer=True)
+        db.add(employer)
+        db.flush()
+        db.add_all(
+            JobPosting(
+                employer_id=employer.id,
+                title=f"Job {i}",
+                description="Benchmark posting " * 20,
+                requirements=["python", "sql"],
+                location="Remote",
+            )
+            for i in range(jobs)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def percentile(samples, fraction: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))] * 1000
+
+
+async def run(path: str, requests: int, concurrency: int):
+    latencies, pings = [], []
+    remaining = iter(range(requests))
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=bench), base_url="http://bench") as client:
+
+        async def worker():
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        async def pinger():
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/ping")
+                pings.append(time.perf_counter() - started)
+                await asyncio.sleep(0.005)
+
+        side = asyncio.create_task(pinger())
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await side
+
+    print(
+        f"{path:<7} {requests / elapsed:8.0f} req/s   p50 {percentile(latencies, 0.5):7.1f} ms   "
+        f"p99 {percentile(latencies, 0.99):7.1f} ms   ping p99 {percentile(pings, 0.99):7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--jobs", type=int, default=500, help="job postings to seed")
+    parser.add_argument("--no-seed", action="store_true", help="use the rows already in DATABASE_URL")
+    args = parser.parse_args()
+
+    if not args.no_seed:
+        seed(args.jobs)
+    for path in ("/sync", "/async"):
+        asyncio.run(run(path, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
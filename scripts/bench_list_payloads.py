@@ -0,0 +1,135 @@
+"""Payload size and latency of the list endpoints per view and fields= selection.
+
+Each URL is requested in-process (no network) ``--repeat`` times after a
+warm-up, and the body size and median latency are printed, so the full
+listings can be compared with ``view=summary`` and ``fields=``:
+
+    python scripts/bench_list_payloads.py
+    python scripts/bench_list_payloads.py "/api/v1/jobs/all?limit=50&fields=id,title"
+
+Without DATABASE_URL a temporary SQLite database is created and seeded
+with postings and applications whose text columns are realistically long.
+Requests are made as the seeded employer.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SEED = "DATABASE_URL" not in os.environ
+if SEED:
+    _tmp = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+    os.environ["VECTOR_STORE_PATH"] = os.path.join(_tmp, "vectors")
+os.environ.setdefault("JWT_SECRET", "bench")
+os.environ.setdefault("AI_BACKEND", "fake")
+for worker in ("SCORING_WORKER_ENABLED", "EMAIL_WORKER_ENABLED", "RESCORE_WORKER_ENABLED"):
+    os.environ.setdefault(worker, "false")
+
+import httpx
+
+from app.api.deps import get_current_active_user
+from app.db.base_class import Base
+from app.db.session import SessionLocal, engine
+from app.main import app
+from app.models.models import Application, Candidate, JobPosting, User
+from app.services.user_cache import CurrentUser
+
+DEFAULT_URLS = [
+    "/api/v1/jobs/all?limit=100",
+    "/api/v1/jobs/all?limit=100&fields=id,title,location",
+    "/api/v1/applications/employer?limit=100",
+    "/api/v1/applications/employer?limit=100&view=summary",
+]
+
+WORDS = "build scalable systems team python cloud ownership delivery data reliable".split()
+
+
+def seed(jobs: int, applications: int) -> None:
+    Base.metadata.create_all(engine)
+    rng = random.Random(2)
+    text = " ".join(rng.choice(WORDS) for _ in range(600))
+    db = SessionLocal()
+    try:
+        employer = User(email="bench-employer@example.com", hashed_password="x", full_name="Bench", is_employer=True)
+        db.add(employer)
+        db.flush()
+        postings = [
+            JobPosting(
+                employer_id=employer.id,
+                title=f"Job {i}",
+                description=text,
+                requirements=["python", "sql", "aws", "docker"],
+                location="Remote",
+                salary_range={"min": 90000, "max": 120000, "currency": "USD"},
+            )
+            for i in range(jobs)
+        ]
+        experience = [{"company": "Acme", "position": "Engineer", "duration": "3y", "description": text[:1500]}] * 4
+        education = [{"institution": "Uni", "degree": "BSc", "field": "CS", "year": 2015}] * 2
+        db.add_all(postings)
+        db.add_all(
+            Application(
+                job=postings[i % jobs],
+                candidate=Candidate(
+                    user=User(email=f"bench-candidate{i}@example.com", hashed_password="x", full_name=f"Candidate {i}"),
+                    bio=text[:800],
+                    skills=["python", "sql", "go"],
+                    experience=experience,
+                    education=education,
+                ),
+                status="pending",
+                ai_match_score=i % 100,
+                score_status="scored",
+            )
+            for i in range(applications)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def employer() -> CurrentUser:
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.is_employer.is_(True)).order_by(User.id).first()
+        return CurrentUser.from_orm(user)
+    finally:
+        db.close()
+
+
+async def run(urls, repeat: int) -> None:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for url in urls:
+            response = await client.get(url)
+            response.raise_for_status()
+            latencies = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                response = await client.get(url)
+                latencies.append(time.perf_counter() - started)
+            latencies.sort()
+            print(f"{url:<60} {len(response.content):>9} bytes   p50 {latencies[len(latencies) // 2] * 1000:7.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("urls", nargs="*", default=DEFAULT_URLS)
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--jobs", type=int, default=300, help="job postings to seed")
+    parser.add_argument("--applications", type=int, default=2000, help="applications to seed")
+    args = parser.parse_args()
+
+    if SEED:
+        seed(args.jobs, args.applications)
+    current = employer()
+    app.dependency_overrides[get_current_active_user] = lambda: current
+    asyncio.run(run(args.urls, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Per-row cost of serializing list pages with and without validation.
+
+For pages of job postings, applications and application summaries this
+times, per row:
+
+- validating into ``Page[schema]`` and rendering with the stdlib ``json``
+  (FastAPI's default ``JSONResponse``);
+- the same validation rendered with orjson;
+- :func:`app.api.serialization.trusted_page`, which copies the fields
+  straight off the ORM rows and renders with orjson.
+
+    python scripts/bench_serialization.py --rows 200
+
+Uses the same seeded temporary database as bench_list_payloads.py unless
+DATABASE_URL is set.
+"""
+import argparse
+import json
+import time
+
+from bench_list_payloads import SEED, seed
+
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.api.api_v1.endpoints.applications import ApplicationResponse, ApplicationSummary
+from app.api.api_v1.endpoints.jobs import JobPostingResponse
+from app.api.pagination import Page, PageParams, page
+from app.api.serialization import trusted_page
+from app.db.queries import application_summaries, application_with_details
+from app.db.session import SessionLocal
+from app.models.models import JobPosting
+
+
+def median_seconds(render, repeat: int) -> float:
+    render()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200, help="rows per page")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    if SEED:
+        seed(300, 2000)
+    db = SessionLocal()
+    cases = [
+        ("jobs", JobPostingResponse, db.execute(select(JobPosting).limit(args.rows)).scalars().all()),
+        ("applications", ApplicationResponse, db.execute(application_with_details().limit(args.rows)).scalars().unique().all()),
+        ("application summaries", ApplicationSummary, db.execute(application_summaries().limit(args.rows)).scalars().unique().all()),
+    ]
+    params = PageParams(cursor=None, limit=args.rows)
+
+    for name, schema, rows in cases:
+        adapter = TypeAdapter(Page[schema])
+
+        def validated_json():
+            content = adapter.dump_python(adapter.validate_python(page(rows, params)), mode="json")
+            return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+        def validated_orjson():
+            return orjson.dumps(adapter.dump_python(adapter.validate_python(page(rows, params)), mode="json"))
+
+        def trusted():
+            return trusted_page(schema, rows, params).body
+
+        for label, render in (("validate + json", validated_json), ("validate + orjson", validated_orjson), ("trusted_page", trusted)):
+            per_row = median_seconds(render, args.repeat) / len(rows) * 1e6
+            print(f"{name:<22} {label:<18} {per_row:8.1f} us/row")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Latency of an unrelated endpoint while a login storm runs.
+
+Start the API with the login rate limits off, or the storm is answered
+with 429s before any password is checked:
+
+    RATE_LIMIT_ENABLED=false uvicorn app.main:app
+
+and run:
+
+    python scripts/load_test_login.py http://127.0.0.1:8000 --logins 20
+
+A probe requests ``--probe-path`` at a steady pace, once on its own and
+once while ``--logins`` clients post to /auth/login in a loop. With bcrypt
+on the event loop the second run's p99 grows with every login in flight;
+with hashing on the password executor it should stay near the first.
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+
+def percentile(samples, fraction: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+async def probe(client: httpx.AsyncClient, path: str, count: int):
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.02)
+    return latencies
+
+
+async def run(args) -> None:
+    email = f"load-{uuid.uuid4().hex[:8]}@example.com"
+    password = "load-test-password"
+    async with httpx.AsyncClient(base_url=args.url, timeout=120) as client:
+        response = await client.post(
+            "/api/v1/auth/register", json={"email": email, "password": password, "full_name": "Load Test"}
+        )
+        response.raise_for_status()
+
+        logins = 0
+        stopping = False
+
+        async def storm():
+            nonlocal logins
+            while not stopping:
+                response = await client.post("/api/v1/auth/login", data={"username": email, "password": password})
+                response.raise_for_status()
+                logins += 1
+
+        for label, clients in (("idle", 0), (f"{args.logins} login loops", args.logins)):
+            logins = 0
+            stopping = False
+            tasks = [asyncio.create_task(storm()) for _ in range(clients)]
+            started = time.perf_counter()
+            latencies = await probe(client, args.probe_path, args.probes)
+            elapsed = time.perf_counter() - started
+            stopping = True
+            await asyncio.gather(*tasks)
+            print(
+                f"{label:<16} probe p50 {percentile(latencies, 0.5):7.1f} ms   p99 {percentile(latencies, 0.99):7.1f} ms   "
+                f"max {max(latencies):7.1f} ms   logins/s {logins / elapsed:6.1f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url", help="base URL of a running API")
+    parser.add_argument("--logins", type=int, default=20, help="concurrent login loops")
+    parser.add_argument("--probes", type=int, default=100)
+    parser.add_argument("--probe-path", default="/api/v1/jobs/all?limit=1")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
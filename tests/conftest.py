@@ -0,0 +1,93 @@
+import itertools
+import os
+import tempfile
+
+# Settings are read when app modules are imported, so configure them first:
+# a throwaway SQLite database, the offline AI backend and no background workers.
+_tmp = tempfile.mkdtemp(prefix="ai-recruitment-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'test.db')}"
+os.environ["VECTOR_STORE_PATH"] = os.path.join(_tmp, "vectors")
+os.environ["AI_BACKEND"] = "fake"
+os.environ.setdefault("JWT_SECRET", "test-secret")
+for worker in ("SCORING_WORKER_ENABLED", "EMAIL_WORKER_ENABLED", "RESCORE_WORKER_ENABLED"):
+    os.environ[worker] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_active_user
+from app.db.base_class import Base
+from app.db.session import SessionLocal, engine
+from app.main import app
+from app.models.models import Application, Candidate, JobPosting, User
+from app.services.user_cache import CurrentUser
+
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client(db):
+    # Not entered as a context manager, so the lifespan (workers, caches) never runs
+    return TestClient(app)
+
+
+def login(user: User) -> None:
+    """Authenticate every following request as ``user``."""
+    current = CurrentUser.from_orm(user)
+    app.dependency_overrides[get_current_active_user] = lambda: current
+
+
+@pytest.fixture
+def employer(db):
+    user = User(email="employer@example.com", hashed_password="x", full_name="Erin Employer", is_employer=True)
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def job(db, employer):
+    posting = JobPosting(
+        employer_id=employer.id,
+        title="Backend Engineer",
+        description="Build APIs in Python",
+        requirements=["python", "sql"],
+        location="Remote",
+        salary_range={"currency": "USD", "min": 90000, "max": 120000},
+    )
+    db.add(posting)
+    db.commit()
+    return posting
+
+
+_candidates = itertools.count()
+
+
+def make_applications(db, job, count: int):
+    """``count`` candidates, each with an application to ``job``."""
+    applications = []
+    for i in range(count):
+        user = User(email=f"candidate{next(_candidates)}@example.com", hashed_password="x", full_name=f"Candidate {i}")
+        candidate = Candidate(
+            user=user,
+            bio="Python developer",
+            skills=["python"],
+            experience=[{"title": "Developer", "years": 3}],
+            education=[{"degree": "BSc"}],
+        )
+        applications.append(
+            Application(job=job, candidate=candidate, status="pending", ai_match_score=50 + i % 50, score_status="scored")
+        )
+    db.add_all(applications)
+    db.commit()
+    return applications
@@ -0,0 +1,22 @@
+from app.models.models import Application, Contract, EmailOutbox
+
+from .conftest import login, make_applications
+
+
+def test_accepting_an_application_drafts_a_contract_and_queues_the_email(db, client, employer, job):
+    (application,) = make_applications(db, job, 1)
+    login(employer)
+
+    response = client.post(f"/api/v1/applications/{application.id}/status")
+
+    assert response.status_code == 200
+    db.expire_all()
+    assert db.get(Application, application.id).status == "accepted"
+    contract = db.query(Contract).filter(Contract.application_id == application.id).one()
+    assert contract.status == "draft"
+    assert contract.content
+    message = db.query(EmailOutbox).filter(EmailOutbox.application_id == application.id).one()
+    assert message.template == "contract_ready"
+    assert message.status == "queued"
+    assert message.to_email == application.candidate.user.email
+    assert message.context == {"candidate_name": "Candidate 0", "job_title": "Backend Engineer"}
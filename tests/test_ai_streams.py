@@ -0,0 +1,22 @@
+import asyncio
+
+from app.core.config import settings
+from app.services import ai_fallbacks
+from app.services.ai_service import AIService
+
+
+def test_stream_that_stalls_before_its_first_chunk_serves_the_fallback(monkeypatch):
+    monkeypatch.setattr(settings, "AI_FAKE_LATENCY_MS", 0.0)
+    monkeypatch.setattr(settings, "AI_STREAM_IDLE_SECONDS", 0.05)
+    service = AIService()
+
+    async def stalled(completion_id, model, text):
+        await asyncio.Event().wait()
+        yield
+
+    monkeypatch.setattr(service.client.chat.completions, "_stream", stalled)
+
+    async def collect():
+        return [chunk async for chunk in service.stream_contract_description("Consulting Agreement", use_cache=False)]
+
+    assert asyncio.run(collect()) == [ai_fallbacks.contract_description("Consulting Agreement")]
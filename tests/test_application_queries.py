@@ -0,0 +1,64 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.db.session import async_engine, engine
+from app.models.models import Application, JobPosting
+
+from .conftest import login, make_applications
+
+
+@contextmanager
+def count_statements():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    targets = (engine, async_engine.sync_engine)
+    for target in targets:
+        event.listen(target, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        for target in targets:
+            event.remove(target, "before_cursor_execute", record)
+
+
+def statements_for(client, url: str) -> int:
+    with count_statements() as statements:
+        response = client.get(url, params={"limit": 100})
+    assert response.status_code == 200, response.text
+    return len(statements)
+
+
+@pytest.mark.parametrize("path", ["/api/v1/applications/employer", "/api/v1/applications/employer/{job_id}"])
+def test_employer_listings_run_a_constant_number_of_statements(db, client, employer, job, path):
+    login(employer)
+    url = path.format(job_id=job.id)
+
+    make_applications(db, job, 1)
+    one = statements_for(client, url)
+    make_applications(db, job, 49)
+    fifty = statements_for(client, url)
+
+    assert len(client.get(url, params={"limit": 100}).json()["items"]) == 50
+    assert one == fifty
+
+
+def test_candidate_listing_runs_a_constant_number_of_statements(db, client, employer, job):
+    (application,) = make_applications(db, job, 1)
+    candidate_user = application.candidate.user
+    login(candidate_user)
+    url = "/api/v1/applications/candidate"
+    one = statements_for(client, url)
+
+    for i in range(49):
+        other = JobPosting(employer_id=employer.id, title=f"Job {i}", description="d", requirements=["python"], location="Remote")
+        db.add(Application(job=other, candidate=application.candidate, status="pending", ai_match_score=60, score_status="scored"))
+    db.commit()
+    fifty = statements_for(client, url)
+
+    assert len(client.get(url, params={"limit": 100}).json()["items"]) == 50
+    assert one == fifty
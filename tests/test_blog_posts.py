@@ -0,0 +1,19 @@
+from app.models.models import BlogPost
+
+
+def test_blog_posts_are_paged_newest_first(db, client, employer):
+    posts = [BlogPost(author_id=employer.id, title=f"Post {i}", content="Body") for i in range(5)]
+    db.add_all(posts)
+    db.commit()
+
+    first = client.get("/api/v1/blog/", params={"limit": 2})
+    assert first.status_code == 200
+    seen = [item["id"] for item in first.json()["items"]]
+    cursor = first.json()["next_cursor"]
+    while cursor:
+        body = client.get("/api/v1/blog/", params={"limit": 2, "cursor": cursor}).json()
+        seen += [item["id"] for item in body["items"]]
+        cursor = body["next_cursor"]
+
+    assert seen == sorted((post.id for post in posts), reverse=True)
+    assert client.get("/api/v1/blog/", params={"limit": 2}, headers={"If-None-Match": first.headers["etag"]}).status_code == 304
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.models import JobPosting
+
+
+@pytest.fixture
+def jobs(db, employer):
+    db.add_all(
+        JobPosting(employer_id=employer.id, title=f"Job {i}", description="Long description " * 40,
+                   requirements=["python"], location="Remote", salary_range={})
+        for i in range(5)
+    )
+    db.commit()
+
+
+def test_revalidating_a_compressed_response_returns_its_etag(client, jobs):
+    first = client.get("/api/v1/jobs/all", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"].endswith('-gzip"')
+
+    revalidated = client.get("/api/v1/jobs/all", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == first.headers["etag"]
+    assert revalidated.headers["vary"] == "Accept-Encoding"
+
+
+def test_revalidating_an_identity_response_returns_the_bare_etag(client, jobs):
+    first = client.get("/api/v1/jobs/all", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in first.headers
+
+    revalidated = client.get("/api/v1/jobs/all", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == first.headers["etag"]
+
+
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip"])
+def test_uncompressed_responses_vary_on_accept_encoding(client, jobs, accept_encoding):
+    large = client.get("/api/v1/jobs/all", headers={"Accept-Encoding": accept_encoding})
+    small = client.get("/api/v1/jobs/all", params={"fields": "id", "limit": 1}, headers={"Accept-Encoding": accept_encoding})
+
+    assert large.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in small.headers
+    assert small.headers["vary"] == "Accept-Encoding"
+
+
+def test_edits_within_the_same_second_change_the_etag(db, client, jobs):
+    # SQLite stores updated_at to the second; pin it so only the row version moves
+    stamp = datetime(2026, 10, 17, 12, 0, 0, tzinfo=timezone.utc)
+    posting = db.query(JobPosting).first()
+    tags = []
+    for title in ("Edited once", "Edited twice"):
+        posting.title = title
+        posting.updated_at = stamp
+        db.commit()
+        tags.append(client.get("/api/v1/jobs/all", headers={"Accept-Encoding": "identity"}).headers["etag"])
+
+    assert posting.version == 3
+    assert tags[0] != tags[1]
+    revalidated = client.get("/api/v1/jobs/all", headers={"Accept-Encoding": "identity", "If-None-Match": tags[0]})
+    assert revalidated.status_code == 200
+    assert "Edited twice" in [item["title"] for item in revalidated.json()["items"]]
@@ -0,0 +1,39 @@
+import pytest
+
+from app.services import ai_fallbacks
+from app.services.ai_service import ai_service
+
+POSTING = {
+    "title": "Data Engineer",
+    "description": "Own our data pipelines.",
+    "requirements": ["python", "airflow"],
+    "location": "Berlin",
+    "salary_range": {"min": 60000, "max": 80000, "currency": "EUR"},
+    "company_info": "A small analytics company",
+}
+
+
+@pytest.mark.parametrize(
+    "review",
+    [
+        ai_fallbacks.job_posting_review(POSTING),
+        {"feedback": "Contains discriminatory wording.", "is_compliant": False, "reviewed": True},
+    ],
+    ids=["unreviewed", "no-description-markers"],
+)
+def test_job_posting_is_saved_as_submitted(db, client, employer, monkeypatch, review):
+    async def filter_job_posting(job_posting, use_cache=True):
+        return review
+
+    monkeypatch.setattr(ai_service, "filter_job_posting", filter_job_posting)
+
+    response = client.post("/api/v1/jobs/", json={**POSTING, "employer_id": employer.id})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["description"] == POSTING["description"]
+
+
+def test_fallback_review_is_not_marked_compliant():
+    review = ai_fallbacks.job_posting_review(POSTING)
+    assert review["is_compliant"] is None
+    assert review["reviewed"] is False
@@ -0,0 +1,121 @@
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+
+from app.core.config import settings
+from app.models.models import JobPosting
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def postings(db, employer):
+    def add(title, description="", requirements=(), **fields):
+        posting = JobPosting(
+            employer_id=employer.id,
+            title=title,
+            description=description,
+            requirements=list(requirements),
+            location=fields.pop("location", "Remote"),
+            salary_range=fields.pop("salary_range", {"currency": "USD", "min": 90000, "max": 120000}),
+            **fields,
+        )
+        db.add(posting)
+        db.commit()
+        return posting
+
+    return add
+
+
+def search(client, **params):
+    response = client.get("/api/v1/jobs/search", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_title_matches_rank_above_requirements_and_description(client, postings):
+    in_description = postings("Data Analyst", description="Some kubernetes exposure is a plus")
+    in_requirements = postings("Platform Engineer", requirements=["kubernetes", "terraform"])
+    in_title = postings("Kubernetes Administrator", description="Run our clusters")
+    postings("Frontend Developer", description="React and TypeScript")
+
+    results = search(client, q="kubernetes")
+
+    assert [result["id"] for result in results] == [in_title.id, in_requirements.id, in_description.id]
+    ranks = [result["rank"] for result in results]
+    assert ranks == sorted(ranks, reverse=True)
+
+
+def test_all_words_must_match_and_query_syntax_is_ignored(client, postings):
+    both = postings("Python Engineer", description="Django services")
+    postings("Python Engineer", description="Flask services")
+
+    assert [result["id"] for result in search(client, q="python django")] == [both.id]
+    # FTS5 operators are quoted away rather than raising a syntax error
+    assert [result["id"] for result in search(client, q='(django" *')] == [both.id]
+    assert search(client, q="!!!") == []
+
+
+def test_index_follows_updates_deletes_and_active_flag(db, client, postings):
+    posting = postings("Golang Developer")
+    removed = postings("Golang Contractor")
+    inactive = postings("Golang Lead", is_active=False)
+
+    posting.title = "Rust Developer"
+    db.delete(removed)
+    db.commit()
+
+    assert search(client, q="golang") == []
+    assert [result["id"] for result in search(client, q="rust")] == [posting.id]
+    assert inactive.id not in [result["id"] for result in search(client, q="lead")]
+
+
+def test_filters(client, postings):
+    berlin = postings("Data Engineer", location="Berlin", salary_range={"currency": "eur", "min": 60000, "max": 80000})
+    remote = postings("Data Engineer", location="Remote", salary_range={"currency": "USD", "min": 100000, "max": 150000})
+
+    def ids(**filters):
+        return {result["id"] for result in search(client, q="data engineer", **filters)}
+
+    assert ids() == {berlin.id, remote.id}
+    assert ids(location="berl") == {berlin.id}
+    # Salary filters match postings whose range overlaps the requested one
+    assert ids(salary_min=90000) == {remote.id}
+    assert ids(salary_max=70000) == {berlin.id}
+    assert ids(salary_min=75000, salary_max=110000) == {berlin.id, remote.id}
+    # Currency codes match whatever case either side uses
+    assert ids(currency="EUR") == {berlin.id}
+    assert ids(currency="usd") == {remote.id}
+
+
+def test_migrations_build_the_fts_index_on_sqlite(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    monkeypatch.setattr(settings, "DATABASE_URL", url)
+    config = Config()
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+
+    command.upgrade(config, "head")
+
+    engine = sa.create_engine(url)
+    try:
+        with engine.begin() as connection:
+            connection.execute(sa.text(
+                "INSERT INTO users (email, hashed_password, is_active, is_employer) VALUES ('e@example.com', 'x', 1, 1)"
+            ))
+            connection.execute(sa.text(
+                "INSERT INTO job_postings (employer_id, title, description, is_active) "
+                "VALUES (1, 'Kubernetes Administrator', 'Run clusters', 1)"
+            ))
+            matches = connection.execute(sa.text(
+                "SELECT rowid FROM job_postings_fts WHERE job_postings_fts MATCH 'kubernetes'"
+            )).scalars().all()
+        assert matches == [1]
+
+        command.downgrade(config, "a7e4c9b25d18")
+        with engine.connect() as connection:
+            assert "job_postings_fts" not in sa.inspect(connection).get_table_names()
+    finally:
+        engine.dispose()
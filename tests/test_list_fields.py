@@ -0,0 +1,31 @@
+from .conftest import login, make_applications
+
+
+def test_fields_returns_only_the_selected_keys(client, job):
+    response = client.get("/api/v1/jobs/all", params={"fields": "title, id,title"})
+
+    assert response.status_code == 200
+    assert response.json()["items"] == [{"title": job.title, "id": job.id}]
+
+
+def test_fields_rejects_unknown_columns(client, job):
+    response = client.get("/api/v1/jobs/all", params={"fields": "id,hashed_password"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: hashed_password"
+
+
+def test_fields_rejects_an_empty_selection(client, job):
+    assert client.get("/api/v1/jobs/all", params={"fields": " , "}).status_code == 400
+
+
+def test_summary_view_leaves_out_profile_text(db, client, employer, job):
+    make_applications(db, job, 2)
+    login(employer)
+
+    full = client.get("/api/v1/applications/employer").json()["items"]
+    summary = client.get("/api/v1/applications/employer", params={"view": "summary"}).json()["items"]
+
+    assert [item["id"] for item in summary] == [item["id"] for item in full]
+    assert "bio" in full[0]["candidate"] and "bio" not in summary[0]["candidate"]
+    assert "description" in full[0]["job"] and "description" not in summary[0]["job"]
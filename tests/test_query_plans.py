@@ -0,0 +1,68 @@
+"""EXPLAIN the queries behind the hot endpoints and fail on full table scans.
+
+SQLite reports a full table scan as ``SCAN <table>`` with no index named.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.api.pagination import PageParams, encode_cursor, keyset
+from app.db.queries import application_shortlist, application_summaries, application_with_details
+from app.db.session import engine
+from app.models.models import (
+    Application,
+    BlogPost,
+    Candidate,
+    Contract,
+    ContractTemplate,
+    EmailOutbox,
+    JobPosting,
+    ScoringTask,
+    User,
+)
+
+FIRST_PAGE = PageParams(cursor=None, limit=20)
+NEXT_PAGE = PageParams(cursor=encode_cursor(datetime(2026, 1, 1, 12, 0, 0), 100), limit=20)
+
+QUERIES = {
+    "login": select(User).where(User.email == "someone@example.com"),
+    "candidate profile": select(Candidate).where(Candidate.user_id == 1),
+    "duplicate application": select(Application.id).where(Application.job_id == 1, Application.candidate_id == 1),
+    "application detail": application_with_details().where(Application.id == 1),
+    "candidate applications": keyset(application_with_details().where(Application.candidate_id == 1), Application, FIRST_PAGE),
+    "job applications": keyset(application_summaries().where(Application.job_id == 1), Application, NEXT_PAGE),
+    "employer applications": keyset(
+        application_with_details().where(
+            Application.job_id.in_(select(JobPosting.id).where(JobPosting.employer_id == 1))
+        ),
+        Application,
+        FIRST_PAGE,
+    ),
+    "shortlist": application_shortlist(1, 20, statuses=["pending"]),
+    "all jobs": keyset(select(JobPosting), JobPosting, NEXT_PAGE),
+    "active jobs": keyset(select(JobPosting).where(JobPosting.is_active == True), JobPosting, FIRST_PAGE),
+    "employer jobs": keyset(select(JobPosting).where(JobPosting.employer_id == 1), JobPosting, NEXT_PAGE),
+    "users": keyset(select(User), User, FIRST_PAGE),
+    "contract for application": select(Contract).where(Contract.application_id == 1),
+    "blog posts": keyset(select(BlogPost), BlogPost, NEXT_PAGE),
+    "blog posts by author": select(BlogPost).where(BlogPost.author_id == 1),
+    "contract templates": keyset(select(ContractTemplate), ContractTemplate, FIRST_PAGE),
+    "contract templates by author": select(ContractTemplate).where(ContractTemplate.author_id == 1),
+    "scoring task status": select(ScoringTask).where(ScoringTask.application_id == 1).order_by(ScoringTask.id.desc()),
+    "outbox for application": select(EmailOutbox).where(EmailOutbox.application_id == 1),
+}
+
+
+def query_plan(stmt):
+    compiled = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        return [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")]
+
+
+@pytest.mark.parametrize("name", QUERIES)
+def test_query_uses_indexes(db, name):
+    plan = query_plan(QUERIES[name])
+
+    scans = [step for step in plan if step.startswith("SCAN ") and " USING " not in step]
+    assert not scans, "\n".join(plan)
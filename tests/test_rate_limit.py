@@ -0,0 +1,97 @@
+import asyncio
+import math
+import threading
+
+import pytest
+
+from app.core.config import settings
+from app.services import rate_limit
+from app.services.rate_limit import MemoryBuckets, RateLimiter, Rule, SQLiteBuckets, rate_limiter
+
+# Two attempts at once, then one per second
+RULE = Rule("test", burst=2, per_minute=60.0)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def buckets(request, tmp_path):
+    if request.param == "memory":
+        return MemoryBuckets(max_keys=100)
+    return SQLiteBuckets(str(tmp_path / "buckets.db"))
+
+
+def test_empty_bucket_rejects_with_time_until_next_token(buckets, clock):
+    assert buckets.take("k", RULE) == 0.0
+    assert buckets.take("k", RULE) == 0.0
+    assert buckets.take("k", RULE) == pytest.approx(1.0)
+
+    clock.now += 0.25
+    assert buckets.take("k", RULE) == pytest.approx(0.75)
+    assert buckets.take("other", RULE) == 0.0
+
+
+def test_bucket_refills_over_time_up_to_its_burst(buckets, clock):
+    buckets.take("k", RULE)
+    buckets.take("k", RULE)
+
+    clock.now += 1.0
+    assert buckets.take("k", RULE) == 0.0
+    assert buckets.take("k", RULE) > 0
+
+    clock.now += 3600
+    assert [buckets.take("k", RULE) for _ in range(3)] == [0.0, 0.0, pytest.approx(1.0)]
+
+
+def test_reset_refills_the_bucket(clock):
+    limiter = RateLimiter(MemoryBuckets(max_keys=100))
+    limiter.hit(RULE, "k")
+    limiter.hit(RULE, "k")
+    assert limiter.hit(RULE, "k") > 0
+
+    limiter.reset(RULE, "k")
+
+    assert limiter.hit(RULE, "k") == 0.0
+    assert limiter.stats()["limited"] == {"test": 1}
+
+
+def test_login_is_rejected_with_retry_after_once_the_account_bucket_is_empty(client, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "enabled", True)
+    rate_limiter.backend.clear()
+    credentials = {"username": "nobody@example.com", "password": "wrong"}
+
+    statuses = [client.post("/api/v1/auth/login", data=credentials).status_code for _ in range(settings.LOGIN_ACCOUNT_BURST)]
+    limited = client.post("/api/v1/auth/login", data=credentials)
+
+    assert statuses == [401] * settings.LOGIN_ACCOUNT_BURST
+    assert limited.status_code == 429
+    assert limited.headers["retry-after"] == str(math.ceil(60 / settings.LOGIN_ACCOUNT_PER_MINUTE))
+    rate_limiter.backend.clear()
+
+
+def test_blocking_backend_is_taken_off_the_event_loop(tmp_path):
+    class RecordingBuckets(SQLiteBuckets):
+        def take(self, key, rule):
+            self.thread = threading.current_thread()
+            return super().take(key, rule)
+
+    limiter = RateLimiter(RecordingBuckets(str(tmp_path / "buckets.db")))
+
+    assert asyncio.run(limiter.hit_async(RULE, "k")) == 0.0
+    assert limiter.backend.thread is not threading.main_thread()
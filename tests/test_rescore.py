@@ -0,0 +1,73 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.models import Application, RescoreRun, User
+from app.services.rescore import RescoreWorker
+
+from .conftest import login, make_applications
+
+
+def test_rescore_endpoints_require_the_owning_employer(db, client, employer, job):
+    assert client.post(f"/api/v1/jobs/{job.id}/rescore").status_code == 401
+    assert client.get(f"/api/v1/jobs/{job.id}/rescore").status_code == 401
+
+    other = User(email="other@example.com", hashed_password="x", full_name="Other", is_employer=True)
+    db.add(other)
+    db.commit()
+    login(other)
+    assert client.post(f"/api/v1/jobs/{job.id}/rescore").status_code == 403
+    assert client.get(f"/api/v1/jobs/{job.id}/rescore").status_code == 403
+
+    login(employer)
+    assert client.post(f"/api/v1/jobs/{job.id}/rescore").status_code == 202
+    assert client.get(f"/api/v1/jobs/{job.id}/rescore").json()["status"] == "queued"
+
+
+def test_interrupted_run_resumes_after_its_last_committed_chunk(db, client, employer, job, monkeypatch):
+    monkeypatch.setattr(settings, "RESCORE_CHUNK_SIZE", 2)
+    applications = make_applications(db, job, 5)
+    login(employer)
+    run_id = client.post(f"/api/v1/jobs/{job.id}/rescore").json()["id"]
+
+    # The first worker commits one chunk, then dies
+    crashed = RescoreWorker(SessionLocal)
+    assert crashed._claim() == run_id
+    assert crashed._process_chunk(run_id) is True
+    run = db.get(RescoreRun, run_id)
+    assert (run.status, run.scored, run.last_application_id) == ("running", 2, applications[1].id)
+    # Mark the committed chunk so a rescore of it would show
+    for application in applications[:2]:
+        application.ai_match_score = -1
+    run.locked_at = datetime.now(timezone.utc) - timedelta(seconds=settings.RESCORE_LOCK_TIMEOUT_SECONDS + 60)
+    db.commit()
+
+    assert asyncio.run(RescoreWorker(SessionLocal).run_once()) == 1
+
+    db.expire_all()
+    run = db.get(RescoreRun, run_id)
+    assert (run.status, run.scored, run.last_application_id) == ("done", 5, applications[-1].id)
+    scores = [db.get(Application, application.id).ai_match_score for application in applications]
+    assert scores[:2] == [-1, -1]
+    assert all(score >= 0 for score in scores[2:])
+
+
+def test_newer_run_supersedes_an_older_one(db, client, employer, job, monkeypatch):
+    monkeypatch.setattr(settings, "RESCORE_CHUNK_SIZE", 2)
+    make_applications(db, job, 3)
+    login(employer)
+    older = client.post(f"/api/v1/jobs/{job.id}/rescore").json()["id"]
+    worker = RescoreWorker(SessionLocal)
+    assert worker._claim() == older
+    assert worker._process_chunk(older) is True
+
+    newer = client.post(f"/api/v1/jobs/{job.id}/rescore").json()["id"]
+
+    # The older run's worker stops at its next chunk
+    assert worker._process_chunk(older) is False
+    assert asyncio.run(worker.run_once()) == 1
+    db.expire_all()
+    assert db.get(RescoreRun, older).status == "superseded"
+    assert (db.get(RescoreRun, newer).status, db.get(RescoreRun, newer).scored) == ("done", 3)
+    assert client.get(f"/api/v1/jobs/{job.id}/rescore").json()["id"] == newer
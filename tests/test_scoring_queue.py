@@ -0,0 +1,15 @@
+from app.models.models import Application, ScoringTask
+
+from .conftest import login, make_applications
+
+
+def test_rescore_queues_each_application_once(db, client, employer, job):
+    applications = make_applications(db, job, 3)
+    login(employer)
+
+    assert client.post("/api/v1/applications/rescore").json() == {"queued": 3}
+    assert client.post("/api/v1/applications/rescore", params={"job_id": job.id}).json() == {"queued": 0}
+
+    db.expire_all()
+    assert db.query(ScoringTask).filter(ScoringTask.status == "queued").count() == 3
+    assert {db.get(Application, a.id).score_status for a in applications} == {"scoring"}
@@ -0,0 +1,79 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.api.api_v1.endpoints.applications import ApplicationResponse, ApplicationSummary
+from app.api.api_v1.endpoints.jobs import JobPostingResponse
+from app.api.pagination import Page, PageParams, keyset, page
+from app.api.serialization import trusted_page
+from app.db.queries import application_summaries, application_with_details
+from app.models.models import Application, JobPosting
+
+from .conftest import make_applications
+
+
+def validated(schema, rows, params: PageParams):
+    """The body FastAPI builds from ``response_model=Page[schema]``."""
+    adapter = TypeAdapter(Page[schema])
+    return json.loads(adapter.dump_json(adapter.validate_python(page(rows, params))))
+
+
+def test_trusted_page_matches_validated_job_page(db, employer):
+    created = datetime(2026, 3, 4, 5, 6, 7, 891011, tzinfo=timezone.utc)
+    db.add_all(
+        JobPosting(
+            employer_id=employer.id,
+            title=f"Job {i}",
+            description="Ünïcode description — with \"quotes\"",
+            requirements=["python", "sql"],
+            location="Remote",
+            salary_range={"min": 90000.5, "max": 120000, "currency": "EUR", "bands": [1, 2]},
+            created_at=created - timedelta(days=i),
+        )
+        for i in range(3)
+    )
+    db.add(JobPosting(employer_id=employer.id, title="Server timestamp", description="d", requirements=[], location="x", salary_range={}))
+    db.commit()
+    params = PageParams(cursor=None, limit=3)
+    rows = db.execute(keyset(select(JobPosting), JobPosting, params)).scalars().all()
+
+    body = json.loads(trusted_page(JobPostingResponse, rows, params).body)
+
+    assert body == validated(JobPostingResponse, rows, params)
+    assert body["next_cursor"]
+
+
+def test_trusted_page_writes_utc_datetimes_like_pydantic():
+    created = datetime(2026, 3, 4, 5, 6, 7, 891011, tzinfo=timezone.utc)
+    rows = [
+        JobPosting(
+            id=1,
+            employer_id=1,
+            title="Job",
+            description="d",
+            requirements=["python"],
+            location="Remote",
+            salary_range={"min": 1},
+            is_active=True,
+            created_at=created,
+        )
+    ]
+    params = PageParams(cursor=None, limit=1)
+
+    body = json.loads(trusted_page(JobPostingResponse, rows, params).body)
+
+    assert body == validated(JobPostingResponse, rows, params)
+    assert body["items"][0]["created_at"] == "2026-03-04T05:06:07.891011Z"
+
+
+@pytest.mark.parametrize("schema, query", [(ApplicationResponse, application_with_details), (ApplicationSummary, application_summaries)])
+def test_trusted_page_matches_validated_application_page(db, job, schema, query):
+    make_applications(db, job, 3)
+    db.expire_all()
+    params = PageParams(cursor=None, limit=2)
+    rows = db.execute(keyset(query(), Application, params)).scalars().unique().all()
+
+    assert json.loads(trusted_page(schema, rows, params).body) == validated(schema, rows, params)
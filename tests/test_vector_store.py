@@ -0,0 +1,55 @@
+import numpy as np
+
+from app.services import match_engine, vector_store
+from app.services.vector_store import VectorStore
+
+from .conftest import make_applications
+
+DIM = 16
+
+
+def unit_vectors(count: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).normal(size=(count, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_upsert_many_matches_upsert(tmp_path):
+    vectors = unit_vectors(300)
+    bulk = VectorStore(str(tmp_path / "bulk"), "items", dim=DIM, nprobe=2)
+    single = VectorStore(str(tmp_path / "single"), "items", dim=DIM, nprobe=2)
+
+    assert bulk.upsert_many((i, vector) for i, vector in enumerate(vectors)) == 300
+    for i, vector in enumerate(vectors):
+        single.upsert(i, vector)
+
+    assert len(bulk) == len(single) == 300
+    assert bulk.search(vectors[7], 5) == single.search(vectors[7], 5)
+    assert bulk.search(vectors[7], 1)[0][0] == 7
+
+
+def test_upsert_many_updates_rows_in_place_and_across_clusters(tmp_path):
+    directory = str(tmp_path)
+    vectors = unit_vectors(200)
+    store = VectorStore(directory, "items", dim=DIM, nprobe=8)
+    store.upsert_many(enumerate(vectors))
+    store.train(nlist=8)
+
+    moved = unit_vectors(20, seed=1)
+    store.upsert_many((i, moved[i]) for i in range(20))
+
+    # A second instance, as another worker process would, reads the same rows
+    reader = VectorStore(directory, "items", dim=DIM, nprobe=8)
+    assert len(reader) == 200
+    for i in range(20):
+        np.testing.assert_allclose(reader.get(i), moved[i])
+        assert reader.search(moved[i], 1)[0][0] == i
+
+
+def test_rebuild_indexes_candidates_and_active_jobs(db, job):
+    applications = make_applications(db, job, 3)
+    vector_store.rebuild(db)
+
+    candidate = applications[0].candidate
+    assert vector_store.job_store().search(match_engine.vectorize_candidate(candidate), 1)[0][0] == job.id
+    found = {item_id for item_id, _ in vector_store.candidate_store().search(match_engine.vectorize_job(job), 10)}
+    assert {application.candidate_id for application in applications} <= found